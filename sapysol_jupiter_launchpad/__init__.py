@@ -2,6 +2,22 @@
 # 
 from .distributor         import SapysolJupiterDistributor
 from .distributor_batcher import SapysolLfgProofParams, SapysolJupiterDistributorBatcher
+from .proof_client        import SapysolLfgProofClient
+from .proof_client_async  import SapysolLfgProofClientAsync, SapysolLfgProofFetcherAsync
+from .proof_cache         import SapysolLfgProofCache, SapysolNoDistributionCache, NO_DISTRIBUTION_CACHE
+from .proof_snapshot      import SapysolLfgProofSnapshot
+from .proof_store         import SapysolLfgProofStore
+from .pda_cache           import SapysolPdaCache
+from .merkle_tree         import SapysolMerkleTree, SapysolMerkleProofFile
+from .sharding            import SapysolMerkleShardPlanner, SapysolMerkleShardIndex
+from .single_flight       import SapysolSingleFlight
+from .claim_status_table  import DecodeClaimStatusTable, CLAIM_STATUS_DTYPE
+from .codec               import SapysolDistributorCodec, GetDistributorCodec
+from .claim_packer        import SapysolClaimPacker, SapysolClaimPack
+from .lookup_table        import SapysolClaimLookupTable
+from .compute_units       import SapysolComputeUnitEstimator
+from .fee_oracle          import SapysolFeeOracle, SapysolPriorityFeeOracle, SapysolStaticFeeOracle, SapysolPrioritizationFee, GetRecentPrioritizationFees, GetClientEndpoint
+from .retry_policy        import SapysolClaimRetryPolicy, SapysolClaimOutcome, SapysolBackoff
 
 # =============================================================================
 # 
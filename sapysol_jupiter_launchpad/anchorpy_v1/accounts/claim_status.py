@@ -1,6 +1,7 @@
 # ================================================================================
 #
 import typing
+import struct
 from   dataclasses              import dataclass
 from   solders.pubkey           import Pubkey
 from   solana.rpc.api           import Client
@@ -25,9 +26,9 @@ class ClaimStatusJSON(typing.TypedDict):
 
 # ================================================================================
 #
-@dataclass
+@dataclass(slots=True)
 class ClaimStatus:
-    discriminator: typing.ClassVar = b"B8'\\\xc7F) "
+    discriminator: typing.ClassVar = b"\x16\xb7\xf9\x9d\xf7_\x96`"
     layout: typing.ClassVar = borsh.CStruct(
         "claimant"                / BorshPubkey,
         "locked_amount"           / borsh.U64,
@@ -36,6 +37,8 @@ class ClaimStatus:
         "closable"                / borsh.Bool,
         "admin"                   / BorshPubkey,
     )
+    # Same fixed-size layout, unpacked in place after the discriminator
+    struct_layout: typing.ClassVar = struct.Struct("<32sQQQ?32s")
     claimant:                Pubkey
     locked_amount:           int
     locked_amount_withdrawn: int
@@ -79,13 +82,18 @@ class ClaimStatus:
     def decode(cls, data: bytes) -> "ClaimStatus":
         if data[:ACCOUNT_DISCRIMINATOR_SIZE] != cls.discriminator:
             raise AccountInvalidDiscriminator("The discriminator for this account is invalid")
-        dec = ClaimStatus.layout.parse(data[ACCOUNT_DISCRIMINATOR_SIZE:])
-        return cls(claimant                = dec.claimant,
-                   locked_amount           = dec.locked_amount,
-                   locked_amount_withdrawn = dec.locked_amount_withdrawn,
-                   unlocked_amount         = dec.unlocked_amount,
-                   closable                = dec.closable,
-                   admin                   = dec.admin)
+        (claimant,
+         locked_amount,
+         locked_amount_withdrawn,
+         unlocked_amount,
+         closable,
+         admin) = cls.struct_layout.unpack_from(data, ACCOUNT_DISCRIMINATOR_SIZE)
+        return cls(claimant                = Pubkey.from_bytes(claimant),
+                   locked_amount           = locked_amount,
+                   locked_amount_withdrawn = locked_amount_withdrawn,
+                   unlocked_amount         = unlocked_amount,
+                   closable                = closable,
+                   admin                   = Pubkey.from_bytes(admin))
 
     # ========================================
     #
@@ -1,6 +1,7 @@
 # ================================================================================
 #
 import typing
+import struct
 from   dataclasses              import dataclass
 from   solders.pubkey           import Pubkey
 from   solana.rpc.api           import Client
@@ -39,7 +40,7 @@ class MerkleDistributorJSON(typing.TypedDict):
 
 # ================================================================================
 #
-@dataclass
+@dataclass(slots=True)
 class MerkleDistributor:
     discriminator: typing.ClassVar = b"Mw\x8bFT\xf7\x0c\x1a"
     layout: typing.ClassVar = borsh.CStruct(
@@ -64,9 +65,11 @@ class MerkleDistributor:
         "buffer1"              / borsh.U8[32],
         "buffer2"              / borsh.U8[32],
     )
+    # Same fixed-size layout, unpacked in place after the discriminator
+    struct_layout: typing.ClassVar = struct.Struct("<BQ32s32s32sQQQQqqq32s32s?Q?32s32s32s")
     bump:                 int
     version:              int
-    root:                 list[int]
+    root:                 bytes
     mint:                 Pubkey
     token_vault:          Pubkey
     max_total_claim:      int
@@ -81,9 +84,9 @@ class MerkleDistributor:
     clawed_back:          bool
     enable_slot:          int
     closable:             bool
-    buffer0:              list[int]
-    buffer1:              list[int]
-    buffer2:              list[int]
+    buffer0:              bytes
+    buffer1:              bytes
+    buffer2:              bytes
 
     # ========================================
     #
@@ -121,27 +124,46 @@ class MerkleDistributor:
     def decode(cls, data: bytes) -> "MerkleDistributor":
         if data[:ACCOUNT_DISCRIMINATOR_SIZE] != cls.discriminator:
             raise AccountInvalidDiscriminator("The discriminator for this account is invalid")
-        dec = MerkleDistributor.layout.parse(data[ACCOUNT_DISCRIMINATOR_SIZE:])
-        return cls(bump                 = dec.bump,
-                   version              = dec.version,
-                   root                 = dec.root,
-                   mint                 = dec.mint,
-                   token_vault          = dec.token_vault,
-                   max_total_claim      = dec.max_total_claim,
-                   max_num_nodes        = dec.max_num_nodes,
-                   total_amount_claimed = dec.total_amount_claimed,
-                   num_nodes_claimed    = dec.num_nodes_claimed,
-                   start_ts             = dec.start_ts,
-                   end_ts               = dec.end_ts,
-                   clawback_start_ts    = dec.clawback_start_ts,
-                   clawback_receiver    = dec.clawback_receiver,
-                   admin                = dec.admin,
-                   clawed_back          = dec.clawed_back,
-                   enable_slot          = dec.enable_slot,
-                   closable             = dec.closable,
-                   buffer0              = dec.buffer0,
-                   buffer1              = dec.buffer1,
-                   buffer2              = dec.buffer2)
+        (bump,
+         version,
+         root,
+         mint,
+         token_vault,
+         max_total_claim,
+         max_num_nodes,
+         total_amount_claimed,
+         num_nodes_claimed,
+         start_ts,
+         end_ts,
+         clawback_start_ts,
+         clawback_receiver,
+         admin,
+         clawed_back,
+         enable_slot,
+         closable,
+         buffer0,
+         buffer1,
+         buffer2) = cls.struct_layout.unpack_from(data, ACCOUNT_DISCRIMINATOR_SIZE)
+        return cls(bump                 = bump,
+                   version              = version,
+                   root                 = root,
+                   mint                 = Pubkey.from_bytes(mint),
+                   token_vault          = Pubkey.from_bytes(token_vault),
+                   max_total_claim      = max_total_claim,
+                   max_num_nodes        = max_num_nodes,
+                   total_amount_claimed = total_amount_claimed,
+                   num_nodes_claimed    = num_nodes_claimed,
+                   start_ts             = start_ts,
+                   end_ts               = end_ts,
+                   clawback_start_ts    = clawback_start_ts,
+                   clawback_receiver    = Pubkey.from_bytes(clawback_receiver),
+                   admin                = Pubkey.from_bytes(admin),
+                   clawed_back          = clawed_back,
+                   enable_slot          = enable_slot,
+                   closable             = closable,
+                   buffer0              = buffer0,
+                   buffer1              = buffer1,
+                   buffer2              = buffer2)
 
     # ========================================
     #
@@ -149,7 +171,7 @@ class MerkleDistributor:
         return {
             "bump":                 self.bump,
             "version":              self.version,
-            "root":                 self.root,
+            "root":            list(self.root),
             "mint":             str(self.mint),
             "token_vault":      str(self.token_vault),
             "max_total_claim":      self.max_total_claim,
@@ -164,9 +186,9 @@ class MerkleDistributor:
             "clawed_back":          self.clawed_back,
             "enable_slot":          self.enable_slot,
             "closable":             self.closable,
-            "buffer0":              self.buffer0,
-            "buffer1":              self.buffer1,
-            "buffer2":              self.buffer2,
+            "buffer0":         list(self.buffer0),
+            "buffer1":         list(self.buffer1),
+            "buffer2":         list(self.buffer2),
         }
 
     # ========================================
@@ -175,7 +197,7 @@ class MerkleDistributor:
     def from_json(cls, obj: MerkleDistributorJSON) -> "MerkleDistributor":
         return cls(bump                 =            obj["bump"],
                    version              =            obj["version"],
-                   root                 =            obj["root"],
+                   root                 =      bytes(obj["root"]),
                    mint                 = MakePubkey(obj["mint"]),
                    token_vault          = MakePubkey(obj["token_vault"]),
                    max_total_claim      =            obj["max_total_claim"],
@@ -190,9 +212,9 @@ class MerkleDistributor:
                    clawed_back          =            obj["clawed_back"],
                    enable_slot          =            obj["enable_slot"],
                    closable             =            obj["closable"],
-                   buffer0              =            obj["buffer0"],
-                   buffer1              =            obj["buffer1"],
-                   buffer2              =            obj["buffer2"])
+                   buffer0              =      bytes(obj["buffer0"]),
+                   buffer1              =      bytes(obj["buffer1"]),
+                   buffer2              =      bytes(obj["buffer2"]))
 
 # ================================================================================
 #
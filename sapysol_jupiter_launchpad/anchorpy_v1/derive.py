@@ -1,20 +1,40 @@
 # ================================================================================
 # 
 from    solana.rpc.api        import Pubkey
+from    typing                import List
 from ..anchorpy_v1.program_id import PROGRAM_ID as DISTRIBUTOR_PROGRAM_ID
+from ..pda_cache              import CLAIM_STATUS_PDA_CACHE
 
 V2_ROOT_MERKLE_TREE = Pubkey.from_string("A8ftiUspopUk8zX1Y85mJ2Vngqte8KnesapRpdkTvSry")
 
 # =============================================================================
 # 
 def DeriveClaimStatus(walletAddress: Pubkey, distributorAddress: Pubkey):
+    return CLAIM_STATUS_PDA_CACHE.GetOrDerive(key    = (DISTRIBUTOR_PROGRAM_ID, walletAddress, distributorAddress),
+                                              derive = lambda: DeriveClaimStatusUncached(walletAddress=walletAddress, distributorAddress=distributorAddress))
+
+def DeriveClaimStatusUncached(walletAddress: Pubkey, distributorAddress: Pubkey):
     return Pubkey.find_program_address(seeds      = [bytes(b"ClaimStatus"), 
                                                      bytes(walletAddress),
                                                      bytes(distributorAddress)],
                                        program_id = DISTRIBUTOR_PROGRAM_ID)[0]
 
+# =============================================================================
+# Bulk derivation for a whole wallet list, see `SapysolPdaCache`.
+#
+def DeriveClaimStatusBatch(walletAddresses: List[Pubkey], distributorAddress: Pubkey, numProcesses: int = None) -> List[Pubkey]:
+    return CLAIM_STATUS_PDA_CACHE.DeriveClaimStatusBatch(programId          = DISTRIBUTOR_PROGRAM_ID,
+                                                         walletAddresses    = walletAddresses,
+                                                         distributorAddress = distributorAddress,
+                                                         numProcesses       = numProcesses)
+
+# =============================================================================
+# 
+def DeriveMerkleDistributor(tokenMint: Pubkey, version: int):
+    return Pubkey.find_program_address(seeds      = [bytes(b"MerkleDistributor"), 
+                                                     bytes(tokenMint),
+                                                     version.to_bytes(8, "little")],
+                                       program_id = DISTRIBUTOR_PROGRAM_ID)[0]
+
 # =============================================================================
 # 
-#def DeriveASAA():
-#    pass
-#    f.PublicKey.findProgramAddressSync([p.from("MerkleDistributor"), e.toBuffer(), p.alloc(8)], this.mdProgram.programId);
\ No newline at end of file
@@ -4,7 +4,7 @@ from .new_distributor       import new_distributor, NewDistributorArgs, NewDistr
 from .close_distributor     import close_distributor, CloseDistributorAccounts
 from .close_claim_status    import close_claim_status, CloseClaimStatusAccounts
 from .set_enable_slot       import set_enable_slot, SetEnableSlotArgs, SetEnableSlotAccounts
-from .new_claim             import new_claim, NewClaimArgs, NewClaimAccounts
+from .new_claim             import new_claim, NewClaimArgs, NewClaimAccounts, NewClaimEncoder, encode_new_claim_data
 from .claim_locked          import claim_locked, ClaimLockedAccounts
 from .clawback              import clawback, ClawbackAccounts
 from .set_clawback_receiver import set_clawback_receiver, SetClawbackReceiverAccounts
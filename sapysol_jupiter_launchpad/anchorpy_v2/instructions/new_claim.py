@@ -2,6 +2,7 @@
 #
 from __future__               import annotations
 import typing
+import struct
 from   solders.pubkey         import Pubkey
 from   solders.system_program import ID as SYS_PROGRAM_ID
 from   spl.token.constants    import TOKEN_PROGRAM_ID
@@ -15,7 +16,7 @@ from ..program_id             import PROGRAM_ID
 class NewClaimArgs(typing.TypedDict):
     amount_unlocked: int
     amount_locked:   int
-    proof:           list[list[int]]
+    proof:           typing.Union[list[list[int]], bytes, bytearray, memoryview]
 
 # ================================================================================
 #
@@ -25,6 +26,23 @@ layout = borsh.CStruct(
     "proof"           / borsh.Vec(typing.cast(Construct, borsh.U8[32])),
 )
 
+# ================================================================================
+# Fast path for compact proofs: identifier, both amounts and vector length are
+# packed by one precompiled struct, proof bytes are appended as is.
+#
+NEW_CLAIM_IDENTIFIER: bytes         = b"N\xb1b{\xd2\x15\xbbS"
+NEW_CLAIM_HEADER:     struct.Struct = struct.Struct("<8sQQI")
+
+TOKEN_PROGRAM_META: AccountMeta = AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False)
+SYS_PROGRAM_META:   AccountMeta = AccountMeta(pubkey=SYS_PROGRAM_ID,   is_signer=False, is_writable=False)
+
+def encode_new_claim_data(amount_unlocked: int,
+                          amount_locked:   int,
+                          proof:           typing.Union[bytes, bytearray, memoryview]) -> bytes:
+    if len(proof) % 32 != 0:
+        raise ValueError(f"new_claim(): proof length {len(proof)} is not a multiple of 32!")
+    return NEW_CLAIM_HEADER.pack(NEW_CLAIM_IDENTIFIER, amount_unlocked, amount_locked, len(proof) // 32) + proof
+
 # ================================================================================
 #
 class NewClaimAccounts(typing.TypedDict):
@@ -47,19 +65,54 @@ def new_claim(args:               NewClaimArgs,
         AccountMeta(pubkey=accounts["from_"],        is_signer=False, is_writable=True ),
         AccountMeta(pubkey=accounts["to"],           is_signer=False, is_writable=True ),
         AccountMeta(pubkey=accounts["claimant"],     is_signer=True,  is_writable=True ),
-        AccountMeta(pubkey=TOKEN_PROGRAM_ID,         is_signer=False, is_writable=False),
-        AccountMeta(pubkey=SYS_PROGRAM_ID,           is_signer=False, is_writable=False),
+        TOKEN_PROGRAM_META,
+        SYS_PROGRAM_META,
     ]
     if remaining_accounts is not None:
         keys += remaining_accounts
-    identifier   = b"N\xb1b{\xd2\x15\xbbS"
-    encoded_args = layout.build({
-        "amount_unlocked": args["amount_unlocked"],
-        "amount_locked":   args["amount_locked"],
-        "proof":           args["proof"],
-    })
-    data = identifier + encoded_args
+    proof = args["proof"]
+    # Compact proof (n*32 bytes) is written as is, no per-node re-encoding
+    if isinstance(proof, (bytes, bytearray, memoryview)):
+        data = encode_new_claim_data(amount_unlocked=args["amount_unlocked"], amount_locked=args["amount_locked"], proof=proof)
+    else:
+        data = NEW_CLAIM_IDENTIFIER + layout.build({
+            "amount_unlocked": args["amount_unlocked"],
+            "amount_locked":   args["amount_locked"],
+            "proof":           proof,
+        })
     return Instruction(program_id, data, keys)
 
+# ================================================================================
+# Per-distributor `new_claim` builder: AccountMetas shared by every claim of
+# one distributor (distributor, vault, token/system programs) are created once.
+#
+class NewClaimEncoder:
+    def __init__(self,
+                 distributor: Pubkey,
+                 from_:       Pubkey,
+                 program_id:  Pubkey = PROGRAM_ID):
+        self.program_id:       Pubkey      = program_id
+        self.distributor_meta: AccountMeta = AccountMeta(pubkey=distributor, is_signer=False, is_writable=True)
+        self.from_meta:        AccountMeta = AccountMeta(pubkey=from_,       is_signer=False, is_writable=True)
+
+    def build(self,
+              claim_status:    Pubkey,
+              to:              Pubkey,
+              claimant:        Pubkey,
+              amount_unlocked: int,
+              amount_locked:   int,
+              proof:           typing.Union[bytes, bytearray, memoryview]) -> Instruction:
+        keys: list[AccountMeta] = [
+            self.distributor_meta,
+            AccountMeta(pubkey=claim_status, is_signer=False, is_writable=True),
+            self.from_meta,
+            AccountMeta(pubkey=to,           is_signer=False, is_writable=True),
+            AccountMeta(pubkey=claimant,     is_signer=True,  is_writable=True),
+            TOKEN_PROGRAM_META,
+            SYS_PROGRAM_META,
+        ]
+        data = encode_new_claim_data(amount_unlocked=amount_unlocked, amount_locked=amount_locked, proof=proof)
+        return Instruction(self.program_id, data, keys)
+
 # ================================================================================
 #
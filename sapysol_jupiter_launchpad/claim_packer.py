@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing                               import Iterable, List, Tuple, Union
+from   solana.rpc.api                       import Pubkey, Keypair
+from   solders.instruction                  import Instruction
+from   solders.message                      import Message, MessageV0
+from   solders.hash                         import Hash
+from   solders.signature                    import Signature
+from   solders.transaction                  import VersionedTransaction
+from   solders.address_lookup_table_account import AddressLookupTableAccount
+from   spl.token.constants                  import ASSOCIATED_TOKEN_PROGRAM_ID
+from   sapysol                              import SapysolKeypair, MakeKeypair, ComputeBudgetIx, ComputePriceIx
+
+# =============================================================================
+# Transaction limits and per-instruction compute estimates used for packing.
+#
+MAX_TX_SIZE:         int = 1232
+MAX_COMPUTE_UNITS:   int = 1_400_000
+CLAIM_COMPUTE_UNITS: int = 60_000
+ATA_COMPUTE_UNITS:   int = 30_000
+PACK_HEADER_SIZE:    int = 2 # compute-budget instructions in front of the claims
+
+# (claimant, claim instructions without compute budget[, measured compute units])
+SapysolClaimEntry = Union[Tuple[Keypair, List[Instruction]], Tuple[Keypair, List[Instruction], int]]
+
+# =============================================================================
+# One packed transaction: fee payer signs first, then every claimant.
+#
+class SapysolClaimPack:
+    def __init__(self, feePayer: Keypair):
+        self.SIGNERS:       List[Keypair]     = [feePayer]
+        self.WALLETS:       List[Pubkey]      = []
+        self.ENTRIES:       List[Tuple[Keypair, List[Instruction], int]] = [] # (claimant, instructions, compute units)
+        self.INSTRUCTIONS:  List[Instruction] = []
+        self.COMPUTE_UNITS: int               = 0
+        self.FEE_ACCOUNTS:  List[Pubkey]      = [] # accounts priority fees are sampled for
+
+    # ========================================
+    # Instructions prefixed with one compute-budget header for the whole pack.
+    #
+    def GetInstructions(self, computePrice: int = 1) -> List[Instruction]:
+        return [ ComputeBudgetIx(units=min(self.COMPUTE_UNITS, MAX_COMPUTE_UNITS)), ComputePriceIx(computePrice) ] + self.INSTRUCTIONS
+
+    # ========================================
+    # Entry owning instruction `index` of `GetInstructions()`, `None` for the
+    # header or an unknown index.
+    #
+    def GetEntry(self, index: int) -> Union[Tuple[Keypair, List[Instruction], int], None]:
+        if index is None or index < PACK_HEADER_SIZE:
+            return None
+        index -= PACK_HEADER_SIZE
+        for entry in self.ENTRIES:
+            if index < len(entry[1]):
+                return entry
+            index -= len(entry[1])
+        return None
+
+# =============================================================================
+# Combines claims of several wallets into as few transactions as possible.
+# Claims are added greedily while the serialized transaction fits into
+# `maxTxSize` and the estimated compute fits into `maxComputeUnits`; a single
+# fee payer covers the whole pack. With `lookupTables` sizes are measured for
+# v0 transactions compiled against them.
+#
+class SapysolClaimPacker:
+    def __init__(self,
+                 feePayer:          SapysolKeypair,
+                 maxTxSize:         int = MAX_TX_SIZE,
+                 maxComputeUnits:   int = MAX_COMPUTE_UNITS,
+                 claimComputeUnits: int = CLAIM_COMPUTE_UNITS,
+                 ataComputeUnits:   int = ATA_COMPUTE_UNITS,
+                 maxClaimsPerTx:    int = None,
+                 lookupTables:      List[AddressLookupTableAccount] = None):
+
+        self.FEE_PAYER:           Keypair = MakeKeypair(feePayer)
+        self.MAX_TX_SIZE:         int     = maxTxSize
+        self.MAX_COMPUTE_UNITS:   int     = maxComputeUnits
+        self.CLAIM_COMPUTE_UNITS: int     = claimComputeUnits
+        self.ATA_COMPUTE_UNITS:   int     = ataComputeUnits
+        self.MAX_CLAIMS_PER_TX:   int     = maxClaimsPerTx
+        self.LOOKUP_TABLES:       List[AddressLookupTableAccount] = lookupTables if lookupTables else []
+
+    # ========================================
+    #
+    def GetComputeUnits(self, instructions: List[Instruction]) -> int:
+        return sum(self.ATA_COMPUTE_UNITS if ix.program_id == ASSOCIATED_TOKEN_PROGRAM_ID else self.CLAIM_COMPUTE_UNITS for ix in instructions)
+
+    # Signatures (shortvec count + 64 each) plus the compiled message
+    def GetTxSize(self, instructions: List[Instruction]) -> int:
+        if self.LOOKUP_TABLES:
+            message = MessageV0.try_compile(self.FEE_PAYER.pubkey(), instructions, self.LOOKUP_TABLES, Hash.default())
+            return len(bytes(VersionedTransaction.populate(message, [Signature.default()] * message.header.num_required_signatures)))
+        message = Message.new_with_blockhash(instructions, self.FEE_PAYER.pubkey(), Hash.default())
+        return 1 + 64 * message.header.num_required_signatures + len(bytes(message))
+
+    # ========================================
+    #
+    def __Fits(self, pack: SapysolClaimPack, instructions: List[Instruction], computeUnits: int) -> bool:
+        if self.MAX_CLAIMS_PER_TX and len(pack.WALLETS) >= self.MAX_CLAIMS_PER_TX:
+            return False
+        if pack.COMPUTE_UNITS + computeUnits > self.MAX_COMPUTE_UNITS:
+            return False
+        # Header size does not depend on the values, so the max is used
+        header = [ ComputeBudgetIx(units=MAX_COMPUTE_UNITS), ComputePriceIx(1) ]
+        return self.GetTxSize(header + pack.INSTRUCTIONS + instructions) <= self.MAX_TX_SIZE
+
+    # ========================================
+    # A claim that does not fit even alone still gets its own pack.
+    #
+    def Pack(self, entries: Iterable[SapysolClaimEntry]) -> List[SapysolClaimPack]:
+        result: List[SapysolClaimPack] = []
+        pack:   SapysolClaimPack       = SapysolClaimPack(feePayer=self.FEE_PAYER)
+        for entry in entries:
+            wallet, instructions = entry[0], entry[1]
+            # Simulated units are used when given, estimates otherwise
+            computeUnits = entry[2] if len(entry) > 2 and entry[2] else self.GetComputeUnits(instructions)
+            if pack.WALLETS and not self.__Fits(pack=pack, instructions=instructions, computeUnits=computeUnits):
+                result.append(pack)
+                pack = SapysolClaimPack(feePayer=self.FEE_PAYER)
+
+            pack.WALLETS.append(wallet.pubkey())
+            pack.ENTRIES.append((wallet, instructions, computeUnits))
+            pack.INSTRUCTIONS  += instructions
+            pack.COMPUTE_UNITS += computeUnits
+            if wallet.pubkey() != self.FEE_PAYER.pubkey():
+                pack.SIGNERS.append(wallet)
+
+        if pack.WALLETS:
+            result.append(pack)
+        return result
+
+# =============================================================================
+#
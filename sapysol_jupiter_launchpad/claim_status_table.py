@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing                 import Iterable, List, Union
+from   solana.rpc.api         import Pubkey
+from   solders.account        import Account
+from  .anchorpy_v2.accounts   import ClaimStatus
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# =============================================================================
+# Raw ClaimStatus account (v1 and v2 share the layout) as a packed numpy
+# structured dtype, discriminator included.
+#
+CLAIM_STATUS_DTYPE = None if np is None else np.dtype([
+    ("discriminator",           "S8"),
+    ("claimant",                np.uint8, 32),
+    ("locked_amount",           "<u8"),
+    ("locked_amount_withdrawn", "<u8"),
+    ("unlocked_amount",         "<u8"),
+    ("closable",                "?"),
+    ("admin",                   np.uint8, 32),
+])
+
+# =============================================================================
+# Struct-of-arrays decoder for many ClaimStatus buffers: one `numpy.frombuffer`
+# over all of them, no per-account objects. Columns are accessed by name,
+# e.g. `table["unlocked_amount"].sum()`; `claimant`/`admin` are (n, 32) uint8.
+# `buffers` may hold raw account data or `Account` objects.
+#
+def DecodeClaimStatusTable(buffers: Iterable[Union[bytes, bytearray, memoryview, Account]]):
+    if np is None:
+        raise ImportError("DecodeClaimStatusTable(): `numpy` is required, install it with `pip install numpy`!")
+
+    size:   int              = CLAIM_STATUS_DTYPE.itemsize
+    chunks: List[memoryview] = []
+    for index, buffer in enumerate(buffers):
+        data = memoryview(buffer.data if isinstance(buffer, Account) else buffer)
+        if data.nbytes < size:
+            raise ValueError(f"DecodeClaimStatusTable(): buffer {index} has {data.nbytes} bytes, every buffer must be at least {size} bytes!")
+        chunks.append(data.cast("B")[:size])
+    raw: bytes = b"".join(chunks)
+
+    table = np.frombuffer(raw, dtype=CLAIM_STATUS_DTYPE)
+    if not (table["discriminator"] == ClaimStatus.discriminator).all():
+        raise ValueError("DecodeClaimStatusTable(): not all buffers are ClaimStatus accounts!")
+    return table
+
+# =============================================================================
+#
+def GetTablePubkey(column, index: int) -> Pubkey:
+    return Pubkey.from_bytes(column[index].tobytes())
+
+# =============================================================================
+#
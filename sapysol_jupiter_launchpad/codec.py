@@ -0,0 +1,194 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing             import Any, Callable, Dict, List, Literal, Tuple, Union
+from   solana.rpc.api     import Pubkey
+import hashlib
+import struct
+import json
+import re
+import os
+
+# =============================================================================
+# IDL scalar types -> struct format characters (borsh is little-endian, packed)
+#
+IDL_STRUCT_FORMATS: Dict[str, str] = {
+    "u8":        "B",
+    "i8":        "b",
+    "u16":       "H",
+    "i16":       "h",
+    "u32":       "I",
+    "i32":       "i",
+    "u64":       "Q",
+    "i64":       "q",
+    "bool":      "?",
+    "publicKey": "32s",
+}
+
+# =============================================================================
+#
+def _SnakeCase(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+def _PascalCase(name: str) -> str:
+    return name[0].upper() + name[1:]
+
+def _FieldFormat(fieldType: Union[str, Dict[str, Any]]) -> str:
+    if isinstance(fieldType, str) and fieldType in IDL_STRUCT_FORMATS:
+        return IDL_STRUCT_FORMATS[fieldType]
+    if isinstance(fieldType, dict) and "array" in fieldType and fieldType["array"][0] == "u8":
+        return f"{fieldType['array'][1]}s"
+    raise ValueError(f"SapysolDistributorCodec: unsupported IDL type {fieldType}!")
+
+def _VecElementSize(fieldType: Union[str, Dict[str, Any]]) -> Union[int, None]:
+    if isinstance(fieldType, dict) and "vec" in fieldType:
+        element = fieldType["vec"]
+        if isinstance(element, dict) and "array" in element and element["array"][0] == "u8":
+            return element["array"][1]
+        raise ValueError(f"SapysolDistributorCodec: unsupported IDL vec type {fieldType}!")
+    return None
+
+# Vec of byte arrays may come as one n*size blob or as a list of arrays
+def _PackVec(value: Any, size: int) -> bytes:
+    raw = bytes(value) if isinstance(value, (bytes, bytearray, memoryview)) else b"".join(bytes(v) for v in value)
+    if len(raw) % size != 0:
+        raise ValueError(f"SapysolDistributorCodec: vec length {len(raw)} is not a multiple of {size}!")
+    return raw
+
+# =============================================================================
+# Codec compiler for the merkle distributor IDL.
+#
+# Every instruction and account in `idls/merkle_distributor_idl_<version>.json`
+# gets its own generated Python function with a precompiled `struct.Struct`
+# (no generic `borsh_construct` walk):
+#   encode_<instruction>(**args) -> bytes        (discriminator included)
+#   decode_<instruction>(data)   -> dict
+#   encode_<account>(**fields)   -> bytes        (discriminator included)
+#   decode_<account>(data)       -> dict
+# Functions are available as attributes, generated source is kept in `SOURCE`.
+# Byte-array fields are returned as `bytes` (same as the account models),
+# pubkeys as `Pubkey`, vecs of byte arrays as one compact bytes blob (same as
+# proofs everywhere else). Encoders take byte arrays as `bytes` or `list[int]`.
+#
+class SapysolDistributorCodec:
+    def __init__(self, version: Literal["v1", "v2"] = "v2", idlPath: str = None):
+        _idlPath = idlPath if idlPath else os.path.join(os.path.dirname(__file__), "idls", f"merkle_distributor_idl_{version}.json")
+        with open(_idlPath, "r") as f:
+            self.IDL: Dict[str, Any] = json.load(f)
+
+        self.VERSION:      Literal["v1", "v2"]             = version
+        self.SOURCE:       str                             = ""
+        self.INSTRUCTIONS: Dict[bytes, str]                = {} # discriminator -> instruction name
+        self.ACCOUNTS:     Dict[bytes, str]                = {} # discriminator -> account name
+        self.FUNCTIONS:    Dict[str, Callable[..., Any]]   = {}
+        self.__Compile()
+
+    # ========================================
+    #
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        functions = self.__dict__.get("FUNCTIONS", {})
+        if name in functions:
+            return functions[name]
+        raise AttributeError(f"SapysolDistributorCodec: no `{name}` in {self.VERSION} codec!")
+
+    # ========================================
+    #
+    @staticmethod
+    def __GenerateCodec(name: str, discriminator: bytes, fields: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        names:   List[str] = [ _SnakeCase(f["name"]) for f in fields ]
+        formats: List[str] = []
+        vec:     Tuple[str, int] = None
+        for field, fieldName in zip(fields, names):
+            size = _VecElementSize(field["type"])
+            if size is not None:
+                if field is not fields[-1]:
+                    raise ValueError(f"SapysolDistributorCodec: `{name}` has vec field `{fieldName}` that is not the last one!")
+                vec = (fieldName, size)
+                formats.append("I")
+            else:
+                formats.append(_FieldFormat(field["type"]))
+
+        layout = struct.Struct("<8s" + "".join(formats))
+        consts = { f"_S_{name}": layout, f"_D_{name}": discriminator }
+        fixed  = names[:-1] if vec else names
+
+        # Encoder
+        packed: List[str] = []
+        for fieldName, fmt in zip(fixed, formats):
+            packed.append(f"bytes({fieldName})" if fmt.endswith("s") else fieldName)
+        src  = f"def encode_{name}({', '.join(names)}):\n"
+        if vec:
+            src += f"    {vec[0]} = _PackVec({vec[0]}, {vec[1]})\n"
+            packed.append(f"len({vec[0]}) // {vec[1]}")
+            src += f"    return _S_{name}.pack(_D_{name}, {', '.join(packed)}) + {vec[0]}\n\n"
+        else:
+            src += f"    return _S_{name}.pack(_D_{name}{''.join(', ' + p for p in packed)})\n\n"
+
+        # Decoder
+        unpacked: List[str] = [ "_" ] + fixed + ([ f"_{vec[0]}_len" ] if vec else [])
+        src += f"def decode_{name}(data):\n"
+        src += f"    if data[:8] != _D_{name}:\n"
+        src += f"        raise ValueError(\"decode_{name}(): invalid discriminator!\")\n"
+        src += f"    ({', '.join(unpacked)},) = _S_{name}.unpack_from(data, 0)\n"
+        values: List[str] = []
+        for field, fieldName, fmt in zip(fields, fixed, formats):
+            if field["type"] == "publicKey":
+                values.append(f"\"{fieldName}\": Pubkey.from_bytes({fieldName})")
+            else:
+                values.append(f"\"{fieldName}\": {fieldName}")
+        if vec:
+            src += f"    _end = _S_{name}.size + _{vec[0]}_len * {vec[1]}\n"
+            values.append(f"\"{vec[0]}\": bytes(data[_S_{name}.size:_end])")
+        src += f"    return {{{', '.join(values)}}}\n\n"
+        return src, consts
+
+    # ========================================
+    #
+    def __Compile(self) -> None:
+        namespace: Dict[str, Any] = { "Pubkey": Pubkey, "_PackVec": _PackVec }
+        sources:   List[str]      = []
+        for ix in self.IDL["instructions"]:
+            name          = _SnakeCase(ix["name"])
+            discriminator = hashlib.sha256(f"global:{name}".encode()).digest()[:8]
+            src, consts   = SapysolDistributorCodec.__GenerateCodec(name=name, discriminator=discriminator, fields=ix["args"])
+            self.INSTRUCTIONS[discriminator] = name
+            namespace.update(consts)
+            sources.append(src)
+        for account in self.IDL["accounts"]:
+            name          = _SnakeCase(account["name"])
+            discriminator = hashlib.sha256(f"account:{_PascalCase(account['name'])}".encode()).digest()[:8]
+            src, consts   = SapysolDistributorCodec.__GenerateCodec(name=name, discriminator=discriminator, fields=account["type"]["fields"])
+            self.ACCOUNTS[discriminator] = name
+            namespace.update(consts)
+            sources.append(src)
+
+        self.SOURCE = "".join(sources)
+        exec(compile(self.SOURCE, f"<codec_{self.VERSION}>", "exec"), namespace)
+        self.FUNCTIONS = { k: v for k, v in namespace.items() if k.startswith(("encode_", "decode_")) }
+
+    # ========================================
+    # Dispatch by discriminator, returns (name, decoded fields).
+    #
+    def DecodeInstruction(self, data: bytes) -> Tuple[str, Dict[str, Any]]:
+        name = self.INSTRUCTIONS.get(bytes(data[:8]))
+        if name is None:
+            raise ValueError("SapysolDistributorCodec: unknown instruction discriminator!")
+        return name, self.FUNCTIONS[f"decode_{name}"](data)
+
+    def DecodeAccount(self, data: bytes) -> Tuple[str, Dict[str, Any]]:
+        name = self.ACCOUNTS.get(bytes(data[:8]))
+        if name is None:
+            raise ValueError("SapysolDistributorCodec: unknown account discriminator!")
+        return name, self.FUNCTIONS[f"decode_{name}"](data)
+
+# =============================================================================
+#
+__CODECS: Dict[str, SapysolDistributorCodec] = {}
+
+def GetDistributorCodec(version: Literal["v1", "v2"]) -> SapysolDistributorCodec:
+    if version not in __CODECS:
+        __CODECS[version] = SapysolDistributorCodec(version=version)
+    return __CODECS[version]
+
+# =============================================================================
+#
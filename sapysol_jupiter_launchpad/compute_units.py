@@ -0,0 +1,89 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing              import Callable, Dict, List, Tuple
+from   solana.rpc.api      import Client, Pubkey, Keypair
+from   solders.instruction import Instruction
+from   sapysol             import *
+from  .single_flight       import SapysolSingleFlight
+from  .claim_packer        import CLAIM_COMPUTE_UNITS, ATA_COMPUTE_UNITS
+import threading
+import math
+import time
+
+SapysolComputeUnitsKey = Tuple[Pubkey, int, bool] # (distributor, proof depth, ATA needed)
+
+# =============================================================================
+# Compute unit limits measured by simulation.
+#
+# Claims of one distributor with the same proof depth and the same need for an
+# ATA creation consume (nearly) the same compute, so one representative claim
+# per class is simulated and the result plus `headroom` is reused for every
+# similar claim.
+# A claim that fails in simulation (e.g. claiming is not started yet) gets the
+# packer's static estimate for its class instead; the failure is remembered
+# for `retryAfter` seconds, so the class is not simulated again per wallet.
+#
+class SapysolComputeUnitEstimator:
+    def __init__(self,
+                 connection:  Client,
+                 headroom:    float = 0.1,
+                 minHeadroom: int   = 2_000,
+                 maxUnits:    int   = 1_400_000,
+                 retryAfter:  float = 30.0):
+
+        self.CONNECTION:   Client              = connection
+        self.HEADROOM:     float               = headroom
+        self.MIN_HEADROOM: int                 = minHeadroom
+        self.MAX_UNITS:    int                 = maxUnits
+        self.RETRY_AFTER:  float               = retryAfter
+        self.FLIGHT:       SapysolSingleFlight = SapysolSingleFlight(memoize=True)
+        self.LOCK:         threading.Lock      = threading.Lock()
+        self.FAILED:       Dict[SapysolComputeUnitsKey, float] = {} # key -> monotonic time of the next simulation
+
+    # ========================================
+    # Simulates `instructions` (without compute budget) under the max limit,
+    # returns consumed units.
+    #
+    def Simulate(self, payer: Keypair, instructions: List[Instruction]) -> int:
+        tx: SapysolTx = SapysolTx(connection=self.CONNECTION, payer=payer)
+        tx.FromInstructionsLegacy(instructions=[ ComputeBudgetIx(units=self.MAX_UNITS), ComputePriceIx(1) ] + instructions)
+        result = self.CONNECTION.simulate_transaction(txn=tx.Sign([payer]).RAW_TX).value
+        if result.err is not None or not result.units_consumed:
+            raise ValueError(f"SapysolComputeUnitEstimator: simulation failed: {result.err}!")
+        return result.units_consumed
+
+    # ========================================
+    # Static estimate of a claim class, same as `SapysolClaimPacker` uses.
+    #
+    def GetStaticUnits(self, key: SapysolComputeUnitsKey) -> int:
+        _, _, ataNeeded = key
+        return min(self.MAX_UNITS, CLAIM_COMPUTE_UNITS + (ATA_COMPUTE_UNITS if ataNeeded else 0))
+
+    def IsMeasured(self, key: SapysolComputeUnitsKey) -> bool:
+        return key in self.FLIGHT
+
+    # ========================================
+    # Measured units of the class, or its static estimate while simulations
+    # fail. RPC errors of the simulation itself are raised.
+    #
+    def GetUnits(self,
+                 key:          SapysolComputeUnitsKey,
+                 payer:        Keypair,
+                 instructions: Callable[[], List[Instruction]]) -> int:
+        with self.LOCK:
+            if time.monotonic() < self.FAILED.get(key, 0):
+                return self.GetStaticUnits(key=key)
+
+        def _Measure() -> int:
+            consumed = self.Simulate(payer=payer, instructions=instructions())
+            return min(self.MAX_UNITS, consumed + max(self.MIN_HEADROOM, math.ceil(consumed * self.HEADROOM)))
+        try:
+            return self.FLIGHT.Do(key=key, func=_Measure)
+        except ValueError: # simulated and failed
+            with self.LOCK:
+                self.FAILED[key] = time.monotonic() + self.RETRY_AFTER
+            return self.GetStaticUnits(key=key)
+
+# =============================================================================
+#
@@ -1,6 +1,8 @@
 #!/usr/bin/python
 # =============================================================================
 # 
+from typing                     import Tuple, Optional, Union
+from concurrent.futures         import ThreadPoolExecutor
 from solana.rpc.api             import Client, Pubkey, Keypair
 from solders.instruction        import Instruction
 from sapysol                    import *
@@ -10,22 +12,26 @@ from .anchorpy_v1.program_id    import PROGRAM_ID as PROGRAM_ID_V1
 from .anchorpy_v2.program_id    import PROGRAM_ID as PROGRAM_ID_V2
 from .anchorpy_v1.accounts      import ClaimStatus as ClaimStatus_v1, MerkleDistributor as MerkleDistributor_v1
 from .anchorpy_v2.accounts      import ClaimStatus as ClaimStatus_v2, MerkleDistributor as MerkleDistributor_v2
-from .anchorpy_v1.instructions  import new_claim, NewClaimArgs, NewClaimAccounts
-from .anchorpy_v1.derive        import DeriveClaimStatus as DeriveClaimStatus_v1
-from .anchorpy_v2.derive        import DeriveClaimStatus as DeriveClaimStatus_v2
+from .anchorpy_v1.instructions  import NewClaimEncoder as NewClaimEncoder_v1
+from .anchorpy_v2.instructions  import NewClaimEncoder as NewClaimEncoder_v2
+from .anchorpy_v1.derive        import DeriveClaimStatus as DeriveClaimStatus_v1, DeriveClaimStatusBatch as DeriveClaimStatusBatch_v1
+from .anchorpy_v2.derive        import DeriveClaimStatus as DeriveClaimStatus_v2, DeriveClaimStatusBatch as DeriveClaimStatusBatch_v2
+from .merkle                    import VerifyClaim, VerifyClaimsBulk, SapysolMerkleProof, PackProof
 
 # =============================================================================
 # 
 class SapysolJupiterDistributor:
     def __init__(self,
                  connection:         Client,
-                 distributorAddress: SapysolPubkey):
+                 distributorAddress: SapysolPubkey,
+                 account:            Account = None):
 
         self.CONNECTION:  Client              = connection
         self.PUBKEY:      Pubkey              = MakePubkey(distributorAddress)
         self.VERSION:     Literal["v1", "v2"] = None
         self.DISTRIBUTOR: Union[MerkleDistributor_v1, MerkleDistributor_v2] = None 
-        account = FetchAccount(connection=connection, pubkey=self.PUBKEY)
+        if account is None:
+            account = FetchAccount(connection=connection, pubkey=self.PUBKEY)
         if account is None:
             raise ValueError(f"SapysolJupiterDistributor: {str(self.PUBKEY)} is an empty account!")
 
@@ -36,12 +42,42 @@ class SapysolJupiterDistributor:
             self.DISTRIBUTOR: MerkleDistributor_v2 = MerkleDistributor_v2.decode(data=account.data) 
             self.VERSION = "v2"
 
+        # `new_claim` of the distributor's own program, shared AccountMetas are built once
+        self.CLAIM_ENCODER: Union[NewClaimEncoder_v1, NewClaimEncoder_v2] = None
+        if self.VERSION:
+            encoder = NewClaimEncoder_v1 if self.VERSION == "v1" else NewClaimEncoder_v2
+            self.CLAIM_ENCODER = encoder(distributor=self.PUBKEY, from_=self.DISTRIBUTOR.token_vault)
+
+    # ========================================
+    # Builds many distributors from chunked `getMultipleAccounts` instead of
+    # one `FetchAccount` per instance; result keeps input order.
+    #
+    @classmethod
+    def FromAddresses(cls,
+                      connection:           Client,
+                      distributorAddresses: List[SapysolPubkey],
+                      chunkSize:            int = 100) -> List["SapysolJupiterDistributor"]:
+        pubkeys:  List[Pubkey]  = [ MakePubkey(address) for address in distributorAddresses ]
+        accounts: List[Account] = FetchAccounts(connection=connection, pubkeys=pubkeys, chunkSize=chunkSize)
+        for pubkey, account in zip(pubkeys, accounts):
+            if account is None:
+                raise ValueError(f"SapysolJupiterDistributor: {str(pubkey)} is an empty account!")
+        return [ cls(connection=connection, distributorAddress=pubkey, account=account) for pubkey, account in zip(pubkeys, accounts) ]
+
     # ========================================
     #
     def GetClaimStatusAddress(self, walletAddress: SapysolPubkey) -> Pubkey:
         func = DeriveClaimStatus_v1 if self.VERSION == "v1" else DeriveClaimStatus_v2
         return func(walletAddress=MakePubkey(walletAddress), distributorAddress=self.PUBKEY)
 
+    # ========================================
+    # Bulk version of `GetClaimStatusAddress`, derived in a process pool
+    # and memoized (see `SapysolPdaCache`).
+    #
+    def GetClaimStatusAddresses(self, walletAddresses: List[SapysolPubkey], numProcesses: int = None) -> List[Pubkey]:
+        func = DeriveClaimStatusBatch_v1 if self.VERSION == "v1" else DeriveClaimStatusBatch_v2
+        return func(walletAddresses=[MakePubkey(w) for w in walletAddresses], distributorAddress=self.PUBKEY, numProcesses=numProcesses)
+
     # ========================================
     #
     def GetClaimStatus(self, walletAddress: SapysolPubkey) -> Union[ClaimStatus_v1, ClaimStatus_v1]:
@@ -50,29 +86,103 @@ class SapysolJupiterDistributor:
                ClaimStatus_v2.fetch(conn=self.CONNECTION, address=address)
 
     # ========================================
+    # Bulk version of `GetClaimStatus`: PDAs are derived in bulk and fetched
+    # `chunkSize` (max 100) per `getMultipleAccounts`, chunks run concurrently.
+    # Result keeps input order, `None` means not claimed yet.
+    #
+    def GetClaimStatusMultiple(self,
+                               walletAddresses: List[SapysolPubkey],
+                               chunkSize:       int = 100,
+                               numThreads:      int = 8) -> List[Optional[Union[ClaimStatus_v1, ClaimStatus_v2]]]:
+        addresses: List[Pubkey] = self.GetClaimStatusAddresses(walletAddresses=walletAddresses)
+        cls = ClaimStatus_v1 if self.VERSION == "v1" else ClaimStatus_v2
+        with ThreadPoolExecutor(max_workers=max(1, numThreads)) as executor:
+            chunks = executor.map(lambda chunk: cls.fetch_multiple(conn=self.CONNECTION, addresses=chunk),
+                                  ListToChunks(baseList=addresses, chunkSize=chunkSize))
+            return [ status for chunk in chunks for status in chunk ]
+
+    # ========================================
+    # Local check of `proof` against `DISTRIBUTOR.root`, same as on-chain
+    # `new_claim` does; invalid proof would fail with `InvalidProof` (6002).
+    # `amount` is the unlocked amount.
+    #
+    def VerifyClaim(self,
+                    walletAddress: SapysolPubkey,
+                    amount:        int,
+                    proof:         SapysolMerkleProof,
+                    amountLocked:  int = 0) -> bool:
+        return VerifyClaim(root           = self.DISTRIBUTOR.root,
+                           claimant       = walletAddress,
+                           amountUnlocked = amount,
+                           amountLocked   = amountLocked,
+                           proof          = proof)
+
+    # ========================================
+    # Bulk version of `VerifyClaim`, `entries` are
+    # (walletAddress, amount, proof[, amountLocked]).
+    #
+    def VerifyClaims(self,
+                     entries:      List[Union[Tuple[SapysolPubkey, int, SapysolMerkleProof], Tuple[SapysolPubkey, int, SapysolMerkleProof, int]]],
+                     numProcesses: int = None) -> List[bool]:
+        return VerifyClaimsBulk(entries      = [ (self.DISTRIBUTOR.root, e[0], e[1], e[3] if len(e) > 3 else 0, e[2]) for e in entries ],
+                                numProcesses = numProcesses)
+
+    # ========================================
+    # Destination ATAs for `DISTRIBUTOR.mint` resolved in bulk: addresses are
+    # derived locally and checked `chunkSize` per `getMultipleAccounts`.
+    # Result keeps input order, `ix` is set only where ATA has to be created.
+    #
+    def GetAtaMultiple(self,
+                       walletAddresses: List[SapysolPubkey],
+                       chunkSize:       int = 100,
+                       numThreads:      int = 8) -> List[AtaInstruction]:
+        owners:    List[Pubkey] = [ MakePubkey(wallet) for wallet in walletAddresses ]
+        addresses: List[Pubkey] = [ GetAta(tokenMint=self.DISTRIBUTOR.mint, owner=owner) for owner in owners ]
+        with ThreadPoolExecutor(max_workers=max(1, numThreads)) as executor:
+            chunks   = executor.map(lambda chunk: FetchAccounts(connection=self.CONNECTION, pubkeys=chunk, chunkSize=chunkSize),
+                                    ListToChunks(baseList=addresses, chunkSize=chunkSize))
+            accounts = [ account for chunk in chunks for account in chunk ]
+        return [ AtaInstruction(pubkey = address,
+                                ix     = None if account is not None else CreateAtaIx(tokenMint=self.DISTRIBUTOR.mint, owner=owner, payer=owner))
+                 for owner, address, account in zip(owners, addresses, accounts) ]
+
+    # ========================================
+    # Write-locked accounts every claim contends for, used to sample priority fees.
+    #
+    def GetFeeAccounts(self) -> List[Pubkey]:
+        return [ self.PUBKEY, self.DISTRIBUTOR.token_vault ]
+
+    # ========================================
+    # With `ataIx` from `GetAtaMultiple` no RPC calls are made here.
+    # `computeBudget=False` leaves out compute budget/price instructions, e.g.
+    # when claims are packed together (see `SapysolClaimPacker`); `computeUnits`
+    # overrides the default limit.
     #
     def GetClaimIx(self,
                    walletAddress: SapysolPubkey,
                    amount:        int,
-                   proof:         List[List[int]],
-                   computePrice:  int = 1) -> List[Instruction]:
+                   proof:         SapysolMerkleProof,
+                   computePrice:  int = 1,
+                   ataIx:         AtaInstruction = None,
+                   computeBudget: bool = True,
+                   computeUnits:  int  = None,
+                   amountLocked:  int  = 0) -> List[Instruction]:
 
         _walletAddress = MakePubkey(walletAddress)
-        ataIx   = GetOrCreateAtaIx(connection=self.CONNECTION, tokenMint=self.DISTRIBUTOR.mint, owner=_walletAddress)
-
-        args = NewClaimArgs(amount_unlocked = amount,
-                            amount_locked   = 0,
-                            proof           = proof)
-        accounts = NewClaimAccounts(distributor  = self.PUBKEY,
-                                    claim_status = self.GetClaimStatusAddress(walletAddress=_walletAddress),
-                                    from_        = self.DISTRIBUTOR.token_vault,
-                                    to           = ataIx.pubkey,
-                                    claimant     = _walletAddress)
-        claimIx = new_claim(args=args, accounts=accounts)
+        if ataIx is None:
+            ataIx = GetOrCreateAtaIx(connection=self.CONNECTION, tokenMint=self.DISTRIBUTOR.mint, owner=_walletAddress)
+
+        claimIx = self.CLAIM_ENCODER.build(claim_status    = self.GetClaimStatusAddress(walletAddress=_walletAddress),
+                                           to              = ataIx.pubkey,
+                                           claimant        = _walletAddress,
+                                           amount_unlocked = amount,
+                                           amount_locked   = amountLocked,
+                                           proof           = PackProof(proof))
 
         result: List[Instruction] = []
-        result.append(ComputeBudgetIx())
-        result.append(ComputePriceIx(computePrice))
+        if computeBudget:
+            result.append(ComputeBudgetIx(units=computeUnits) if computeUnits else ComputeBudgetIx())
+            result.append(ComputePriceIx(computePrice))
         if ataIx.ix:
             result.append(ataIx.ix)
         result.append(claimIx)
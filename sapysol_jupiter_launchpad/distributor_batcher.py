@@ -1,29 +1,107 @@
 #!/usr/bin/python
 # =============================================================================
 # 
+from   typing                   import Dict, Tuple
 from   solana.rpc.api           import Client, Pubkey, Keypair
 from   solders.instruction      import Instruction
 from   sapysol                  import *
 from   sapysol.token_cache      import *
 from   sapysol.snippets.batcher import SapysolBatcher
 from  .distributor              import SapysolJupiterDistributor
-import requests
+from  .proof_client             import SapysolLfgProofClient, DEFAULT_PROOF_CLIENT
+from  .proof_cache              import SapysolLfgProofCache, NO_DISTRIBUTION_CACHE
+from  .proof_snapshot           import SapysolLfgProofSnapshot
+from  .proof_store              import SapysolLfgProofStore
+from  .merkle                   import PackProof
+from  .pda_cache                import CLAIM_STATUS_PDA_CACHE
+from  .single_flight            import SapysolSingleFlight
+from  .claim_packer             import SapysolClaimPacker, SapysolClaimPack
+from  .lookup_table             import SapysolClaimLookupTable
+from  .compute_units            import SapysolComputeUnitEstimator
+from  .fee_oracle               import SapysolFeeOracle, SapysolPriorityFeeOracle
+from  .retry_policy             import SapysolClaimRetryPolicy, SapysolClaimOutcome
+from   anchorpy.error           import ProgramError
+from   solana.rpc.core          import RPCException
+from   solana.exceptions        import SolanaRpcException
+from   solders.address_lookup_table_account import AddressLookupTableAccount
+from   concurrent.futures       import ThreadPoolExecutor
+import time
 
 # =============================================================================
 # 
 class SapysolLfgProofParams:
-    def __init__(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey):
+    def __init__(self, 
+                 tokenMint:     SapysolPubkey,
+                 walletAddress: SapysolPubkey,
+                 proofClient:   SapysolLfgProofClient = None,
+                 proofCache:    SapysolLfgProofCache  = None,
+                 proofSnapshot: SapysolLfgProofSnapshot = None,
+                 proofStore:    SapysolLfgProofStore    = None):
         self.DISTRIBUTOR_PUBKEY: Pubkey          = None
         self.AMOUNT:             int             = None
-        self.PROOF:              List[List[int]] = None
+        self.AMOUNT_LOCKED:      int             = 0
+        self.PROOF:              bytes           = None
+
+        # Local snapshot is authoritative, worker API is not used at all
+        if proofSnapshot is not None:
+            self.LoadResponse(response=proofSnapshot.Get(walletAddress=walletAddress))
+            return
+
+        # In-memory interned store first, then on-disk cache
+        if proofStore is not None:
+            response = proofStore.Get(walletAddress=walletAddress)
+            if response is not None:
+                self.LoadResponse(response=response)
+                return
 
-        r: requests.Response = requests.get(f"https://worker.jup.ag/jup-claim-proof/{str(tokenMint)}/{str(walletAddress)}")
-        if r.text == "":
+        # Negative results are remembered process-wide, on disk too with `proofCache`
+        if NO_DISTRIBUTION_CACHE.Contains(tokenMint=tokenMint, walletAddress=walletAddress):
             return
-        response = r.json()
+        if proofCache is not None:
+            if proofCache.IsNoDistribution(tokenMint=tokenMint, walletAddress=walletAddress):
+                return
+            response = proofCache.Get(tokenMint=tokenMint, walletAddress=walletAddress)
+            if response is not None:
+                if proofStore is not None:
+                    proofStore.Put(walletAddress=walletAddress, response=response)
+                self.LoadResponse(response=response)
+                return
+
+        client:   SapysolLfgProofClient = proofClient if proofClient else DEFAULT_PROOF_CLIENT
+        response: dict                  = client.FetchProof(tokenMint=tokenMint, walletAddress=walletAddress)
+        if proofCache is not None:
+            if response is None:
+                proofCache.PutNoDistribution(tokenMint=tokenMint, walletAddress=walletAddress)
+            else:
+                proofCache.Put(tokenMint=tokenMint, walletAddress=walletAddress, response=response)
+        elif response is None:
+            NO_DISTRIBUTION_CACHE.Put(tokenMint=tokenMint, walletAddress=walletAddress)
+        if proofStore is not None and response is not None:
+            proofStore.Put(walletAddress=walletAddress, response=response)
+        self.LoadResponse(response=response)
+
+    # ========================================
+    # Builds params from an already fetched `jup-claim-proof` response
+    # without doing any network I/O.
+    # `PROOF` is always kept as one n*32 bytes blob (not `List[List[int]]`).
+    #
+    @classmethod
+    def FromResponse(cls, response: Union[dict, None]) -> "SapysolLfgProofParams":
+        params: SapysolLfgProofParams = cls.__new__(cls)
+        params.DISTRIBUTOR_PUBKEY = None
+        params.AMOUNT             = None
+        params.AMOUNT_LOCKED      = 0
+        params.PROOF              = None
+        return params.LoadResponse(response=response)
+
+    def LoadResponse(self, response: Union[dict, None]) -> "SapysolLfgProofParams":
+        if response is None:
+            return self
         self.DISTRIBUTOR_PUBKEY: Pubkey          = MakePubkey(response["merkle_tree"])
         self.AMOUNT:             int             = response["amount"]
-        self.PROOF:              List[List[int]] = response["proof"]
+        self.AMOUNT_LOCKED:      int             = response.get("amount_locked", 0) # worker API: unlocked only
+        self.PROOF:              bytes           = PackProof(response["proof"])
+        return self
 
     def IsValid(self) -> bool:
         return self.DISTRIBUTOR_PUBKEY and self.AMOUNT and self.PROOF
@@ -37,61 +115,455 @@ class SapysolJupiterDistributorBatcher:
                  keypairsList:       List[SapysolKeypair],
                  connectionOverride: List[Union[str, Client]] = None,
                  txParams:           SapysolTxParams = SapysolTxParams(),
-                 numThreads:         int  = 20):
+                 numThreads:         int  = 20,
+                 proofClient:        SapysolLfgProofClient = None,
+                 proofCache:         SapysolLfgProofCache  = None,
+                 proofStore:         SapysolLfgProofStore  = None,
+                 pdaCachePath:       str = None,
+                 snapshotPath:       str = None,
+                 feePayer:           SapysolKeypair = None,
+                 useLookupTable:     bool = False,
+                 lookupTableAddress: SapysolPubkey = None,
+                 computeUnitSizing:  bool = False,
+                 feeOracle:          SapysolFeeOracle = None,
+                 retryPolicy:        SapysolClaimRetryPolicy  = None):
 
         self.CONNECTION:          Client                   = connection
         self.TOKEN_MINT:          Pubkey                   = MakePubkey(tokenMint)
         self.TOKEN:               SapysolToken             = SapysolToken(connection=connection, tokenMint=tokenMint)
         self.KEYPAIRS_LIST:       List[Keypair]            = [MakeKeypair(k) for k in keypairsList]
         self.TX_PARAMS:           SapysolTxParams          = txParams
+        self.NUM_THREADS:         int                      = numThreads
         self.CONNECTION_OVERRIDE: List[Union[str, Client]] = connectionOverride
         self.DISTRIBUTOR_LIST:    dict                     = {}
+        self.DISTRIBUTOR_FLIGHT:  SapysolSingleFlight      = SapysolSingleFlight(memoize=True)
+        self.PROOF_CLIENT:        SapysolLfgProofClient    = proofClient if proofClient else SapysolLfgProofClient(numConnections=numThreads)
+        # Opt-in: pass `SapysolLfgProofCache()` for the default on-disk location
+        self.PROOF_CACHE:         SapysolLfgProofCache     = proofCache
+        self.PROOF_SNAPSHOT:      SapysolLfgProofSnapshot  = SapysolLfgProofSnapshot(path=snapshotPath) if snapshotPath else None
+        self.PROOF_STORE:         SapysolLfgProofStore     = proofStore
+        # Derived ClaimStatus PDAs are persisted between runs only when a path
+        # is given (`SapysolPdaCache.DefaultPath()` for the default location)
+        self.PDA_CACHE_PATH:      str                      = pdaCachePath
+        # Outcome of `Prefilter()`: wallets verified as unclaimed, and their
+        # proofs when there is no store or snapshot to read them from again
+        self.PREFILTERED:         set                      = set()
+        self.CLAIM_PROOFS:        SapysolLfgProofStore     = SapysolLfgProofStore()
+        self.ATA_LIST:            Dict[Pubkey, AtaInstruction] = {}
+        # With `feePayer` claims of several wallets are packed into one transaction
+        self.PACKER:              SapysolClaimPacker       = SapysolClaimPacker(feePayer=feePayer) if feePayer else None
+        # v0 transactions against a lookup table: existing one or created on `Start()`
+        self.USE_LOOKUP_TABLE:    bool                     = useLookupTable or lookupTableAddress is not None
+        self.LOOKUP_TABLE_PUBKEY: Pubkey                   = MakePubkey(lookupTableAddress) if lookupTableAddress else None
+        self.LOOKUP_TABLE:        AddressLookupTableAccount = None
+        # Compute unit limits measured by simulation instead of the 1.4M default
+        self.CU_ESTIMATOR:        SapysolComputeUnitEstimator = SapysolComputeUnitEstimator(connection=connection) if computeUnitSizing else None
+        # Every transaction is priced by the oracle, retries escalate;
+        # `SapysolStaticFeeOracle()` opts out of market-based prices
+        self.FEE_ORACLE:          SapysolFeeOracle         = feeOracle if feeOracle else SapysolPriorityFeeOracle.FromConnection(connection=connection)
+        self.RETRY_POLICY:        SapysolClaimRetryPolicy  = retryPolicy if retryPolicy else SapysolClaimRetryPolicy()
         self.BATCHER:             SapysolBatcher = SapysolBatcher(callback    = self.ClaimSingle,
                                                                   entityList  = self.KEYPAIRS_LIST,
                                                                   entityKwarg = "wallet",
                                                                   numThreads  = numThreads)
 
     # ========================================
+    # Single-flight: only one thread fetches a distributor, the rest wait for it.
     #
     def GetDistributor(self, distributorAddress: SapysolPubkey) -> SapysolJupiterDistributor:
 
         _distributorAddress: Pubkey = MakePubkey(distributorAddress)
         if _distributorAddress in self.DISTRIBUTOR_LIST:
             return self.DISTRIBUTOR_LIST[_distributorAddress]
-        self.DISTRIBUTOR_LIST[_distributorAddress] = SapysolJupiterDistributor(connection         = self.CONNECTION,
-                                                                               distributorAddress = distributorAddress)
-        return self.DISTRIBUTOR_LIST[_distributorAddress]
+        distributor = self.DISTRIBUTOR_FLIGHT.Do(key  = _distributorAddress,
+                                                 func = lambda: SapysolJupiterDistributor(connection         = self.CONNECTION,
+                                                                                          distributorAddress = _distributorAddress))
+        self.DISTRIBUTOR_LIST[_distributorAddress] = distributor
+        return distributor
 
     # ========================================
+    # Loads all missing distributors with one `getMultipleAccounts` per 100.
     #
-    def ClaimSingle(self, wallet: Keypair) -> None:
-        params: SapysolLfgProofParams = SapysolLfgProofParams(tokenMint=self.TOKEN_MINT, walletAddress=wallet.pubkey())
+    def LoadDistributors(self, distributorAddresses: List[SapysolPubkey]) -> None:
+        missing: List[Pubkey] = [ pubkey for pubkey in map(MakePubkey, distributorAddresses) if pubkey not in self.DISTRIBUTOR_LIST ]
+        if not missing:
+            return
+        distributors = SapysolJupiterDistributor.FromAddresses(connection=self.CONNECTION, distributorAddresses=missing)
+        self.DISTRIBUTOR_LIST.update(zip(missing, distributors))
+
+    # ========================================
+    # Params are not kept per wallet, claiming reads them again from
+    # `CLAIM_PROOFS`, the proof store or the snapshot.
+    #
+    def GetProofParams(self, wallet: Keypair) -> SapysolLfgProofParams:
+        response = self.CLAIM_PROOFS.Get(walletAddress=wallet.pubkey())
+        if response is not None:
+            return SapysolLfgProofParams.FromResponse(response=response)
+        return SapysolLfgProofParams(tokenMint     = self.TOKEN_MINT,
+                                     walletAddress = wallet.pubkey(),
+                                     proofClient   = self.PROOF_CLIENT,
+                                     proofCache    = self.PROOF_CACHE,
+                                     proofSnapshot = self.PROOF_SNAPSHOT,
+                                     proofStore    = self.PROOF_STORE)
+
+    # ========================================
+    # A failed lookup of one wallet must not abort the whole prefilter.
+    #
+    def __TryGetProofParams(self, wallet: Keypair) -> Union[SapysolLfgProofParams, None]:
+        try:
+            return self.GetProofParams(wallet=wallet)
+        except Exception as e:
+            print(f"{str(wallet.pubkey()):>44}: Proof lookup failed ({e}), claiming separately...")
+            return None
+
+    # ========================================
+    # Runs before any per-wallet work: resolves all proofs, verifies them in
+    # bulk per distributor and fetches all ClaimStatus accounts and destination
+    # ATAs with chunked `getMultipleAccounts`. Returns wallets that still need
+    # to claim; wallets whose proof lookup failed are returned too, but not
+    # marked as `PREFILTERED`, so `ClaimSingle()` checks them as usual.
+    #
+    def Prefilter(self) -> List[Keypair]:
+        with ThreadPoolExecutor(max_workers=self.NUM_THREADS) as executor:
+            paramsList: List[SapysolLfgProofParams] = list(executor.map(self.__TryGetProofParams, self.KEYPAIRS_LIST))
+
+        result:        List[Keypair] = []
+        byDistributor: Dict[Pubkey, List[Tuple[Keypair, SapysolLfgProofParams]]] = {}
+        for wallet, params in zip(self.KEYPAIRS_LIST, paramsList):
+            if params is None:
+                result.append(wallet)
+                continue
+            if not params.IsValid():
+                print(f"{str(wallet.pubkey()):>44}: No distribution, skipping...")
+                continue
+            byDistributor.setdefault(params.DISTRIBUTOR_PUBKEY, []).append((wallet, params))
+
+        self.LoadDistributors(distributorAddresses=list(byDistributor.keys()))
+
+        for distributorAddress, entries in byDistributor.items():
+            distributor: SapysolJupiterDistributor = self.GetDistributor(distributorAddress=distributorAddress)
+            validList    = distributor.VerifyClaims(entries=[ (wallet.pubkey(), params.AMOUNT, params.PROOF, params.AMOUNT_LOCKED) for wallet, params in entries ])
+            statusesList = distributor.GetClaimStatusMultiple(walletAddresses = [ wallet.pubkey() for wallet, _ in entries ],
+                                                              numThreads      = self.NUM_THREADS)
+            for (wallet, params), valid, claimStatus in zip(entries, validList, statusesList):
+                if not valid:
+                    print(f"{str(wallet.pubkey()):>44}: Invalid proof, skipping...")
+                elif claimStatus:
+                    print(f"{str(wallet.pubkey()):>44}: Already claimed, skipping...")
+                else:
+                    self.PREFILTERED.add(wallet.pubkey())
+                    result.append(wallet)
+                    # Worker and cache proofs have no locked amount, so they fit the store
+                    if self.PROOF_STORE is None and self.PROOF_SNAPSHOT is None:
+                        self.CLAIM_PROOFS.Put(walletAddress=wallet.pubkey(), response={ "merkle_tree": params.DISTRIBUTOR_PUBKEY,
+                                                                                        "amount":      params.AMOUNT,
+                                                                                        "proof":       params.PROOF })
+
+            unclaimed: List[Pubkey] = [ wallet.pubkey() for wallet, _ in entries if wallet.pubkey() in self.PREFILTERED ]
+            if unclaimed:
+                ataList = distributor.GetAtaMultiple(walletAddresses=unclaimed, numThreads=self.NUM_THREADS)
+                self.ATA_LIST.update(zip(unclaimed, ataList))
+        return result
+
+    # ========================================
+    # Proof params and distributor of a wallet that still has to claim,
+    # `None` when there is nothing to claim.
+    #
+    def PrepareClaim(self, wallet: Keypair) -> Union[Tuple[SapysolLfgProofParams, SapysolJupiterDistributor], None]:
+        params: SapysolLfgProofParams = self.GetProofParams(wallet=wallet)
         if not params.IsValid():
             print(f"{str(wallet.pubkey()):>44}: No distribution, skipping...")
-            return
+            return None
 
         distributor: SapysolJupiterDistributor = self.GetDistributor(distributorAddress=params.DISTRIBUTOR_PUBKEY)
-        claimStatus = distributor.GetClaimStatus(walletAddress=wallet.pubkey())
-        if claimStatus:
-            print(f"{str(wallet.pubkey()):>44}: Already claimed, skipping...")
+
+        # Prefiltered wallets are already verified and known to be unclaimed
+        if wallet.pubkey() not in self.PREFILTERED:
+            claimStatus = distributor.GetClaimStatus(walletAddress=wallet.pubkey())
+            if claimStatus:
+                print(f"{str(wallet.pubkey()):>44}: Already claimed, skipping...")
+                return None
+
+            if not distributor.VerifyClaim(walletAddress=wallet.pubkey(), amount=params.AMOUNT, proof=params.PROOF, amountLocked=params.AMOUNT_LOCKED):
+                print(f"{str(wallet.pubkey()):>44}: Invalid proof, skipping...")
+                return None
+        return params, distributor
+
+    # ========================================
+    # Every error of an attempt is classified and counted here, including
+    # lookups, ATA and fee oracle errors, so the backoff caps always apply
+    # (`SapysolBatcher` would call again with fresh counters otherwise).
+    #
+    def ClaimSingle(self, wallet: Keypair) -> None:
+        params:      SapysolLfgProofParams     = None
+        distributor: SapysolJupiterDistributor = None
+        ataIx:       AtaInstruction            = None
+
+        # Failed attempts per outcome class, transient ones also escalate the fee
+        attempts: Dict[SapysolClaimOutcome, int] = { SapysolClaimOutcome.TRANSIENT: 0, SapysolClaimOutcome.RETRY_LATER: 0 }
+        while True:
+            ix:        List[Instruction] = []
+            programId: Pubkey            = None
+            try:
+                if distributor is None:
+                    prepared = self.PrepareClaim(wallet=wallet)
+                    if prepared is None:
+                        return
+                    params, distributor = prepared
+                programId = distributor.CLAIM_ENCODER.program_id
+
+                if ataIx is None:
+                    ataIx = self.ATA_LIST.get(wallet.pubkey())
+                    if ataIx is None:
+                        ataIx = GetOrCreateAtaIx(connection=self.CONNECTION, tokenMint=distributor.DISTRIBUTOR.mint, owner=wallet.pubkey())
+                # Memoized once measured, re-measured on retries until then
+                computeUnits: int = self.GetComputeUnits(wallet=wallet, distributor=distributor, params=params, ataIx=ataIx)
+
+                delimiter: int = 10**self.TOKEN.TOKEN_INFO.decimals
+                computePrice: int = self.FEE_ORACLE.GetPrice(accounts=distributor.GetFeeAccounts(), attempt=attempts[SapysolClaimOutcome.TRANSIENT])
+                print(f"{str(wallet.pubkey()):>44}: Claiming {params.AMOUNT/delimiter} tokens (priority fee {computePrice})...")
+                ix = distributor.GetClaimIx(walletAddress = wallet.pubkey(),
+                                            amount        = params.AMOUNT,
+                                            proof         = params.PROOF,
+                                            computePrice  = computePrice,
+                                            ataIx         = ataIx,
+                                            computeUnits  = computeUnits,
+                                            amountLocked  = params.AMOUNT_LOCKED)
+                tx: SapysolTx = self.BuildTx(payer=wallet, instructions=ix, signers=[wallet])
+                result: SapysolTxStatus = tx.Sign([wallet]).WaitForTx(self.CONNECTION_OVERRIDE)
+                outcome, error = self.RETRY_POLICY.ClassifyTx(tx=tx, status=result, instructions=ix, programId=programId)
+            except RPCException as e:
+                outcome, error = self.RETRY_POLICY.ClassifyException(error=e, instructions=ix, programId=programId)
+            except SolanaRpcException as e: # timeouts, connection errors
+                outcome, error = SapysolClaimOutcome.TRANSIENT, e.error_msg
+            except Exception as e:
+                outcome, error = SapysolClaimOutcome.TRANSIENT, e
+
+            if outcome == SapysolClaimOutcome.SUCCESS:
+                return
+            reason: str = error.msg if isinstance(error, ProgramError) else str(error)
+            if outcome == SapysolClaimOutcome.FATAL:
+                print(f"{str(wallet.pubkey()):>44}: {reason}, giving up...")
+                return
+
+            backoff = self.RETRY_POLICY.GetBackoff(outcome=outcome)
+            if backoff.IsExhausted(attempt=attempts[outcome]):
+                print(f"{str(wallet.pubkey()):>44}: {reason}, giving up after {attempts[outcome]} retries...")
+                return
+            delay: float = backoff.GetDelay(attempt=attempts[outcome])
+            attempts[outcome] += 1
+            print(f"{str(wallet.pubkey()):>44}: {reason}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+    # ========================================
+    # Loads `lookupTableAddress` or creates a new table with all loaded
+    # distributors; the fee payer (or the first wallet) is its authority.
+    # A created table is reused by later `Start()` calls of this batcher,
+    # `ReleaseLookupTable()` deactivates it when claiming is done.
+    #
+    def GetLookupTable(self) -> SapysolClaimLookupTable:
+        return SapysolClaimLookupTable(connection  = self.CONNECTION,
+                                       authority   = self.PACKER.FEE_PAYER if self.PACKER else self.KEYPAIRS_LIST[0],
+                                       txParams    = self.TX_PARAMS,
+                                       feeOracle   = self.FEE_ORACLE,
+                                       retryPolicy = self.RETRY_POLICY)
+
+    def PrepareLookupTable(self) -> AddressLookupTableAccount:
+        lookupTable = self.GetLookupTable()
+        if self.LOOKUP_TABLE_PUBKEY:
+            self.LOOKUP_TABLE = lookupTable.Load(address=self.LOOKUP_TABLE_PUBKEY)
+        else:
+            self.LOOKUP_TABLE = lookupTable.Create(addresses=SapysolClaimLookupTable.GetSharedAddresses(self.DISTRIBUTOR_LIST.values()))
+            self.LOOKUP_TABLE_PUBKEY = self.LOOKUP_TABLE.key
+            print(f"Lookup table created: {str(self.LOOKUP_TABLE.key)} (pass it as `lookupTableAddress` to reuse, `ReleaseLookupTable()` to deactivate)")
+        if self.PACKER:
+            self.PACKER.LOOKUP_TABLES = [self.LOOKUP_TABLE]
+        return self.LOOKUP_TABLE
+
+    # ========================================
+    # Deactivates the lookup table; its rent can be reclaimed with
+    # `SapysolClaimLookupTable.Close()` after the cooldown.
+    #
+    def ReleaseLookupTable(self) -> None:
+        if not self.LOOKUP_TABLE_PUBKEY:
             return
+        lookupTable = self.GetLookupTable()
+        lookupTable.Deactivate(address=self.LOOKUP_TABLE_PUBKEY)
+        print(f"Lookup table deactivated: {str(self.LOOKUP_TABLE_PUBKEY)}")
+        self.LOOKUP_TABLE_PUBKEY = None
+        self.LOOKUP_TABLE        = None
+        if self.PACKER:
+            self.PACKER.LOOKUP_TABLES = []
 
-        ix: List[Instruction] = distributor.GetClaimIx(walletAddress=wallet.pubkey(), amount=params.AMOUNT, proof=params.PROOF)
+    # ========================================
+    # Simulated compute units for this wallet's claim class (a static estimate
+    # while the claim fails in simulation), `None` when sizing is off or the
+    # simulation could not be sent (default limit is used then).
+    #
+    def GetComputeUnits(self,
+                        wallet:      Keypair,
+                        distributor: SapysolJupiterDistributor,
+                        params:      SapysolLfgProofParams,
+                        ataIx:       AtaInstruction) -> Union[int, None]:
+        if not self.CU_ESTIMATOR:
+            return None
+        try:
+            return self.CU_ESTIMATOR.GetUnits(key          = (distributor.PUBKEY, len(params.PROOF) // 32, ataIx.ix is not None),
+                                              payer        = wallet,
+                                              instructions = lambda: distributor.GetClaimIx(walletAddress = wallet.pubkey(),
+                                                                                            amount        = params.AMOUNT,
+                                                                                            proof         = params.PROOF,
+                                                                                            ataIx         = ataIx,
+                                                                                            computeBudget = False,
+                                                                                            amountLocked  = params.AMOUNT_LOCKED))
+        except Exception as e:
+            print(f"{str(wallet.pubkey()):>44}: Compute unit simulation failed ({e}), using default limit...")
+            return None
 
+    # ========================================
+    # Legacy transaction, or v0 one when a lookup table is prepared.
+    #
+    def BuildTx(self, payer: Keypair, instructions: List[Instruction], signers: List[Keypair]) -> SapysolTx:
+        tx: SapysolTx = SapysolTx(connection=self.CONNECTION, payer=payer, txParams=self.TX_PARAMS)
+        if self.LOOKUP_TABLE:
+            return tx.FromInstructionsVersioned(instructions=instructions, signers=signers, lookupTableAccounts=[self.LOOKUP_TABLE])
+        return tx.FromInstructionsLegacy(instructions=instructions)
+
+    # ========================================
+    # Claim instructions of all wallets packed into as few transactions as
+    # possible (see `SapysolClaimPacker`). A pack fails as a whole, so only
+    # wallets that passed `Prefilter()` (verified, unclaimed) are packed.
+    #
+    def BuildPacks(self, wallets: List[Keypair]) -> List[SapysolClaimPack]:
+        entries:     List[Tuple[Keypair, List[Instruction], int]] = []
+        feeAccounts: Dict[Pubkey, List[Pubkey]] = {}
+        for wallet in wallets:
+            if wallet.pubkey() not in self.PREFILTERED:
+                continue
+            params: SapysolLfgProofParams = self.GetProofParams(wallet=wallet)
+            distributor: SapysolJupiterDistributor = self.GetDistributor(distributorAddress=params.DISTRIBUTOR_PUBKEY)
+            ataIx:        AtaInstruction = self.ATA_LIST[wallet.pubkey()] # resolved by `Prefilter()`
+            computeUnits: int = self.GetComputeUnits(wallet=wallet, distributor=distributor, params=params, ataIx=ataIx)
+            entries.append((wallet, distributor.GetClaimIx(walletAddress = wallet.pubkey(),
+                                                           amount        = params.AMOUNT,
+                                                           proof         = params.PROOF,
+                                                           ataIx         = ataIx,
+                                                           computeBudget = False,
+                                                           amountLocked  = params.AMOUNT_LOCKED), computeUnits))
+            feeAccounts[wallet.pubkey()] = distributor.GetFeeAccounts()
+
+        packs: List[SapysolClaimPack] = self.PACKER.Pack(entries=entries)
+        for pack in packs:
+            pack.FEE_ACCOUNTS = list(dict.fromkeys(a for w in pack.WALLETS for a in feeAccounts[w]))
+        return packs
+
+    # ========================================
+    #
+    def ClaimPack(self, pack: SapysolClaimPack) -> None:
+        # Failed attempts per outcome class, transient ones also escalate the fee
+        attempts: Dict[SapysolClaimOutcome, int] = { SapysolClaimOutcome.TRANSIENT: 0, SapysolClaimOutcome.RETRY_LATER: 0 }
         while True:
-            delimiter: int = 10**self.TOKEN.TOKEN_INFO.decimals
-            print(f"{str(wallet.pubkey()):>44}: Claiming {params.AMOUNT/delimiter} tokens...")
-            tx: SapysolTx = SapysolTx(connection=self.CONNECTION, payer=wallet, txParams=self.TX_PARAMS)
-            tx.FromInstructionsLegacy(instructions=ix)
-            result: SapysolTxStatus = tx.Sign([wallet]).WaitForTx(self.CONNECTION_OVERRIDE)
-            if result == SapysolTxStatus.SUCCESS:
+            ix:       List[Instruction]     = []
+            tx:       SapysolTx             = None
+            result:   SapysolTxStatus       = None
+            rpcError: RPCException          = None
+            failure:  Union[Exception, str] = None
+            try:
+                computePrice: int = self.FEE_ORACLE.GetPrice(accounts=pack.FEE_ACCOUNTS, attempt=attempts[SapysolClaimOutcome.TRANSIENT])
+                for walletAddress in pack.WALLETS:
+                    print(f"{str(walletAddress):>44}: Claiming in a pack of {len(pack.WALLETS)} wallets (priority fee {computePrice})...")
+                ix = pack.GetInstructions(computePrice=computePrice)
+                tx = self.BuildTx(payer=self.PACKER.FEE_PAYER, instructions=ix, signers=pack.SIGNERS)
+                result = tx.Sign(pack.SIGNERS).WaitForTx(self.CONNECTION_OVERRIDE)
+            except RPCException as e:
+                rpcError = e
+            except SolanaRpcException as e: # timeouts, connection errors
+                failure = e.error_msg
+            except Exception as e:
+                failure = e
+
+            # Errors are trusted only from the claim instruction of the wallet
+            # that owns the failing instruction
+            txError = None if result == SapysolTxStatus.SUCCESS or failure is not None else SapysolClaimRetryPolicy.GetTxError(tx=tx, error=rpcError)
+            entry = pack.GetEntry(index=SapysolClaimRetryPolicy.GetFailedInstruction(txError=txError))
+            programId: Pubkey = entry[1][-1].program_id if entry else None
+            if failure is not None:
+                outcome, error = SapysolClaimOutcome.TRANSIENT, failure
+            elif rpcError is not None:
+                outcome, error = self.RETRY_POLICY.ClassifyException(error=rpcError, instructions=ix, programId=programId)
+            else:
+                outcome, error = self.RETRY_POLICY.ClassifyTx(tx=tx, status=result, instructions=ix, programId=programId)
+
+            if outcome == SapysolClaimOutcome.SUCCESS:
+                return
+            reason: str = error.msg if isinstance(error, ProgramError) else str(error)
+
+            # One wallet can never claim: drop it and repack the rest
+            if outcome == SapysolClaimOutcome.FATAL:
+                print(f"{str(entry[0].pubkey()):>44}: {reason}, giving up...")
+                entries = [ e for e in pack.ENTRIES if e is not entry ]
+                if not entries:
+                    return
+                feeAccounts: List[Pubkey] = pack.FEE_ACCOUNTS
+                pack, = self.PACKER.Pack(entries=entries) # a subset of a pack fits into one
+                pack.FEE_ACCOUNTS = feeAccounts
+                continue
+
+            backoff = self.RETRY_POLICY.GetBackoff(outcome=outcome)
+            if outcome == SapysolClaimOutcome.RETRY_LATER and backoff.IsExhausted(attempt=attempts[outcome]):
+                for walletAddress in pack.WALLETS:
+                    print(f"{str(walletAddress):>44}: {reason}, giving up after {attempts[outcome]} retries...")
                 return
+            # Executed and failed for an unknown reason (resending the same
+            # pack fails again) or out of retries: every wallet falls back to
+            # its own transaction
+            if txError is not None or backoff.IsExhausted(attempt=attempts[outcome]):
+                for wallet, _, _ in pack.ENTRIES:
+                    print(f"{str(wallet.pubkey()):>44}: Pack failed ({reason}), claiming separately...")
+                    self.ClaimSingle(wallet=wallet)
+                return
+            delay: float = backoff.GetDelay(attempt=attempts[outcome])
+            attempts[outcome] += 1
+            for walletAddress in pack.WALLETS:
+                print(f"{str(walletAddress):>44}: {reason}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
 
     # ========================================
     #
-    def Start(self, **kwargs) -> None:
+    def Start(self, prefilter: bool = True, **kwargs) -> None:
+        if self.PACKER and not prefilter:
+            raise ValueError("SapysolJupiterDistributorBatcher: packing claims (`feePayer`) requires `prefilter=True`!")
         self.RESULTS = {}
-        self.BATCHER.Start(**kwargs)
+        if self.PDA_CACHE_PATH:
+            CLAIM_STATUS_PDA_CACHE.Load(path=self.PDA_CACHE_PATH)
+        try:
+            wallets: List[Keypair] = self.Prefilter() if prefilter else self.KEYPAIRS_LIST
+            if self.USE_LOOKUP_TABLE:
+                self.PrepareLookupTable()
+
+            if self.PACKER:
+                self.BATCHER = SapysolBatcher(callback    = self.ClaimPack,
+                                              entityList  = self.BuildPacks(wallets=wallets),
+                                              entityKwarg = "pack",
+                                              numThreads  = self.NUM_THREADS)
+                self.BATCHER.Start(**kwargs)
+                # Wallets that could not be prefiltered claim one by one
+                wallets = [ wallet for wallet in wallets if wallet.pubkey() not in self.PREFILTERED ]
+                if not wallets:
+                    return
+                self.BATCHER = SapysolBatcher(callback    = self.ClaimSingle,
+                                              entityList  = wallets,
+                                              entityKwarg = "wallet",
+                                              numThreads  = self.NUM_THREADS)
+            elif prefilter:
+                self.BATCHER = SapysolBatcher(callback    = self.ClaimSingle,
+                                              entityList  = wallets,
+                                              entityKwarg = "wallet",
+                                              numThreads  = self.NUM_THREADS)
+            self.BATCHER.Start(**kwargs)
+        finally:
+            if self.PDA_CACHE_PATH:
+                CLAIM_STATUS_PDA_CACHE.Save(path=self.PDA_CACHE_PATH)
 
 # =============================================================================
 # 
@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing         import Dict, Iterable, List, Sequence, Tuple
+from   dataclasses    import dataclass
+from   solana.rpc.api import Client, Pubkey
+from   sapysol        import SapysolPubkey, MakePubkey
+import threading
+import requests
+import logging
+import time
+import math
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# `getRecentPrioritizationFees` (no `solana-py`/`solders` wrapper exists):
+# fees paid in recent slots by transactions writing all of `accounts`
+# (at most 128).
+#
+@dataclass(slots=True)
+class SapysolPrioritizationFee:
+    slot:              int
+    prioritizationFee: int
+
+def GetRecentPrioritizationFees(endpoint: str,
+                                accounts: Sequence[SapysolPubkey] = (),
+                                headers:  Dict[str, str] = None,
+                                timeout:  float = 5.0) -> List[SapysolPrioritizationFee]:
+    if len(accounts) > 128:
+        raise ValueError("GetRecentPrioritizationFees(): at most 128 accounts are allowed!")
+    r = requests.post(url     = endpoint,
+                      headers = { "Content-Type": "application/json", **(headers or {}) },
+                      json    = { "jsonrpc": "2.0",
+                                  "id":      1,
+                                  "method":  "getRecentPrioritizationFees",
+                                  "params":  [ [ str(MakePubkey(a)) for a in accounts ] ] },
+                      timeout = timeout)
+    r.raise_for_status()
+    response = r.json()
+    if "error" in response:
+        raise ValueError(f"GetRecentPrioritizationFees(): {response['error']}!")
+    return [ SapysolPrioritizationFee(slot=entry["slot"], prioritizationFee=entry["prioritizationFee"]) for entry in response["result"] ]
+
+# =============================================================================
+# HTTP endpoint and extra headers of a `Client`. `solana-py` has no public
+# accessor, this is the only place that reads the provider.
+#
+def GetClientEndpoint(connection: Client) -> Tuple[str, Dict[str, str]]:
+    provider = connection._provider
+    return provider.endpoint_uri, dict(provider.extra_headers or {})
+
+# =============================================================================
+# Base class of fee oracles: the batcher only calls `GetPrice()`.
+#
+class SapysolFeeOracle:
+    def GetPrice(self, accounts: Iterable[SapysolPubkey] = (), attempt: int = 0) -> int:
+        raise NotImplementedError()
+
+# =============================================================================
+# Fixed price, same as the old `computePrice=1` behavior.
+#
+class SapysolStaticFeeOracle(SapysolFeeOracle):
+    def __init__(self, price: int = 1):
+        self.PRICE: int = price
+
+    def GetPrice(self, accounts: Iterable[SapysolPubkey] = (), attempt: int = 0) -> int:
+        return self.PRICE
+
+# =============================================================================
+# Priority fee oracle based on `getRecentPrioritizationFees`.
+#
+# Fees paid in recent slots by transactions writing the given accounts are
+# sampled and cached for `cacheTtl` seconds per account set. The price is a
+# percentile of that sample, every retry moves one step up `percentiles`,
+# result is clamped to [minPrice, maxPrice] micro-lamports.
+# RPC errors never fail a claim: the last known sample (or `minPrice`) is used.
+# `endpoint` is the HTTP RPC URL (plus optional `headers`) the fees are read from.
+#
+class SapysolPriorityFeeOracle(SapysolFeeOracle):
+    def __init__(self,
+                 endpoint:    str,
+                 headers:     Dict[str, str] = None,
+                 percentiles: Sequence[int] = (50, 75, 90, 95, 99),
+                 cacheTtl:    float = 2.0,
+                 minPrice:    int   = 1,
+                 maxPrice:    int   = 5_000_000,
+                 timeout:     float = 5.0):
+
+        self.ENDPOINT:    str            = endpoint
+        self.HEADERS:     Dict[str, str] = headers if headers else {}
+        self.PERCENTILES: Sequence[int] = percentiles
+        self.CACHE_TTL:   float         = cacheTtl
+        self.MIN_PRICE:   int           = minPrice
+        self.MAX_PRICE:   int           = maxPrice
+        self.TIMEOUT:     float         = timeout
+        self.LOCK:        threading.Lock = threading.Lock()
+        self.CACHE:       Dict[Tuple[Pubkey, ...], Tuple[float, List[int]]] = {} # accounts -> (fetched at, sorted fees)
+
+    # ========================================
+    # Oracle reading fees from the same RPC node as `connection`.
+    #
+    @classmethod
+    def FromConnection(cls, connection: Client, **kwargs) -> "SapysolPriorityFeeOracle":
+        endpoint, headers = GetClientEndpoint(connection=connection)
+        return cls(endpoint=endpoint, headers=headers, **kwargs)
+
+    # ========================================
+    #
+    def FetchFees(self, accounts: Sequence[Pubkey]) -> List[int]:
+        fees = GetRecentPrioritizationFees(endpoint=self.ENDPOINT, accounts=accounts[:128], headers=self.HEADERS, timeout=self.TIMEOUT)
+        return sorted(fee.prioritizationFee for fee in fees)
+
+    # ========================================
+    #
+    def GetFees(self, accounts: Iterable[SapysolPubkey]) -> List[int]:
+        key: Tuple[Pubkey, ...] = tuple(MakePubkey(a) for a in accounts)
+        with self.LOCK:
+            cached = self.CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        try:
+            fees = self.FetchFees(accounts=key)
+        except Exception as e:
+            logger.warning("SapysolPriorityFeeOracle: getRecentPrioritizationFees failed (%s), using last known fees...", e)
+            return cached[1] if cached else []
+        with self.LOCK:
+            self.CACHE[key] = (time.monotonic(), fees)
+        return fees
+
+    # ========================================
+    #
+    def GetPrice(self, accounts: Iterable[SapysolPubkey] = (), attempt: int = 0) -> int:
+        fees = self.GetFees(accounts=accounts)
+        if not fees:
+            return self.MIN_PRICE
+        percentile = self.PERCENTILES[min(attempt, len(self.PERCENTILES) - 1)]
+        price      = fees[min(len(fees) - 1, math.ceil(len(fees) * percentile / 100) - 1)]
+        return max(self.MIN_PRICE, min(self.MAX_PRICE, price))
+
+# =============================================================================
+#
@@ -0,0 +1,216 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing                               import Callable, Iterable, List, Union
+from   solana.rpc.api                       import Client, Pubkey, Keypair
+from   solana.rpc.commitment                import Finalized
+from   solders.instruction                  import Instruction, AccountMeta
+from   solders.system_program               import ID as SYS_PROGRAM_ID
+from   solders.compute_budget               import ID as COMPUTE_BUDGET_PROGRAM_ID
+from   solders.address_lookup_table_account import AddressLookupTable, AddressLookupTableAccount, derive_lookup_table_address
+from   solders.address_lookup_table_account import ID as LOOKUP_TABLE_PROGRAM_ID
+from   spl.token.constants                  import TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID
+from   sapysol                              import *
+from  .distributor                          import SapysolJupiterDistributor
+from  .fee_oracle                           import SapysolFeeOracle, SapysolPriorityFeeOracle
+from  .retry_policy                         import SapysolClaimRetryPolicy, SapysolClaimOutcome
+from   solana.rpc.core                      import RPCException
+import struct
+import time
+
+# =============================================================================
+# Address lookup table program instructions (bincode, u32 enum tag).
+#
+LOOKUP_TABLE_EXTEND_CHUNK: int = 20
+LOOKUP_TABLE_ACTIVE_SLOT:  int = 2**64 - 1 # `deactivation_slot` of a table that is not deactivated
+LOOKUP_TABLE_COOLDOWN:     int = 513       # slots until a deactivated table leaves `SlotHashes`
+LOOKUP_TABLE_SLOT_HASHES:  int = 512       # `recentSlot` of a create must be one of the last 512 slots
+
+def CreateLookupTableIx(authority: Pubkey, payer: Pubkey, recentSlot: int) -> Instruction:
+    address, bump = derive_lookup_table_address(authority, recentSlot)
+    keys: List[AccountMeta] = [
+        AccountMeta(pubkey=address,        is_signer=False, is_writable=True ),
+        AccountMeta(pubkey=authority,      is_signer=True,  is_writable=False),
+        AccountMeta(pubkey=payer,          is_signer=True,  is_writable=True ),
+        AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+    ]
+    return Instruction(LOOKUP_TABLE_PROGRAM_ID, struct.pack("<IQB", 0, recentSlot, bump), keys)
+
+def ExtendLookupTableIx(lookupTable: Pubkey, authority: Pubkey, payer: Pubkey, addresses: List[Pubkey]) -> Instruction:
+    keys: List[AccountMeta] = [
+        AccountMeta(pubkey=lookupTable,    is_signer=False, is_writable=True ),
+        AccountMeta(pubkey=authority,      is_signer=True,  is_writable=False),
+        AccountMeta(pubkey=payer,          is_signer=True,  is_writable=True ),
+        AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+    ]
+    data = struct.pack("<IQ", 2, len(addresses)) + b"".join(bytes(a) for a in addresses)
+    return Instruction(LOOKUP_TABLE_PROGRAM_ID, data, keys)
+
+def DeactivateLookupTableIx(lookupTable: Pubkey, authority: Pubkey) -> Instruction:
+    keys: List[AccountMeta] = [
+        AccountMeta(pubkey=lookupTable,    is_signer=False, is_writable=True ),
+        AccountMeta(pubkey=authority,      is_signer=True,  is_writable=False),
+    ]
+    return Instruction(LOOKUP_TABLE_PROGRAM_ID, struct.pack("<I", 3), keys)
+
+def CloseLookupTableIx(lookupTable: Pubkey, authority: Pubkey, recipient: Pubkey) -> Instruction:
+    keys: List[AccountMeta] = [
+        AccountMeta(pubkey=lookupTable,    is_signer=False, is_writable=True ),
+        AccountMeta(pubkey=authority,      is_signer=True,  is_writable=False),
+        AccountMeta(pubkey=recipient,      is_signer=False, is_writable=True ),
+    ]
+    return Instruction(LOOKUP_TABLE_PROGRAM_ID, struct.pack("<I", 4), keys)
+
+# =============================================================================
+# Lookup table with accounts shared by every claim transaction: distributors,
+# their vaults and programs, mints, token/ATA/system/compute budget programs.
+# With it v0 claim transactions reference them by 1-byte index instead of
+# 32-byte keys, which leaves room for several claims per transaction.
+# Table transactions are priced by `feeOracle` and retried with the transient
+# backoff of `retryPolicy`; a resend is skipped when the previous send landed.
+#
+class SapysolClaimLookupTable:
+    def __init__(self,
+                 connection:  Client,
+                 authority:   SapysolKeypair,
+                 txParams:    SapysolTxParams = SapysolTxParams(),
+                 feeOracle:   SapysolFeeOracle = None,
+                 retryPolicy: SapysolClaimRetryPolicy = None):
+        self.CONNECTION:   Client                    = connection
+        self.AUTHORITY:    Keypair                   = MakeKeypair(authority)
+        self.TX_PARAMS:    SapysolTxParams           = txParams
+        self.FEE_ORACLE:   SapysolFeeOracle          = feeOracle if feeOracle else SapysolPriorityFeeOracle.FromConnection(connection=connection)
+        self.RETRY_POLICY: SapysolClaimRetryPolicy   = retryPolicy if retryPolicy else SapysolClaimRetryPolicy()
+        self.ACCOUNT:      AddressLookupTableAccount = None
+
+    # ========================================
+    #
+    @staticmethod
+    def GetSharedAddresses(distributors: Iterable[SapysolJupiterDistributor]) -> List[Pubkey]:
+        result: List[Pubkey] = [ TOKEN_PROGRAM_ID, ASSOCIATED_TOKEN_PROGRAM_ID, SYS_PROGRAM_ID, COMPUTE_BUDGET_PROGRAM_ID ]
+        for distributor in distributors:
+            result += [ distributor.PUBKEY, distributor.DISTRIBUTOR.token_vault, distributor.DISTRIBUTOR.mint, distributor.CLAIM_ENCODER.program_id ]
+        return list(dict.fromkeys(result))
+
+    # ========================================
+    # `None` if the table does not exist (yet).
+    #
+    def FetchTable(self, address: Pubkey) -> Union[AddressLookupTable, None]:
+        account = FetchAccount(connection=self.CONNECTION, pubkey=address, requiredOwner=LOOKUP_TABLE_PROGRAM_ID)
+        return None if account is None else AddressLookupTable.deserialize(account.data)
+
+    # ========================================
+    # `landed()` is checked before every send, so a send that timed out but
+    # landed is never repeated. A transaction that executed and failed is not
+    # resent, transient failures are retried until the backoff is exhausted.
+    #
+    def __SendAndWait(self, instructions: List[Instruction], lookupTable: Pubkey, landed: Callable[[], bool]) -> None:
+        backoff = self.RETRY_POLICY.GetBackoff(outcome=SapysolClaimOutcome.TRANSIENT)
+        attempt: int = 0
+        while not landed():
+            computePrice: int = self.FEE_ORACLE.GetPrice(accounts=[lookupTable], attempt=attempt)
+            tx: SapysolTx = SapysolTx(connection=self.CONNECTION, payer=self.AUTHORITY, txParams=self.TX_PARAMS)
+            tx.FromInstructionsLegacy(instructions=[ ComputePriceIx(computePrice) ] + instructions)
+            rpcError: RPCException = None
+            try:
+                if tx.Sign([self.AUTHORITY]).WaitForTx() == SapysolTxStatus.SUCCESS:
+                    return
+            except RPCException as e:
+                rpcError = e
+            except Exception as e:
+                print(f"SapysolClaimLookupTable: {str(lookupTable)}: {e}")
+
+            txError = SapysolClaimRetryPolicy.GetTxError(tx=tx, error=rpcError)
+            if txError is not None:
+                if landed():
+                    return
+                raise ValueError(f"SapysolClaimLookupTable: {str(lookupTable)} transaction failed ({txError})!")
+            if backoff.IsExhausted(attempt=attempt):
+                raise ValueError(f"SapysolClaimLookupTable: {str(lookupTable)} transaction did not land after {attempt} retries!")
+            time.sleep(backoff.GetDelay(attempt=attempt))
+            attempt += 1
+
+    # ========================================
+    # Loads an existing table.
+    #
+    def Load(self, address: SapysolPubkey) -> AddressLookupTableAccount:
+        _address: Pubkey = MakePubkey(address)
+        account = FetchAccount(connection=self.CONNECTION, pubkey=_address, requiredOwner=LOOKUP_TABLE_PROGRAM_ID)
+        if account is None:
+            raise ValueError(f"SapysolClaimLookupTable: {str(_address)} is an empty account!")
+        table = AddressLookupTable.deserialize(account.data)
+        self.ACCOUNT = AddressLookupTableAccount(key=_address, addresses=list(table.addresses))
+        return self.ACCOUNT
+
+    # ========================================
+    # Creates a table, extends it in chunks and waits until the new addresses
+    # can be used (one slot after the last extension).
+    #
+    def Create(self, addresses: List[Pubkey]) -> AddressLookupTableAccount:
+        recentSlot: int = self.CONNECTION.get_slot(commitment=Finalized).value
+        authority:  Pubkey = self.AUTHORITY.pubkey()
+        address, _ = derive_lookup_table_address(authority, recentSlot)
+
+        # A create with an expired `recentSlot` can never land
+        def CreateLanded() -> bool:
+            if self.FetchTable(address=address) is not None:
+                return True
+            if self.CONNECTION.get_slot(commitment=Finalized).value - recentSlot >= LOOKUP_TABLE_SLOT_HASHES:
+                raise ValueError(f"SapysolClaimLookupTable: {str(address)} was not created before slot {recentSlot} expired, create again!")
+            return False
+
+        # Extensions are idempotent: addresses already in the table are skipped
+        def ExtendLanded(chunk: List[Pubkey]) -> bool:
+            table = self.FetchTable(address=address)
+            return table is not None and set(chunk).issubset(table.addresses)
+
+        self.__SendAndWait(instructions = [ CreateLookupTableIx(authority=authority, payer=authority, recentSlot=recentSlot) ],
+                           lookupTable  = address,
+                           landed       = CreateLanded)
+        for chunk in ListToChunks(baseList=addresses, chunkSize=LOOKUP_TABLE_EXTEND_CHUNK):
+            self.__SendAndWait(instructions = [ ExtendLookupTableIx(lookupTable=address, authority=authority, payer=authority, addresses=chunk) ],
+                               lookupTable  = address,
+                               landed       = lambda chunk=chunk: ExtendLanded(chunk))
+
+        # RPC node may not see the new account yet
+        while True:
+            table = self.FetchTable(address=address)
+            if table is not None and self.CONNECTION.get_slot().value > table.meta.last_extended_slot:
+                break
+            time.sleep(0.4)
+        return self.Load(address=address)
+
+    # ========================================
+    # Tables created by `Create()` hold rent until closed: deactivate first,
+    # `Close()` returns the rent once the cooldown (~513 slots) has passed.
+    #
+    def Deactivate(self, address: SapysolPubkey) -> None:
+        _address: Pubkey = MakePubkey(address)
+        if self.FetchTable(address=_address) is None:
+            raise ValueError(f"SapysolClaimLookupTable: {str(_address)} is an empty account!")
+        def DeactivateLanded() -> bool:
+            table = self.FetchTable(address=_address)
+            return table is None or table.meta.deactivation_slot != LOOKUP_TABLE_ACTIVE_SLOT
+        self.__SendAndWait(instructions = [ DeactivateLookupTableIx(lookupTable=_address, authority=self.AUTHORITY.pubkey()) ],
+                           lookupTable  = _address,
+                           landed       = DeactivateLanded)
+
+    def Close(self, address: SapysolPubkey, recipient: SapysolPubkey = None) -> None:
+        _address: Pubkey = MakePubkey(address)
+        table = self.FetchTable(address=_address)
+        if table is None:
+            raise ValueError(f"SapysolClaimLookupTable: {str(_address)} is an empty account!")
+        deactivationSlot: int = table.meta.deactivation_slot
+        if deactivationSlot == LOOKUP_TABLE_ACTIVE_SLOT:
+            raise ValueError(f"SapysolClaimLookupTable: {str(_address)} is not deactivated, call `Deactivate()` first!")
+        slotsLeft: int = deactivationSlot + LOOKUP_TABLE_COOLDOWN - self.CONNECTION.get_slot().value
+        if slotsLeft > 0:
+            raise ValueError(f"SapysolClaimLookupTable: {str(_address)} is deactivating, {slotsLeft} slots left!")
+        self.__SendAndWait(instructions = [ CloseLookupTableIx(lookupTable = _address,
+                                                               authority   = self.AUTHORITY.pubkey(),
+                                                               recipient   = MakePubkey(recipient) if recipient else self.AUTHORITY.pubkey()) ],
+                           lookupTable  = _address,
+                           landed       = lambda: self.FetchTable(address=_address) is None)
+
+# =============================================================================
+#
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing             import Iterable, List, Sequence, Tuple, Union
+from   concurrent.futures import ProcessPoolExecutor
+from   sapysol            import SapysolPubkey, MakePubkey, ListToChunks
+import hashlib
+import struct
+import os
+
+# =============================================================================
+# Merkle hashing exactly as in the on-chain `merkle-distributor` program:
+#   node = sha256(claimant || amount_unlocked (u64 le) || amount_locked (u64 le))
+#   leaf = sha256(LEAF_PREFIX || node)
+#   parent(a, b) = sha256(INTERMEDIATE_PREFIX || min(a, b) || max(a, b))
+#
+LEAF_PREFIX:         bytes = b"\x00"
+INTERMEDIATE_PREFIX: bytes = b"\x01"
+
+SapysolMerkleProof = Union[bytes, bytearray, memoryview, Sequence[Sequence[int]]]
+
+# =============================================================================
+#
+def _HashLeafRaw(claimant: bytes, amountUnlocked: int, amountLocked: int) -> bytes:
+    node = hashlib.sha256(claimant + struct.pack("<QQ", amountUnlocked, amountLocked)).digest()
+    return hashlib.sha256(LEAF_PREFIX + node).digest()
+
+def HashLeaf(claimant: SapysolPubkey, amountUnlocked: int, amountLocked: int) -> bytes:
+    return _HashLeafRaw(claimant=bytes(MakePubkey(claimant)), amountUnlocked=amountUnlocked, amountLocked=amountLocked)
+
+def HashIntermediate(a: bytes, b: bytes) -> bytes:
+    return hashlib.sha256(INTERMEDIATE_PREFIX + a + b).digest() if a <= b else \
+           hashlib.sha256(INTERMEDIATE_PREFIX + b + a).digest()
+
+# =============================================================================
+# Proof may come as `List[List[int]]` (API) or as one n*32 bytes blob,
+# the latter is what gets cached and passed to `new_claim`.
+#
+def PackProof(proof: SapysolMerkleProof) -> bytes:
+    if isinstance(proof, (bytes, bytearray, memoryview)):
+        raw = bytes(proof)
+    else:
+        raw = b"".join(bytes(node) for node in proof)
+    if len(raw) % 32 != 0:
+        raise ValueError(f"PackProof(): proof length {len(raw)} is not a multiple of 32!")
+    return raw
+
+def ProofNodes(proof: SapysolMerkleProof) -> List[bytes]:
+    raw = PackProof(proof)
+    return [ raw[i:i+32] for i in range(0, len(raw), 32) ]
+
+# =============================================================================
+#
+def VerifyProof(proof: SapysolMerkleProof, root: Union[bytes, Sequence[int]], leaf: bytes) -> bool:
+    computed = leaf
+    for node in ProofNodes(proof):
+        computed = HashIntermediate(computed, node)
+    return computed == bytes(root)
+
+def VerifyClaim(root:           Union[bytes, Sequence[int]],
+                claimant:       SapysolPubkey,
+                amountUnlocked: int,
+                amountLocked:   int,
+                proof:          SapysolMerkleProof) -> bool:
+    return VerifyProof(proof=proof, root=root, leaf=HashLeaf(claimant=claimant, amountUnlocked=amountUnlocked, amountLocked=amountLocked))
+
+# =============================================================================
+# Bulk verification.
+# Each entry is (root, claimant, amountUnlocked, amountLocked, proof), result
+# list keeps input order. Large lists are split into chunks and verified
+# across a process pool, small ones are verified in-process.
+#
+SapysolMerkleClaimEntry = Tuple[Union[bytes, Sequence[int]], SapysolPubkey, int, int, SapysolMerkleProof]
+
+def _VerifyClaimsChunk(entries: List[Tuple[bytes, bytes, int, int, bytes]]) -> List[bool]:
+    return [ VerifyProof(proof=proof, root=root, leaf=_HashLeafRaw(claimant=claimant, amountUnlocked=unlocked, amountLocked=locked))
+             for root, claimant, unlocked, locked, proof in entries ]
+
+def VerifyClaimsBulk(entries:      Iterable[SapysolMerkleClaimEntry],
+                     numProcesses: int = None,
+                     chunkSize:    int = 5000) -> List[bool]:
+
+    # Pickle-friendly form: everything as plain bytes/ints
+    packed = [ (bytes(root), bytes(MakePubkey(claimant)), unlocked, locked, PackProof(proof))
+               for root, claimant, unlocked, locked, proof in entries ]
+    if len(packed) <= chunkSize:
+        return _VerifyClaimsChunk(packed)
+
+    results: List[bool] = []
+    with ProcessPoolExecutor(max_workers=numProcesses if numProcesses else os.cpu_count()) as executor:
+        for chunkResult in executor.map(_VerifyClaimsChunk, ListToChunks(baseList=packed, chunkSize=chunkSize)):
+            results += chunkResult
+    return results
+
+# =============================================================================
+#
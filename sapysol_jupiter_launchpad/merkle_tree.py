@@ -0,0 +1,232 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing                   import Iterable, List, Tuple, Union
+from   concurrent.futures       import ProcessPoolExecutor
+from   array                    import array
+from   solana.rpc.api           import Pubkey
+from   sapysol                  import SapysolPubkey, MakePubkey, ListToChunks
+from  .merkle                   import INTERMEDIATE_PREFIX, _HashLeafRaw
+from  .anchorpy_v2.instructions import NewDistributorArgs
+import hashlib
+import struct
+import mmap
+import os
+
+SapysolMerkleAllocation = Tuple[SapysolPubkey, int, int] # (claimant, amount_unlocked, amount_locked)
+
+# =============================================================================
+#
+def _HashLeavesChunk(entries: List[Tuple[bytes, int, int]]) -> bytes:
+    return b"".join(_HashLeafRaw(claimant=c, amountUnlocked=u, amountLocked=l) for c, u, l in entries)
+
+# Level chunk always starts at an even node index; only the very last chunk
+# of a level may have an odd node count, its last node is paired with itself.
+def _HashLevelChunk(level: bytes) -> bytes:
+    sha256 = hashlib.sha256
+    result = bytearray()
+    for i in range(0, len(level), 64):
+        a = level[i:i+32]
+        b = level[i+32:i+64] or a
+        result += sha256(INTERMEDIATE_PREFIX + a + b).digest() if a <= b else \
+                  sha256(INTERMEDIATE_PREFIX + b + a).digest()
+    return bytes(result)
+
+# =============================================================================
+# Distributor Merkle tree in the on-chain program's hashing format.
+#
+# Leaves are sorted by claimant, so proof records can be found with binary
+# search (see `SapysolMerkleProofFile`). Leaf and level hashing is done in
+# batches across a process pool for large allocation lists.
+# Every proof in this tree has the same length (= `DEPTH`), odd levels pair
+# their last node with itself.
+#
+class SapysolMerkleTree:
+    def __init__(self,
+                 allocations:  Iterable[SapysolMerkleAllocation],
+                 numProcesses: int = None,
+                 chunkSize:    int = 50_000):
+
+        entries = sorted(((bytes(MakePubkey(c)), u, l) for c, u, l in allocations), key=lambda e: e[0])
+        if not entries:
+            raise ValueError("SapysolMerkleTree: allocation list is empty!")
+        for i in range(1, len(entries)):
+            if entries[i][0] == entries[i-1][0]:
+                raise ValueError(f"SapysolMerkleTree: duplicate claimant {Pubkey.from_bytes(entries[i][0])}!")
+
+        self.NUM_LEAVES:      int         = len(entries)
+        self.CLAIMANTS:       bytes       = b"".join(e[0] for e in entries)
+        self.AMOUNTS:         array       = array("Q", (a for e in entries for a in (e[1], e[2])))
+        self.MAX_TOTAL_CLAIM: int         = sum(self.AMOUNTS)
+        self.MAX_NUM_NODES:   int         = self.NUM_LEAVES
+        self.LEVELS:          List[bytes] = []
+
+        useProcesses: bool = numProcesses != 1 and self.NUM_LEAVES > chunkSize
+        executor = ProcessPoolExecutor(max_workers=numProcesses if numProcesses else os.cpu_count()) if useProcesses else None
+        try:
+            if executor:
+                level = b"".join(executor.map(_HashLeavesChunk, ListToChunks(baseList=entries, chunkSize=chunkSize)))
+            else:
+                level = _HashLeavesChunk(entries)
+            del entries
+            self.LEVELS.append(level)
+
+            while len(level) > 32:
+                chunkBytes = chunkSize * 64
+                if executor and len(level) > chunkBytes:
+                    level = b"".join(executor.map(_HashLevelChunk, [level[i:i+chunkBytes] for i in range(0, len(level), chunkBytes)]))
+                else:
+                    level = _HashLevelChunk(level)
+                self.LEVELS.append(level)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.ROOT:  bytes = self.LEVELS[-1]
+        self.DEPTH: int   = len(self.LEVELS) - 1
+
+    # ========================================
+    # Root as `list[int]`, ready for `NewDistributorArgs.root`.
+    #
+    def GetRootList(self) -> list[int]:
+        return list(self.ROOT)
+
+    # ========================================
+    # Args for `new_distributor` with root and limits taken from this tree.
+    #
+    def GetNewDistributorArgs(self,
+                              version:         int,
+                              startVestingTs:  int,
+                              endVestingTs:    int,
+                              clawbackStartTs: int,
+                              enableSlot:      int  = 0,
+                              closable:        bool = False) -> NewDistributorArgs:
+        return NewDistributorArgs(version           = version,
+                                  root              = self.GetRootList(),
+                                  max_total_claim   = self.MAX_TOTAL_CLAIM,
+                                  max_num_nodes     = self.MAX_NUM_NODES,
+                                  start_vesting_ts  = startVestingTs,
+                                  end_vesting_ts    = endVestingTs,
+                                  clawback_start_ts = clawbackStartTs,
+                                  enable_slot       = enableSlot,
+                                  closable          = closable)
+
+    # ========================================
+    #
+    def GetIndex(self, claimant: SapysolPubkey) -> Union[int, None]:
+        return _BisectClaimant(data=self.CLAIMANTS, offset=0, stride=32, count=self.NUM_LEAVES, claimant=bytes(MakePubkey(claimant)))
+
+    def GetClaimant(self, index: int) -> Pubkey:
+        return Pubkey.from_bytes(self.CLAIMANTS[index*32:(index+1)*32])
+
+    def GetAmounts(self, index: int) -> Tuple[int, int]:
+        return self.AMOUNTS[2*index], self.AMOUNTS[2*index+1]
+
+    # ========================================
+    # Proof as one `DEPTH*32` bytes blob.
+    #
+    def GetProof(self, index: int) -> bytes:
+        proof = bytearray()
+        for level in self.LEVELS[:-1]:
+            sibling = index ^ 1
+            if sibling * 32 >= len(level):
+                sibling = index
+            proof += level[sibling*32:(sibling+1)*32]
+            index >>= 1
+        return bytes(proof)
+
+    # ========================================
+    # Writes all proofs as fixed-size records (see `SapysolMerkleProofFile`).
+    #
+    def WriteProofsFile(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(PROOF_FILE_HEADER.pack(PROOF_FILE_MAGIC, self.NUM_LEAVES, self.DEPTH, self.ROOT))
+            for index in range(self.NUM_LEAVES):
+                unlocked, locked = self.GetAmounts(index)
+                f.write(self.CLAIMANTS[index*32:(index+1)*32])
+                f.write(PROOF_RECORD_AMOUNTS.pack(unlocked, locked))
+                f.write(self.GetProof(index))
+
+# =============================================================================
+# Proof file layout (little-endian):
+#   header: magic (8) | num_leaves u64 | depth u32 | root (32)
+#   record: claimant (32) | amount_unlocked u64 | amount_locked u64 | proof (depth*32)
+# Records are sorted by claimant and have fixed size, so the file is
+# memory-mapped and searched in place without loading it.
+#
+PROOF_FILE_MAGIC:     bytes         = b"SJLPRF01"
+PROOF_FILE_HEADER:    struct.Struct = struct.Struct("<8sQI32s")
+PROOF_RECORD_AMOUNTS: struct.Struct = struct.Struct("<QQ")
+
+def _BisectClaimant(data: Union[bytes, mmap.mmap], offset: int, stride: int, count: int, claimant: bytes) -> Union[int, None]:
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = offset + mid * stride
+        if data[pos:pos+32] < claimant:
+            lo = mid + 1
+        else:
+            hi = mid
+    pos = offset + lo * stride
+    return lo if lo < count and data[pos:pos+32] == claimant else None
+
+# =============================================================================
+#
+class SapysolMerkleProofFile:
+    def __init__(self, path: str):
+        self.PATH: str       = path
+        self.FILE            = open(path, "rb")
+        self.MMAP: mmap.mmap = mmap.mmap(self.FILE.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, numLeaves, depth, root = PROOF_FILE_HEADER.unpack_from(self.MMAP, 0)
+        if magic != PROOF_FILE_MAGIC:
+            raise ValueError(f"SapysolMerkleProofFile: {path} is not a proof file!")
+        self.NUM_LEAVES:  int   = numLeaves
+        self.DEPTH:       int   = depth
+        self.ROOT:        bytes = root
+        self.RECORD_SIZE: int   = 32 + PROOF_RECORD_AMOUNTS.size + depth * 32
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return self.NUM_LEAVES
+
+    def __RecordOffset(self, index: int) -> int:
+        if index < 0 or index >= self.NUM_LEAVES:
+            raise IndexError(f"SapysolMerkleProofFile: index {index} is out of range!")
+        return PROOF_FILE_HEADER.size + index * self.RECORD_SIZE
+
+    # ========================================
+    #
+    def GetIndex(self, claimant: SapysolPubkey) -> Union[int, None]:
+        return _BisectClaimant(data     = self.MMAP,
+                               offset   = PROOF_FILE_HEADER.size,
+                               stride   = self.RECORD_SIZE,
+                               count    = self.NUM_LEAVES,
+                               claimant = bytes(MakePubkey(claimant)))
+
+    # ========================================
+    # Returns (claimant, amount_unlocked, amount_locked, proof), proof is a
+    # depth*32 bytes copy, so records stay valid after `Close()`.
+    #
+    def GetRecord(self, index: int) -> Tuple[Pubkey, int, int, bytes]:
+        pos = self.__RecordOffset(index)
+        unlocked, locked = PROOF_RECORD_AMOUNTS.unpack_from(self.MMAP, pos + 32)
+        proofPos = pos + 32 + PROOF_RECORD_AMOUNTS.size
+        return (Pubkey.from_bytes(self.MMAP[pos:pos+32]),
+                unlocked,
+                locked,
+                self.MMAP[proofPos:proofPos + self.DEPTH*32])
+
+    def GetClaimantRecord(self, claimant: SapysolPubkey) -> Union[Tuple[Pubkey, int, int, bytes], None]:
+        index = self.GetIndex(claimant=claimant)
+        return None if index is None else self.GetRecord(index=index)
+
+    # ========================================
+    #
+    def Close(self) -> None:
+        self.MMAP.close()
+        self.FILE.close()
+
+# =============================================================================
+#
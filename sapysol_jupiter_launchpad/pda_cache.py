@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing             import Callable, Iterable, List, Tuple, Union
+from   collections        import OrderedDict
+from   concurrent.futures import ProcessPoolExecutor
+from   solana.rpc.api     import Pubkey
+from   sapysol            import ListToChunks, EnsurePathExists
+import threading
+import os
+
+SapysolPdaKey = Tuple[Pubkey, Pubkey, Pubkey] # (program, wallet, distributor)
+
+# =============================================================================
+#
+def _DeriveClaimStatusChunk(entries: List[Tuple[bytes, bytes, bytes]]) -> List[bytes]:
+    return [ bytes(Pubkey.find_program_address(seeds      = [b"ClaimStatus", wallet, distributor],
+                                               program_id = Pubkey.from_bytes(program))[0])
+             for program, wallet, distributor in entries ]
+
+# =============================================================================
+# Bounded LRU of derived ClaimStatus PDAs keyed by (program, wallet, distributor).
+# `find_program_address` runs a bump-seed search, so every result is kept and
+# can be saved to disk to skip derivation entirely on reruns.
+# File format: plain sequence of 128-byte records (program | wallet | distributor | pda).
+#
+class SapysolPdaCache:
+    def __init__(self, maxSize: int = 200_000):
+        self.MAX_SIZE: int                                = maxSize
+        self.LOCK:     threading.Lock                     = threading.Lock()
+        self.ENTRIES:  OrderedDict[SapysolPdaKey, Pubkey] = OrderedDict()
+
+    # ========================================
+    #
+    @staticmethod
+    def DefaultPath() -> str:
+        path = os.path.join(os.path.expanduser("~"), ".sapysol", "jupiter_launchpad")
+        EnsurePathExists(path)
+        return os.path.join(path, "claim_status_pda.bin")
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return len(self.ENTRIES)
+
+    def Get(self, key: SapysolPdaKey) -> Union[Pubkey, None]:
+        with self.LOCK:
+            pda = self.ENTRIES.get(key)
+            if pda is not None:
+                self.ENTRIES.move_to_end(key)
+            return pda
+
+    def Put(self, key: SapysolPdaKey, pda: Pubkey) -> None:
+        with self.LOCK:
+            self.ENTRIES[key] = pda
+            self.ENTRIES.move_to_end(key)
+            while len(self.ENTRIES) > self.MAX_SIZE:
+                self.ENTRIES.popitem(last=False)
+
+    # ========================================
+    #
+    def GetOrDerive(self, key: SapysolPdaKey, derive: Callable[[], Pubkey]) -> Pubkey:
+        pda = self.Get(key=key)
+        if pda is None:
+            pda = derive()
+            self.Put(key=key, pda=pda)
+        return pda
+
+    # ========================================
+    # Bulk derivation, only cache misses are derived, in chunks across a
+    # process pool when there are enough of them.
+    #
+    def DeriveClaimStatusBatch(self,
+                               programId:          Pubkey,
+                               walletAddresses:    Iterable[Pubkey],
+                               distributorAddress: Pubkey,
+                               numProcesses:       int = None,
+                               chunkSize:          int = 2000) -> List[Pubkey]:
+
+        keys:    List[SapysolPdaKey] = [ (programId, wallet, distributorAddress) for wallet in walletAddresses ]
+        results: List[Pubkey]        = [ self.Get(key=key) for key in keys ]
+        missing: List[int]           = [ i for i, pda in enumerate(results) if pda is None ]
+        if not missing:
+            return results
+
+        packed = [ (bytes(programId), bytes(keys[i][1]), bytes(distributorAddress)) for i in missing ]
+        if numProcesses == 1 or len(packed) <= chunkSize:
+            derived = _DeriveClaimStatusChunk(packed)
+        else:
+            derived = []
+            with ProcessPoolExecutor(max_workers=numProcesses if numProcesses else os.cpu_count()) as executor:
+                for chunkResult in executor.map(_DeriveClaimStatusChunk, ListToChunks(baseList=packed, chunkSize=chunkSize)):
+                    derived += chunkResult
+
+        for i, pda in zip(missing, derived):
+            results[i] = Pubkey.from_bytes(pda)
+            self.Put(key=keys[i], pda=results[i])
+        return results
+
+    # ========================================
+    #
+    def Save(self, path: str = None) -> None:
+        with self.LOCK:
+            entries = list(self.ENTRIES.items())
+        with open(path if path else SapysolPdaCache.DefaultPath(), "wb") as f:
+            for (program, wallet, distributor), pda in entries:
+                f.write(bytes(program) + bytes(wallet) + bytes(distributor) + bytes(pda))
+
+    def Load(self, path: str = None) -> None:
+        _path = path if path else SapysolPdaCache.DefaultPath()
+        if not os.path.isfile(_path):
+            return
+        with open(_path, "rb") as f:
+            data = f.read()
+        for pos in range(0, len(data) - len(data) % 128, 128):
+            key = (Pubkey.from_bytes(data[pos   :pos+32]),
+                   Pubkey.from_bytes(data[pos+32:pos+64]),
+                   Pubkey.from_bytes(data[pos+64:pos+96]))
+            self.Put(key=key, pda=Pubkey.from_bytes(data[pos+96:pos+128]))
+
+# =============================================================================
+# Process-wide cache shared by `anchorpy_v1.derive` and `anchorpy_v2.derive`.
+#
+CLAIM_STATUS_PDA_CACHE: SapysolPdaCache = SapysolPdaCache()
+
+# =============================================================================
+#
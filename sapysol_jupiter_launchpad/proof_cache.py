@@ -0,0 +1,203 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing          import Any, Dict, Iterable, List, Tuple, Union
+from   solana.rpc.api  import Pubkey
+from   sapysol         import SapysolPubkey, MakePubkey, EnsurePathExists
+from  .merkle          import PackProof
+import threading
+import sqlite3
+import time
+import os
+
+DEFAULT_NEGATIVE_TTL: float = 3600
+
+# =============================================================================
+# Process-wide negative cache: (mint, wallet) pairs known to have no
+# distribution, with an expiry time. Always consulted by proof lookups, so
+# other batchers in the same process skip those wallets even without a
+# persistent `SapysolLfgProofCache`.
+#
+class SapysolNoDistributionCache:
+    def __init__(self, ttl: float = DEFAULT_NEGATIVE_TTL):
+        self.TTL:     float                            = ttl
+        self.LOCK:    threading.Lock                   = threading.Lock()
+        self.ENTRIES: Dict[Tuple[bytes, bytes], float] = {}
+
+    # ========================================
+    #
+    @staticmethod
+    def __Key(tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> Tuple[bytes, bytes]:
+        return bytes(MakePubkey(tokenMint)), bytes(MakePubkey(walletAddress))
+
+    # `None` if unknown, expired entries are dropped
+    def GetExpiry(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> Union[float, None]:
+        key = SapysolNoDistributionCache.__Key(tokenMint, walletAddress)
+        with self.LOCK:
+            expiresAt = self.ENTRIES.get(key)
+            if expiresAt is not None and expiresAt <= time.time():
+                del self.ENTRIES[key]
+                return None
+            return expiresAt
+
+    def Contains(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> bool:
+        return self.GetExpiry(tokenMint=tokenMint, walletAddress=walletAddress) is not None
+
+    def Put(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey, expiresAt: float = None) -> None:
+        key = SapysolNoDistributionCache.__Key(tokenMint, walletAddress)
+        with self.LOCK:
+            self.ENTRIES[key] = expiresAt if expiresAt is not None else time.time() + self.TTL
+
+    def Clear(self) -> None:
+        with self.LOCK:
+            self.ENTRIES.clear()
+
+# =============================================================================
+# Persistent (mint, wallet) -> proof cache.
+# Proofs for a given mint and wallet never change, so once fetched they are
+# stored in SQLite and reused by every later run.
+# Distributor address is stored as 32 raw bytes, proof as one blob of n*32 bytes.
+#
+# Wallets without distribution are kept on disk with a TTL (later runs) and in
+# `NO_DISTRIBUTION_CACHE` (other batchers in the same process).
+#
+class SapysolLfgProofCache:
+    def __init__(self, path: str = None, negativeTtl: float = DEFAULT_NEGATIVE_TTL):
+        self.PATH:         str                = path if path else SapysolLfgProofCache.DefaultPath()
+        self.NEGATIVE_TTL: float              = negativeTtl
+        self.LOCK:         threading.Lock     = threading.Lock()
+        self.DB:           sqlite3.Connection = sqlite3.connect(self.PATH, check_same_thread=False)
+        with self.LOCK:
+            self.DB.execute("PRAGMA journal_mode=WAL")
+            self.DB.execute("PRAGMA synchronous=NORMAL")
+            self.DB.execute("CREATE TABLE IF NOT EXISTS proofs ("
+                            "  mint        BLOB    NOT NULL,"
+                            "  wallet      BLOB    NOT NULL,"
+                            "  distributor BLOB    NOT NULL,"
+                            "  amount      INTEGER NOT NULL,"
+                            "  proof       BLOB    NOT NULL,"
+                            "  PRIMARY KEY (mint, wallet)"
+                            ") WITHOUT ROWID")
+            self.DB.execute("CREATE TABLE IF NOT EXISTS no_distribution ("
+                            "  mint       BLOB NOT NULL,"
+                            "  wallet     BLOB NOT NULL,"
+                            "  expires_at REAL NOT NULL,"
+                            "  PRIMARY KEY (mint, wallet)"
+                            ") WITHOUT ROWID")
+            self.DB.commit()
+
+    # ========================================
+    #
+    @staticmethod
+    def DefaultPath() -> str:
+        path = os.path.join(os.path.expanduser("~"), ".sapysol", "jupiter_launchpad")
+        EnsurePathExists(path)
+        return os.path.join(path, "proofs.sqlite3")
+
+    # ========================================
+    #
+    @staticmethod
+    def __PackRow(tokenMint: Pubkey, walletAddress: SapysolPubkey, response: Dict[str, Any]) -> Tuple[bytes, bytes, bytes, int, bytes]:
+        if response.get("amount_locked", 0):
+            raise ValueError(f"SapysolLfgProofCache: {str(walletAddress)} has a locked amount, only unlocked amounts can be cached!")
+        return (bytes(tokenMint),
+                bytes(MakePubkey(walletAddress)),
+                bytes(MakePubkey(response["merkle_tree"])),
+                response["amount"],
+                PackProof(response["proof"]))
+
+    @staticmethod
+    def __UnpackRow(distributor: bytes, amount: int, proof: bytes) -> Dict[str, Any]:
+        return {
+            "merkle_tree": str(Pubkey.from_bytes(distributor)),
+            "amount":      amount,
+            "proof":       proof,
+        }
+
+    # ========================================
+    # Returns cached `jup-claim-proof`-like response or `None` on cache miss,
+    # `proof` is returned as n*32 bytes.
+    #
+    def Get(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> Union[Dict[str, Any], None]:
+        with self.LOCK:
+            row = self.DB.execute("SELECT distributor, amount, proof FROM proofs WHERE mint=? AND wallet=?",
+                                  (bytes(MakePubkey(tokenMint)), bytes(MakePubkey(walletAddress)))).fetchone()
+        return None if row is None else SapysolLfgProofCache.__UnpackRow(*row)
+
+    # ========================================
+    #
+    def Put(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey, response: Dict[str, Any]) -> None:
+        self.PutMany(tokenMint=tokenMint, entries=[(walletAddress, response)])
+
+    # ========================================
+    # Bulk warm-up, all entries are written in a single transaction.
+    #
+    def PutMany(self, tokenMint: SapysolPubkey, entries: Iterable[Tuple[SapysolPubkey, Dict[str, Any]]]) -> None:
+        _tokenMint: Pubkey = MakePubkey(tokenMint)
+        rows = [SapysolLfgProofCache.__PackRow(_tokenMint, wallet, response) for wallet, response in entries]
+        with self.LOCK:
+            self.DB.executemany("INSERT OR REPLACE INTO proofs (mint, wallet, distributor, amount, proof) VALUES (?, ?, ?, ?, ?)", rows)
+            self.DB.commit()
+
+    # ========================================
+    # `True` if wallet is known (and not expired) to have no distribution.
+    #
+    def IsNoDistribution(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> bool:
+        if NO_DISTRIBUTION_CACHE.Contains(tokenMint=tokenMint, walletAddress=walletAddress):
+            return True
+        with self.LOCK:
+            row = self.DB.execute("SELECT expires_at FROM no_distribution WHERE mint=? AND wallet=?",
+                                  (bytes(MakePubkey(tokenMint)), bytes(MakePubkey(walletAddress)))).fetchone()
+        if row is None or row[0] <= time.time():
+            return False
+        NO_DISTRIBUTION_CACHE.Put(tokenMint=tokenMint, walletAddress=walletAddress, expiresAt=row[0])
+        return True
+
+    # ========================================
+    #
+    def PutNoDistribution(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> None:
+        self.PutNoDistributionMany(tokenMint=tokenMint, walletAddresses=[walletAddress])
+
+    def PutNoDistributionMany(self, tokenMint: SapysolPubkey, walletAddresses: Iterable[SapysolPubkey]) -> None:
+        _tokenMint: bytes = bytes(MakePubkey(tokenMint))
+        expiresAt:  float = time.time() + self.NEGATIVE_TTL
+        rows:       List[Tuple[bytes, bytes, float]] = []
+        for walletAddress in walletAddresses:
+            NO_DISTRIBUTION_CACHE.Put(tokenMint=tokenMint, walletAddress=walletAddress, expiresAt=expiresAt)
+            rows.append((_tokenMint, bytes(MakePubkey(walletAddress)), expiresAt))
+        with self.LOCK:
+            self.DB.executemany("INSERT OR REPLACE INTO no_distribution (mint, wallet, expires_at) VALUES (?, ?, ?)", rows)
+            self.DB.commit()
+
+    # ========================================
+    # Drops expired negative entries from disk.
+    #
+    def PurgeExpired(self) -> None:
+        with self.LOCK:
+            self.DB.execute("DELETE FROM no_distribution WHERE expires_at <= ?", (time.time(),))
+            self.DB.commit()
+
+    # ========================================
+    # Returns wallets from `walletAddresses` that still need a proof lookup,
+    # i.e. neither cached nor known (and not expired) to have no distribution.
+    #
+    def GetMissing(self, tokenMint: SapysolPubkey, walletAddresses: Iterable[SapysolPubkey]) -> List[Pubkey]:
+        _tokenMint: bytes = bytes(MakePubkey(tokenMint))
+        with self.LOCK:
+            cached  = { row[0] for row in self.DB.execute("SELECT wallet FROM proofs WHERE mint=?", (_tokenMint,)) }
+            cached |= { row[0] for row in self.DB.execute("SELECT wallet FROM no_distribution WHERE mint=? AND expires_at > ?", (_tokenMint, time.time())) }
+        return [ MakePubkey(w) for w in walletAddresses if bytes(MakePubkey(w)) not in cached ]
+
+    # ========================================
+    #
+    def Close(self) -> None:
+        with self.LOCK:
+            self.DB.close()
+
+# =============================================================================
+# Process-wide default negative cache.
+#
+NO_DISTRIBUTION_CACHE: SapysolNoDistributionCache = SapysolNoDistributionCache()
+
+# =============================================================================
+#
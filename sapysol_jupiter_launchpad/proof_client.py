@@ -0,0 +1,56 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing            import Any, Union
+from   requests.adapters import HTTPAdapter
+from   sapysol           import SapysolPubkey
+import requests
+
+LFG_PROOF_URL: str = "https://worker.jup.ag/jup-claim-proof"
+
+# =============================================================================
+# Shared keep-alive HTTP client for `jup-claim-proof` lookups.
+# One `requests.Session` with a connection pool sized to the number of
+# threads that use it, so every thread reuses already open TCP+TLS
+# connections instead of doing a new handshake per wallet.
+#
+class SapysolLfgProofClient:
+    def __init__(self,
+                 numConnections: int   = 20,
+                 connectTimeout: float = 5.0,
+                 readTimeout:    float = 15.0,
+                 baseUrl:        str   = LFG_PROOF_URL):
+
+        self.BASE_URL: str                 = baseUrl.rstrip("/")
+        self.TIMEOUT:  tuple[float, float] = (connectTimeout, readTimeout)
+        self.SESSION:  requests.Session    = requests.Session()
+        self.SESSION.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(pool_connections = 1,
+                              pool_maxsize     = max(1, numConnections),
+                              pool_block       = True)
+        self.SESSION.mount("https://", adapter)
+        self.SESSION.mount("http://",  adapter)
+
+    # ========================================
+    # Returns parsed JSON response or `None` when there is no distribution
+    # for the wallet (404 or empty successful body), other HTTP errors are raised.
+    #
+    def FetchProof(self, tokenMint: SapysolPubkey, walletAddress: SapysolPubkey) -> Union[dict[str, Any], None]:
+        r: requests.Response = self.SESSION.get(f"{self.BASE_URL}/{str(tokenMint)}/{str(walletAddress)}", timeout=self.TIMEOUT)
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.json() if r.text else None
+
+    # ========================================
+    #
+    def Close(self) -> None:
+        self.SESSION.close()
+
+# =============================================================================
+# Process-wide default client, used when no client is injected explicitly.
+#
+DEFAULT_PROOF_CLIENT: SapysolLfgProofClient = SapysolLfgProofClient()
+
+# =============================================================================
+#
@@ -0,0 +1,171 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing               import Any, AsyncIterator, Dict, List, Tuple, Union
+from   solana.rpc.api       import Pubkey
+from   sapysol              import SapysolPubkey, SapysolKeypair, MakePubkey, MakeKeypair
+from  .proof_client         import LFG_PROOF_URL
+from  .distributor_batcher  import SapysolLfgProofParams
+from  .proof_cache          import SapysolLfgProofCache, NO_DISTRIBUTION_CACHE
+from  .proof_store          import SapysolLfgProofStore
+import asyncio
+import httpx
+
+# =============================================================================
+# Async counterpart of `SapysolLfgProofClient`.
+# All requests share one `httpx.AsyncClient` on a single event loop, the number
+# of requests in flight is capped by `maxInFlight`.
+#
+class SapysolLfgProofClientAsync:
+    def __init__(self,
+                 maxInFlight:    int   = 200,
+                 connectTimeout: float = 5.0,
+                 readTimeout:    float = 15.0,
+                 baseUrl:        str   = LFG_PROOF_URL):
+
+        self.BASE_URL:      str           = baseUrl.rstrip("/")
+        self.MAX_IN_FLIGHT: int           = max(1, maxInFlight)
+        self.TIMEOUT:       httpx.Timeout = httpx.Timeout(readTimeout, connect=connectTimeout)
+        self.LIMITS:        httpx.Limits  = httpx.Limits(max_connections           = self.MAX_IN_FLIGHT,
+                                                         max_keepalive_connections = self.MAX_IN_FLIGHT)
+
+    # ========================================
+    #
+    def MakeSession(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.TIMEOUT, limits=self.LIMITS)
+
+    # ========================================
+    # Returns parsed JSON response or `None` when there is no distribution
+    # (404 or empty successful body), other HTTP errors are raised.
+    #
+    async def FetchProof(self,
+                         session:       httpx.AsyncClient,
+                         tokenMint:     SapysolPubkey,
+                         walletAddress: SapysolPubkey) -> Union[dict[str, Any], None]:
+        r: httpx.Response = await session.get(f"{self.BASE_URL}/{str(tokenMint)}/{str(walletAddress)}")
+        if r.status_code == 404:
+            return None
+        r.raise_for_status()
+        return r.json() if r.text else None
+
+# =============================================================================
+# Resolves `SapysolLfgProofParams` for a whole wallet list on one event loop.
+# Results are yielded as soon as they complete (not in input order).
+# When `proofCache` is given, cached wallets are served without HTTP and every
+# fetched proof is stored, which makes it a bulk warm-up for the cache.
+# When `proofStore` is given, every found proof is also interned there, so
+# `FetchIntoStore` can hold proofs for millions of wallets in memory.
+#
+class SapysolLfgProofFetcherAsync:
+    def __init__(self,
+                 tokenMint:   SapysolPubkey,
+                 proofClient: SapysolLfgProofClientAsync = None,
+                 maxInFlight: int = 200,
+                 proofCache:  SapysolLfgProofCache = None,
+                 proofStore:  SapysolLfgProofStore = None):
+
+        self.TOKEN_MINT:    Pubkey                     = MakePubkey(tokenMint)
+        self.PROOF_CLIENT:  SapysolLfgProofClientAsync = proofClient if proofClient else SapysolLfgProofClientAsync(maxInFlight=maxInFlight)
+        self.MAX_IN_FLIGHT: int                        = min(max(1, maxInFlight), self.PROOF_CLIENT.MAX_IN_FLIGHT)
+        self.PROOF_CACHE:   SapysolLfgProofCache       = proofCache
+        self.PROOF_STORE:   SapysolLfgProofStore       = proofStore
+
+    # ========================================
+    #
+    @staticmethod
+    def __WalletAddress(wallet: Union[SapysolKeypair, SapysolPubkey]) -> Pubkey:
+        try:
+            return MakePubkey(wallet)
+        except:
+            return MakeKeypair(wallet).pubkey()
+
+    # ========================================
+    #
+    async def __FetchSingle(self, session: httpx.AsyncClient, walletAddress: Pubkey) -> Tuple[Pubkey, SapysolLfgProofParams]:
+        walletAddress, response = await self.__FetchResponse(session=session, walletAddress=walletAddress)
+        if response is not None and self.PROOF_STORE is not None:
+            self.PROOF_STORE.Put(walletAddress=walletAddress, response=response)
+        return walletAddress, SapysolLfgProofParams.FromResponse(response=response)
+
+    # ========================================
+    # SQLite calls block, so they run in worker threads (`asyncio.to_thread`)
+    # and never stall the event loop. Returns `(hit, response)`.
+    #
+    def __CacheGet(self, walletAddress: Pubkey) -> Tuple[bool, Union[dict, None]]:
+        if self.PROOF_CACHE.IsNoDistribution(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress):
+            return True, None
+        response = self.PROOF_CACHE.Get(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress)
+        return response is not None, response
+
+    def __CachePut(self, walletAddress: Pubkey, response: Union[dict, None]) -> None:
+        if response is None:
+            self.PROOF_CACHE.PutNoDistribution(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress)
+        else:
+            self.PROOF_CACHE.Put(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress, response=response)
+
+    async def __FetchResponse(self, session: httpx.AsyncClient, walletAddress: Pubkey) -> Tuple[Pubkey, Union[dict, None]]:
+        if NO_DISTRIBUTION_CACHE.Contains(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress):
+            return walletAddress, None
+        if self.PROOF_CACHE is not None:
+            hit, response = await asyncio.to_thread(self.__CacheGet, walletAddress)
+            if hit:
+                return walletAddress, response
+
+        response = await self.PROOF_CLIENT.FetchProof(session=session, tokenMint=self.TOKEN_MINT, walletAddress=walletAddress)
+        if self.PROOF_CACHE is not None:
+            await asyncio.to_thread(self.__CachePut, walletAddress, response)
+        elif response is None:
+            NO_DISTRIBUTION_CACHE.Put(tokenMint=self.TOKEN_MINT, walletAddress=walletAddress)
+        return walletAddress, response
+
+    # ========================================
+    # Keeps at most `MAX_IN_FLIGHT` requests running, new ones are scheduled
+    # only when previous ones finish, so memory does not grow with list size.
+    #
+    async def FetchIter(self, walletsList: List[Union[SapysolKeypair, SapysolPubkey]]) -> AsyncIterator[Tuple[Pubkey, SapysolLfgProofParams]]:
+        pending: set = set()
+        async with self.PROOF_CLIENT.MakeSession() as session:
+            try:
+                for wallet in walletsList:
+                    if len(pending) >= self.MAX_IN_FLIGHT:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield task.result()
+                    pending.add(asyncio.ensure_future(self.__FetchSingle(session=session, walletAddress=self.__WalletAddress(wallet))))
+
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+    # ========================================
+    #
+    async def FetchAllAsync(self, walletsList: List[Union[SapysolKeypair, SapysolPubkey]]) -> Dict[Pubkey, SapysolLfgProofParams]:
+        return { walletAddress: params async for walletAddress, params in self.FetchIter(walletsList=walletsList) }
+
+    # ========================================
+    # Fills `PROOF_STORE` without keeping per-wallet params around, returns
+    # number of wallets with distribution.
+    #
+    async def FetchIntoStoreAsync(self, walletsList: List[Union[SapysolKeypair, SapysolPubkey]]) -> int:
+        if self.PROOF_STORE is None:
+            raise ValueError("SapysolLfgProofFetcherAsync: `proofStore` is not set!")
+        found: int = 0
+        async for _, params in self.FetchIter(walletsList=walletsList):
+            found += 1 if params.IsValid() else 0
+        return found
+
+    def FetchIntoStore(self, walletsList: List[Union[SapysolKeypair, SapysolPubkey]]) -> int:
+        return asyncio.run(self.FetchIntoStoreAsync(walletsList=walletsList))
+
+    # ========================================
+    # Blocking wrapper for code that does not run its own event loop.
+    #
+    def FetchAll(self, walletsList: List[Union[SapysolKeypair, SapysolPubkey]]) -> Dict[Pubkey, SapysolLfgProofParams]:
+        return asyncio.run(self.FetchAllAsync(walletsList=walletsList))
+
+# =============================================================================
+#
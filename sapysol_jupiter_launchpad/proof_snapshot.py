@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing          import Any, Dict, Iterator, Literal, TextIO, Tuple, Union
+from   solana.rpc.api  import Pubkey
+from   sapysol         import SapysolPubkey, MakePubkey
+from  .merkle         import PackProof
+import json
+import csv
+import os
+
+SapysolLfgSnapshotFormat = Literal["auto", "json", "jsonl", "csv"]
+
+# =============================================================================
+# Local allocation snapshot (full proof dump) indexed by wallet.
+#
+# Supported formats (each record has `wallet`, `merkle_tree`, `amount`, `proof`):
+#   json  - top-level array of records, or object `{wallet: {merkle_tree, amount, proof}}`;
+#   jsonl - one record per line;
+#   csv   - header row, `proof` is either a JSON list of 32-byte lists or hex string.
+#
+# The file is parsed as a stream, only the compact index is kept in memory:
+# wallet bytes -> (distributor bytes, amount, proof bytes).
+#
+class SapysolLfgProofSnapshot:
+    def __init__(self,
+                 path:       str,
+                 fileFormat: SapysolLfgSnapshotFormat = "auto",
+                 chunkSize:  int = 1 << 20):
+
+        self.PATH:  str = path
+        self.INDEX: Dict[bytes, Tuple[bytes, int, bytes]] = {}
+        _fileFormat = SapysolLfgProofSnapshot.__DetectFormat(path=path) if fileFormat == "auto" else fileFormat
+
+        with open(path, "r", newline="") as f:
+            match _fileFormat:
+                case "json":
+                    records = SapysolLfgProofSnapshot.__IterJson(f=f, chunkSize=chunkSize)
+                case "jsonl":
+                    records = (json.loads(line) for line in f if line.strip())
+                case "csv":
+                    records = csv.DictReader(f)
+                case _:
+                    raise ValueError(f"SapysolLfgProofSnapshot: unknown snapshot format `{_fileFormat}`!")
+            for record in records:
+                self.__AddRecord(record=record)
+
+    # ========================================
+    #
+    @staticmethod
+    def __DetectFormat(path: str) -> SapysolLfgSnapshotFormat:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".jsonl", ".ndjson"):
+            return "jsonl"
+        if extension == ".csv":
+            return "csv"
+        return "json"
+
+    # ========================================
+    # Incremental parser for a top-level JSON array or object, decodes one
+    # element at a time from a sliding buffer instead of loading the whole file.
+    #
+    @staticmethod
+    def __IterJson(f: TextIO, chunkSize: int) -> Iterator[Dict[str, Any]]:
+        decoder = json.JSONDecoder()
+        buffer  = ""
+        pos     = 0
+        eof     = False
+
+        def _Fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk  = f.read(chunkSize)
+            buffer = buffer[pos:] + chunk
+            pos    = 0
+            eof    = chunk == ""
+            return not eof
+
+        def _SkipWs() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,:":
+                    pos += 1
+                if pos < len(buffer) or not _Fill():
+                    return buffer[pos] if pos < len(buffer) else ""
+
+        def _Decode() -> Any:
+            nonlocal pos
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                    # A value that touches the end of buffer may be truncated
+                    if end < len(buffer) or eof:
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                _Fill()
+
+        container = _SkipWs()
+        if container not in ("[", "{"):
+            raise ValueError("SapysolLfgProofSnapshot: JSON snapshot must be an array or an object!")
+        pos += 1
+
+        while True:
+            c = _SkipWs()
+            if c in ("]", "}", ""):
+                return
+            if container == "[":
+                yield _Decode()
+            else:
+                wallet = _Decode()
+                _SkipWs()
+                record = _Decode()
+                yield {"wallet": wallet, **record}
+
+    # ========================================
+    #
+    @staticmethod
+    def __PackProof(proof: Union[str, list]) -> bytes:
+        if isinstance(proof, str):
+            proof = proof.strip()
+            if not proof.startswith("["):
+                return PackProof(bytes.fromhex(proof.removeprefix("0x")))
+            proof = json.loads(proof)
+        return PackProof(proof)
+
+    def __AddRecord(self, record: Dict[str, Any]) -> None:
+        self.INDEX[bytes(MakePubkey(record["wallet"]))] = (bytes(MakePubkey(record["merkle_tree"])),
+                                                           int(record["amount"]),
+                                                           SapysolLfgProofSnapshot.__PackProof(record["proof"]))
+
+    # ========================================
+    # Returns `jup-claim-proof`-like response (`proof` as n*32 bytes) or `None`
+    # if wallet is not in snapshot.
+    #
+    def Get(self, walletAddress: SapysolPubkey) -> Union[Dict[str, Any], None]:
+        entry = self.INDEX.get(bytes(MakePubkey(walletAddress)))
+        if entry is None:
+            return None
+        distributor, amount, proof = entry
+        return {
+            "merkle_tree": str(Pubkey.from_bytes(distributor)),
+            "amount":      amount,
+            "proof":       proof,
+        }
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return len(self.INDEX)
+
+    def __contains__(self, walletAddress: SapysolPubkey) -> bool:
+        return bytes(MakePubkey(walletAddress)) in self.INDEX
+
+# =============================================================================
+#
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing          import Any, Dict, List, Union
+from   array           import array
+from   solana.rpc.api  import Pubkey
+from   sapysol         import SapysolPubkey, MakePubkey
+from  .merkle          import PackProof
+import threading
+
+# =============================================================================
+# Set of distinct 32-byte keys packed into one `bytearray`, looked up through
+# an open-addressing table of u32 key indices (+1, 0 is an empty slot).
+# Keys are hashes/pubkeys, so their first 8 bytes are already a good hash.
+# Costs 32 bytes per key plus 8-16 bytes of slots, no per-key Python objects.
+#
+class SapysolKeyTable:
+    def __init__(self, initialSize: int = 1024):
+        size = 1 << max(4, (initialSize - 1).bit_length())
+        self.KEYS:  bytearray = bytearray()
+        self.SLOTS: array     = array("I", bytes(4 * size))
+        self.MASK:  int       = size - 1
+        self.COUNT: int       = 0
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return self.COUNT
+
+    def GetKey(self, index: int) -> bytes:
+        return bytes(self.KEYS[index*32:(index+1)*32])
+
+    # ========================================
+    # Slot that holds `key` or the empty slot where it belongs.
+    #
+    def __Probe(self, key: bytes) -> int:
+        slots, keys, mask = self.SLOTS, self.KEYS, self.MASK
+        pos = int.from_bytes(key[:8], "little") & mask
+        while True:
+            index = slots[pos]
+            if index == 0 or keys[(index-1)*32:index*32] == key:
+                return pos
+            pos = (pos + 1) & mask
+
+    def __Grow(self) -> None:
+        size = 2 * len(self.SLOTS)
+        self.SLOTS = array("I", bytes(4 * size))
+        self.MASK  = size - 1
+        for index in range(self.COUNT):
+            self.SLOTS[self.__Probe(self.GetKey(index))] = index + 1
+
+    # ========================================
+    # Index of `key` or -1.
+    #
+    def Find(self, key: bytes) -> int:
+        return self.SLOTS[self.__Probe(key)] - 1
+
+    # ========================================
+    # Index of `key`, appended first if missing.
+    #
+    def Add(self, key: bytes) -> int:
+        pos   = self.__Probe(key)
+        index = self.SLOTS[pos]
+        if index:
+            return index - 1
+        self.KEYS  += key
+        self.COUNT += 1
+        self.SLOTS[pos] = self.COUNT
+        if 2 * self.COUNT > len(self.SLOTS):
+            self.__Grow()
+        return self.COUNT - 1
+
+# =============================================================================
+# In-memory proof store with node interning.
+#
+# Upper Merkle nodes are shared by huge numbers of wallets, so every distinct
+# 32-byte node is stored once in `NODES` and a proof is kept as a run of u32
+# node indices in `PROOFS`. Wallets live in their own key table, entry `i`
+# (wallet `i`) is spread over packed arrays; its proof runs from `OFFSETS[i]`
+# to the next entry's offset. The proof bytes are rebuilt only when requested.
+#
+class SapysolLfgProofStore:
+    def __init__(self):
+        self.LOCK:         threading.Lock    = threading.Lock()
+        self.NODES:        SapysolKeyTable   = SapysolKeyTable()
+        self.WALLETS:      SapysolKeyTable   = SapysolKeyTable()
+        self.PROOFS:       array             = array("I")
+        self.DISTRIBUTORS: List[Pubkey]      = []
+        self.DIST_INDEX:   Dict[Pubkey, int] = {}
+        self.ENTRY_DIST:   array             = array("I") # wallet -> distributor index
+        self.ENTRY_AMOUNT: array             = array("Q") # wallet -> amount
+        self.OFFSETS:      array             = array("I") # wallet -> first node in `PROOFS`
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return len(self.WALLETS)
+
+    def __contains__(self, walletAddress: SapysolPubkey) -> bool:
+        with self.LOCK:
+            return self.WALLETS.Find(bytes(MakePubkey(walletAddress))) >= 0
+
+    def GetNumNodes(self) -> int:
+        return len(self.NODES)
+
+    # ========================================
+    #
+    def __InternDistributor(self, distributor: Pubkey) -> int:
+        index = self.DIST_INDEX.get(distributor)
+        if index is None:
+            index = len(self.DISTRIBUTORS)
+            self.DIST_INDEX[distributor] = index
+            self.DISTRIBUTORS.append(distributor)
+        return index
+
+    # ========================================
+    # Stores `jup-claim-proof`-like response, proof may be lists or bytes.
+    # Only unlocked amounts are stored, locked ones are rejected.
+    #
+    def Put(self, walletAddress: SapysolPubkey, response: Dict[str, Any]) -> None:
+        if response.get("amount_locked", 0):
+            raise ValueError(f"SapysolLfgProofStore: {str(walletAddress)} has a locked amount, only unlocked amounts can be stored!")
+        wallet: bytes = bytes(MakePubkey(walletAddress))
+        proof:  bytes = PackProof(response["proof"])
+        with self.LOCK:
+            if self.WALLETS.Find(wallet) >= 0:
+                return
+            self.WALLETS.Add(wallet)
+            self.ENTRY_DIST.append(self.__InternDistributor(MakePubkey(response["merkle_tree"])))
+            self.ENTRY_AMOUNT.append(response["amount"])
+            self.OFFSETS.append(len(self.PROOFS))
+            self.PROOFS.extend(self.NODES.Add(proof[i:i+32]) for i in range(0, len(proof), 32))
+
+    # ========================================
+    # Returns `jup-claim-proof`-like response (`proof` rebuilt as n*32 bytes)
+    # or `None` if wallet is not stored.
+    #
+    def Get(self, walletAddress: SapysolPubkey) -> Union[Dict[str, Any], None]:
+        wallet: bytes = bytes(MakePubkey(walletAddress))
+        with self.LOCK:
+            index = self.WALLETS.Find(wallet)
+            if index < 0:
+                return None
+            start = self.OFFSETS[index]
+            end   = self.OFFSETS[index + 1] if index + 1 < len(self.OFFSETS) else len(self.PROOFS)
+            proof = b"".join(self.NODES.GetKey(i) for i in self.PROOFS[start:end])
+            return {
+                "merkle_tree": str(self.DISTRIBUTORS[self.ENTRY_DIST[index]]),
+                "amount":      self.ENTRY_AMOUNT[index],
+                "proof":       proof,
+            }
+
+# =============================================================================
+#
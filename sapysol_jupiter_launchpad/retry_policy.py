@@ -0,0 +1,143 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing                     import List, Optional, Tuple, Union
+from   enum                       import Enum
+from   solana.rpc.api             import Pubkey
+from   solana.rpc.core            import RPCException
+from   solders.instruction        import Instruction
+from   solders.rpc.errors         import SendTransactionPreflightFailureMessage
+from   solders.transaction_status import TransactionErrorInstructionError, InstructionErrorCustom
+from   anchorpy.error             import ProgramError
+from   sapysol                    import SapysolTx, SapysolTxStatus
+from  .anchorpy_v2.errors         import from_code
+from  .anchorpy_v2.errors.custom  import InvalidProof, ExceededMaxClaim, ClaimExpired, ClaimingIsNotStarted
+import random
+
+# =============================================================================
+#
+class SapysolClaimOutcome(Enum):
+    SUCCESS     = 1 # Claimed
+    FATAL       = 2 # Can never succeed: invalid proof, expired, already claimed
+    RETRY_LATER = 3 # Will succeed later: claiming is not started yet
+    TRANSIENT   = 4 # Dropped/expired transaction, RPC errors, anything unknown
+
+# Both program versions share the same error codes
+FATAL_ERRORS       = (InvalidProof, ExceededMaxClaim, ClaimExpired)
+RETRY_LATER_ERRORS = (ClaimingIsNotStarted,)
+
+# `init` of an existing ClaimStatus fails in the System Program with
+# `AccountAlreadyInUse`, reported as custom error 0 of the claim instruction
+ALREADY_CLAIMED_CODE: int = 0
+
+# =============================================================================
+# Capped exponential backoff with jitter, `maxAttempts=None` retries forever.
+#
+class SapysolBackoff:
+    def __init__(self,
+                 baseDelay:   float,
+                 maxDelay:    float,
+                 maxAttempts: Optional[int],
+                 jitter:      float = 0.2):
+
+        self.BASE_DELAY:   float         = baseDelay
+        self.MAX_DELAY:    float         = maxDelay
+        self.MAX_ATTEMPTS: Optional[int] = maxAttempts
+        self.JITTER:       float         = jitter
+
+    # ========================================
+    #
+    def GetDelay(self, attempt: int) -> float:
+        delay = min(self.MAX_DELAY, self.BASE_DELAY * 2**attempt)
+        return delay * (1 + random.uniform(0, self.JITTER))
+
+    def IsExhausted(self, attempt: int) -> bool:
+        return self.MAX_ATTEMPTS is not None and attempt >= self.MAX_ATTEMPTS
+
+# =============================================================================
+# Classifies claim transaction results and holds a backoff per retryable
+# class. Program errors are resolved with `from_code` from the failing
+# instruction's custom code, both for confirmed transactions (`meta.err`) and
+# for preflight failures (`RPCException`).
+#
+class SapysolClaimRetryPolicy:
+    def __init__(self,
+                 transient:  SapysolBackoff = None,
+                 retryLater: SapysolBackoff = None):
+
+        self.TRANSIENT:   SapysolBackoff = transient  if transient  else SapysolBackoff(baseDelay=0.5, maxDelay=8.0,  maxAttempts=30)
+        self.RETRY_LATER: SapysolBackoff = retryLater if retryLater else SapysolBackoff(baseDelay=2.0, maxDelay=30.0, maxAttempts=240)
+
+    # ========================================
+    #
+    def GetBackoff(self, outcome: SapysolClaimOutcome) -> SapysolBackoff:
+        return self.RETRY_LATER if outcome == SapysolClaimOutcome.RETRY_LATER else self.TRANSIENT
+
+    # ========================================
+    # Error of a transaction that failed on-chain or in preflight, `None` if
+    # it did not fail or never executed (dropped, expired, RPC errors).
+    #
+    @staticmethod
+    def GetTxError(tx: SapysolTx, error: RPCException = None) -> object:
+        if error is not None:
+            errorInfo = error.args[0] if error.args else None
+            return errorInfo.data.err if isinstance(errorInfo, SendTransactionPreflightFailureMessage) else None
+        return tx.CONFIRMED_TX.meta.err if tx.CONFIRMED_TX is not None else None
+
+    # Index of the instruction that failed the transaction, if any
+    @staticmethod
+    def GetFailedInstruction(txError: object) -> Optional[int]:
+        return txError.index if isinstance(txError, TransactionErrorInstructionError) else None
+
+    # ========================================
+    # Only errors of the claim instruction itself (`programId`) are trusted,
+    # everything else is transient.
+    #
+    @staticmethod
+    def ClassifyTxError(txError:      object,
+                        instructions: List[Instruction],
+                        programId:    Pubkey) -> Tuple[SapysolClaimOutcome, Union[ProgramError, str]]:
+
+        if not isinstance(txError, TransactionErrorInstructionError) or not isinstance(txError.err, InstructionErrorCustom):
+            return SapysolClaimOutcome.TRANSIENT, str(txError)
+        if txError.index >= len(instructions) or instructions[txError.index].program_id != programId:
+            return SapysolClaimOutcome.TRANSIENT, str(txError)
+
+        code: int = txError.err.code
+        if code == ALREADY_CLAIMED_CODE:
+            return SapysolClaimOutcome.FATAL, "Already claimed"
+        error = from_code(code)
+        if isinstance(error, FATAL_ERRORS):
+            return SapysolClaimOutcome.FATAL, error
+        if isinstance(error, RETRY_LATER_ERRORS):
+            return SapysolClaimOutcome.RETRY_LATER, error
+        return SapysolClaimOutcome.TRANSIENT, error if error else str(txError)
+
+    # ========================================
+    #
+    def ClassifyTx(self,
+                   tx:           SapysolTx,
+                   status:       SapysolTxStatus,
+                   instructions: List[Instruction],
+                   programId:    Pubkey) -> Tuple[SapysolClaimOutcome, Union[ProgramError, str]]:
+
+        if status == SapysolTxStatus.SUCCESS:
+            return SapysolClaimOutcome.SUCCESS, None
+        if status != SapysolTxStatus.FAIL or tx.CONFIRMED_TX is None:
+            return SapysolClaimOutcome.TRANSIENT, f"Transaction {status.name}"
+        return self.ClassifyTxError(txError=tx.CONFIRMED_TX.meta.err, instructions=instructions, programId=programId)
+
+    # ========================================
+    #
+    def ClassifyException(self,
+                          error:        RPCException,
+                          instructions: List[Instruction],
+                          programId:    Pubkey) -> Tuple[SapysolClaimOutcome, Union[ProgramError, str]]:
+
+        txError = self.GetTxError(tx=None, error=error)
+        if txError is None:
+            return SapysolClaimOutcome.TRANSIENT, str(error)
+        return self.ClassifyTxError(txError=txError, instructions=instructions, programId=programId)
+
+# =============================================================================
+#
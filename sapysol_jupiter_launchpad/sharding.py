@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing             import Any, Dict, Iterable, List, Literal, Tuple, Union
+from   solana.rpc.api     import Pubkey
+from   sapysol            import SapysolPubkey, MakePubkey
+from  .merkle_tree        import SapysolMerkleTree, SapysolMerkleProofFile, SapysolMerkleAllocation
+from  .anchorpy_v1.derive import DeriveMerkleDistributor as DeriveMerkleDistributor_v1
+from  .anchorpy_v2.derive import DeriveMerkleDistributor as DeriveMerkleDistributor_v2
+import threading
+import heapq
+import struct
+import math
+import os
+
+# =============================================================================
+# Shard index file layout (little-endian):
+#   header:  magic (8) | num_shards u32 | num_wallets u64
+#   shards:  num_shards * distributor address (32)
+#   records: num_wallets * (wallet (32) | shard u32)
+#
+SHARD_INDEX_MAGIC:  bytes         = b"SJLSHI01"
+SHARD_INDEX_HEADER: struct.Struct = struct.Struct("<8sIQ")
+SHARD_INDEX_RECORD: struct.Struct = struct.Struct("<32sI")
+
+# =============================================================================
+# Splits a large allocation list into `numShards` Merkle trees.
+#
+# Allocations are assigned largest-first to the shard with the smallest total
+# amount (ties go to the shard with fewer wallets), while no shard takes more
+# than ceil(n / numShards) wallets, so both `max_num_nodes` and
+# `max_total_claim` stay balanced.
+# Shard index is used as distributor `version`, distributor address is derived
+# from it (v1: mint + version, v2: base + mint + version).
+#
+class SapysolMerkleShardPlanner:
+    def __init__(self,
+                 allocations:    Iterable[SapysolMerkleAllocation],
+                 numShards:      int,
+                 tokenMint:      SapysolPubkey,
+                 baseAddress:    SapysolPubkey = None,
+                 programVersion: Literal["v1", "v2"] = "v2",
+                 numProcesses:   int = None):
+
+        if numShards < 1:
+            raise ValueError("SapysolMerkleShardPlanner: `numShards` must be positive!")
+        if programVersion == "v2" and baseAddress is None:
+            raise ValueError("SapysolMerkleShardPlanner: `baseAddress` is required for v2 distributors!")
+
+        self.TOKEN_MINT:   Pubkey                  = MakePubkey(tokenMint)
+        self.BASE_ADDRESS: Pubkey                  = MakePubkey(baseAddress)
+        self.VERSION:      Literal["v1", "v2"]     = programVersion
+        self.NUM_SHARDS:   int                     = numShards
+        self.SHARDS:       List[SapysolMerkleTree] = []
+        self.DISTRIBUTORS: List[Pubkey]            = []
+
+        entries  = sorted(((bytes(MakePubkey(c)), u, l) for c, u, l in allocations), key=lambda e: e[1] + e[2], reverse=True)
+        numWallets: int = len(entries)
+        capacity:   int = math.ceil(numWallets / numShards)
+        buckets: List[List[Tuple[bytes, int, int]]] = [ [] for _ in range(numShards) ]
+        heap:    List[Tuple[int, int, int]]         = [ (0, 0, shard) for shard in range(numShards) ] # (total, count, shard)
+        for entry in entries:
+            total, count, shard = heapq.heappop(heap)
+            buckets[shard].append(entry)
+            if count + 1 < capacity:
+                heapq.heappush(heap, (total + entry[1] + entry[2], count + 1, shard))
+        del entries
+
+        for shard, bucket in enumerate(buckets):
+            if not bucket:
+                raise ValueError(f"SapysolMerkleShardPlanner: shard {shard} is empty, too many shards for {numWallets} wallets!")
+            self.SHARDS.append(SapysolMerkleTree(allocations=bucket, numProcesses=numProcesses))
+            self.DISTRIBUTORS.append(self.DeriveDistributor(version=shard))
+
+    # ========================================
+    #
+    def DeriveDistributor(self, version: int) -> Pubkey:
+        if self.VERSION == "v1":
+            return DeriveMerkleDistributor_v1(tokenMint=self.TOKEN_MINT, version=version)
+        return DeriveMerkleDistributor_v2(baseAddress=self.BASE_ADDRESS, tokenMint=self.TOKEN_MINT, version=version)
+
+    # ========================================
+    # Writes `index.bin` (wallet -> shard) and `shard_<N>.bin` proof files.
+    #
+    def WriteShards(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for shard, tree in enumerate(self.SHARDS):
+            tree.WriteProofsFile(path=os.path.join(directory, f"shard_{shard}.bin"))
+
+        with open(os.path.join(directory, "index.bin"), "wb") as f:
+            f.write(SHARD_INDEX_HEADER.pack(SHARD_INDEX_MAGIC, self.NUM_SHARDS, sum(tree.NUM_LEAVES for tree in self.SHARDS)))
+            for distributor in self.DISTRIBUTORS:
+                f.write(bytes(distributor))
+            for shard, tree in enumerate(self.SHARDS):
+                for index in range(tree.NUM_LEAVES):
+                    f.write(SHARD_INDEX_RECORD.pack(tree.CLAIMANTS[index*32:(index+1)*32], shard))
+
+# =============================================================================
+# Claimer side: wallet -> shard/distributor lookup from `index.bin` with an
+# in-memory hash map (O(1) per wallet), proofs are read from the shard files.
+# Has the same `Get()` as `SapysolLfgProofSnapshot`, so it can be passed as
+# `proofSnapshot` to `SapysolLfgProofParams`.
+#
+class SapysolMerkleShardIndex:
+    def __init__(self, directory: str):
+        self.DIRECTORY:    str                               = directory
+        self.DISTRIBUTORS: List[Pubkey]                      = []
+        self.INDEX:        Dict[bytes, int]                  = {}
+        self.PROOF_FILES:  Dict[int, SapysolMerkleProofFile] = {}
+        self.LOCK:         threading.Lock                    = threading.Lock()
+
+        with open(os.path.join(directory, "index.bin"), "rb") as f:
+            magic, numShards, numWallets = SHARD_INDEX_HEADER.unpack(f.read(SHARD_INDEX_HEADER.size))
+            if magic != SHARD_INDEX_MAGIC:
+                raise ValueError(f"SapysolMerkleShardIndex: {directory} has no valid shard index!")
+            self.DISTRIBUTORS = [ Pubkey.from_bytes(f.read(32)) for _ in range(numShards) ]
+            records = f.read(numWallets * SHARD_INDEX_RECORD.size)
+            self.INDEX = { wallet: shard for wallet, shard in SHARD_INDEX_RECORD.iter_unpack(records) }
+
+    # ========================================
+    #
+    def __len__(self) -> int:
+        return len(self.INDEX)
+
+    def GetShard(self, walletAddress: SapysolPubkey) -> Union[int, None]:
+        return self.INDEX.get(bytes(MakePubkey(walletAddress)))
+
+    def GetDistributor(self, walletAddress: SapysolPubkey) -> Union[Pubkey, None]:
+        shard = self.GetShard(walletAddress=walletAddress)
+        return None if shard is None else self.DISTRIBUTORS[shard]
+
+    # ========================================
+    #
+    def GetProofFile(self, shard: int) -> SapysolMerkleProofFile:
+        with self.LOCK:
+            if shard not in self.PROOF_FILES:
+                self.PROOF_FILES[shard] = SapysolMerkleProofFile(path=os.path.join(self.DIRECTORY, f"shard_{shard}.bin"))
+            return self.PROOF_FILES[shard]
+
+    # ========================================
+    # Returns `jup-claim-proof`-like response or `None` if wallet is not in
+    # any shard; `amount` is the unlocked amount, `amount_locked` is passed on
+    # to the claim, `proof` is read from the shard file as n*32 bytes.
+    #
+    def Get(self, walletAddress: SapysolPubkey) -> Union[Dict[str, Any], None]:
+        shard = self.GetShard(walletAddress=walletAddress)
+        if shard is None:
+            return None
+        record = self.GetProofFile(shard=shard).GetClaimantRecord(claimant=walletAddress)
+        if record is None:
+            return None
+        _, unlocked, locked, proof = record
+        return {
+            "merkle_tree":   str(self.DISTRIBUTORS[shard]),
+            "amount":        unlocked,
+            "amount_locked": locked,
+            "proof":         proof,
+        }
+
+# =============================================================================
+#
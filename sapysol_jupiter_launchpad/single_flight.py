@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# =============================================================================
+#
+from   typing import Any, Callable, Dict, Hashable
+import threading
+
+# =============================================================================
+#
+class _SapysolFlightCall:
+    def __init__(self):
+        self.EVENT:  threading.Event = threading.Event()
+        self.RESULT: Any             = None
+        self.ERROR:  Exception       = None
+        self.OK:     bool            = False
+
+# =============================================================================
+# Request coalescing: concurrent `Do()` calls with the same key run `func`
+# only once, the other threads wait and get the same result (or exception).
+# With `memoize=True` successful results are kept, failed calls are not, so
+# the next `Do()` retries. When the leader is interrupted by a
+# `BaseException` (e.g. `KeyboardInterrupt`) its waiters get `RuntimeError`.
+#
+class SapysolSingleFlight:
+    def __init__(self, memoize: bool = False):
+        self.MEMOIZE: bool                               = memoize
+        self.LOCK:    threading.Lock                     = threading.Lock()
+        self.CALLS:   Dict[Hashable, _SapysolFlightCall] = {}
+        self.RESULTS: Dict[Hashable, Any]                = {}
+
+    # ========================================
+    #
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.RESULTS
+
+    def Forget(self, key: Hashable) -> None:
+        with self.LOCK:
+            self.RESULTS.pop(key, None)
+
+    # ========================================
+    #
+    def Do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self.LOCK:
+            if key in self.RESULTS:
+                return self.RESULTS[key]
+            call   = self.CALLS.get(key)
+            leader = call is None
+            if leader:
+                call = _SapysolFlightCall()
+                self.CALLS[key] = call
+
+        if not leader:
+            call.EVENT.wait()
+            if not call.OK:
+                raise call.ERROR if call.ERROR is not None else RuntimeError(f"SapysolSingleFlight: call for {key} was interrupted!")
+            return call.RESULT
+
+        try:
+            call.RESULT = func()
+            call.OK     = True
+        except Exception as e:
+            call.ERROR = e
+            raise
+        finally:
+            with self.LOCK:
+                if self.MEMOIZE and call.OK:
+                    self.RESULTS[key] = call.RESULT
+                del self.CALLS[key]
+            call.EVENT.set()
+        return call.RESULT
+
+# =============================================================================
+#
@@ -0,0 +1,75 @@
+# =============================================================================
+# Local stand-in HTTP server shared by the tests of HTTP clients (proof
+# worker, RPC node).
+#
+from   typing      import Callable, Tuple
+from   http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import pytest
+import time
+
+# (method, path, body) -> (status, body)
+StandInResponder = Callable[[str, str, bytes], Tuple[int, bytes]]
+
+# =============================================================================
+# Answers every request with `respond(...)` after `delay(path)` seconds,
+# records (method, path, body, headers) of every request and the peak number
+# of requests in flight.
+#
+class StandInServer:
+    def __init__(self, respond: StandInResponder, delay: Callable[[str], float] = None):
+        self.RESPOND:   StandInResponder = respond
+        self.DELAY:     Callable         = delay if delay else (lambda path: 0)
+        self.LOCK:      threading.Lock   = threading.Lock()
+        self.IN_FLIGHT: int              = 0
+        self.PEAK:      int              = 0
+        self.REQUESTS:  list             = []
+
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def Handle(self, method: str):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server.LOCK:
+                    server.IN_FLIGHT += 1
+                    server.PEAK       = max(server.PEAK, server.IN_FLIGHT)
+                    server.REQUESTS.append((method, self.path, body, dict(self.headers)))
+                time.sleep(server.DELAY(self.path))
+                with server.LOCK:
+                    server.IN_FLIGHT -= 1
+                status, response = server.RESPOND(method, self.path, body)
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+            def do_GET(self):
+                self.Handle("GET")
+            def do_POST(self):
+                self.Handle("POST")
+            def log_message(self, *args):
+                pass
+
+        self.SERVER: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.SERVER.daemon_threads = True
+        threading.Thread(target=self.SERVER.serve_forever, daemon=True).start()
+        self.URL: str = f"http://127.0.0.1:{self.SERVER.server_port}"
+
+    def Close(self) -> None:
+        self.SERVER.shutdown()
+        self.SERVER.server_close()
+
+# =============================================================================
+# `serve(respond, delay)` starts a stand-in server that is closed after the test.
+#
+@pytest.fixture
+def serve():
+    servers = []
+    def Serve(respond: StandInResponder, delay: Callable[[str], float] = None) -> StandInServer:
+        servers.append(StandInServer(respond=respond, delay=delay))
+        return servers[-1]
+    yield Serve
+    for server in servers:
+        server.Close()
+
+# =============================================================================
+#
@@ -0,0 +1,62 @@
+# =============================================================================
+# Struct-based account decoders against the borsh layouts they replace.
+#
+from   solders.pubkey                        import Pubkey
+from   anchorpy.error                        import AccountInvalidDiscriminator
+from   sapysol_jupiter_launchpad.anchorpy_v1 import accounts as accounts_v1
+from   sapysol_jupiter_launchpad.anchorpy_v2 import accounts as accounts_v2
+import construct
+import struct
+import random
+import pytest
+
+ACCOUNTS = [ accounts_v1.ClaimStatus, accounts_v1.MerkleDistributor,
+             accounts_v2.ClaimStatus, accounts_v2.MerkleDistributor ]
+
+# =============================================================================
+# Random value for every field type used by the account layouts, integers
+# are biased towards their bounds.
+#
+def RandomValue(subcon: construct.Construct, rnd: random.Random):
+    if isinstance(subcon, type(construct.Flag)):
+        return rnd.random() < 0.5
+    if isinstance(subcon, construct.FormatField):
+        bits   = 8 * struct.calcsize(subcon.fmtstr)
+        signed = subcon.fmtstr[-1].islower()
+        low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+        return rnd.choice([ low, high, 0, rnd.randint(low, high), rnd.randint(low, high) ])
+    if isinstance(subcon, construct.Array):
+        return [ RandomValue(subcon.subcon, rnd) for _ in range(subcon.count) ]
+    return Pubkey(rnd.randbytes(32))
+
+def RandomData(account, rnd: random.Random) -> bytes:
+    values = { sc.name: RandomValue(sc.subcon, rnd) for sc in account.layout.subcons }
+    return account.discriminator + account.layout.build(values)
+
+# =============================================================================
+#
+@pytest.mark.parametrize("account", ACCOUNTS, ids=lambda a: f"{a.__module__.split('.')[1]}.{a.__name__}")
+def test_struct_decode_matches_layout_parse(account):
+    rnd = random.Random(account.__name__)
+    for _ in range(200):
+        data    = RandomData(account, rnd)
+        parsed  = account.layout.parse(data[8:])
+        decoded = account.decode(data + rnd.randbytes(rnd.randint(0, 16))) # trailing bytes are ignored
+        for sc in account.layout.subcons:
+            expected = parsed[sc.name]
+            assert getattr(decoded, sc.name) == (bytes(expected) if isinstance(expected, list) else expected), sc.name
+
+@pytest.mark.parametrize("account", ACCOUNTS, ids=lambda a: f"{a.__module__.split('.')[1]}.{a.__name__}")
+def test_json_round_trip(account):
+    rnd     = random.Random(account.__name__)
+    decoded = account.decode(RandomData(account, rnd))
+    assert account.from_json(decoded.to_json()) == decoded
+
+@pytest.mark.parametrize("account", ACCOUNTS, ids=lambda a: f"{a.__module__.split('.')[1]}.{a.__name__}")
+def test_invalid_discriminator(account):
+    data = RandomData(account, random.Random(0))
+    with pytest.raises(AccountInvalidDiscriminator):
+        account.decode(bytes(8) + data[8:])
+
+# =============================================================================
+#
@@ -0,0 +1,84 @@
+# =============================================================================
+# `SapysolClaimPacker` size/compute limits and `SapysolClaimPack` entry lookup.
+#
+from   solders.keypair                         import Keypair
+from   solders.pubkey                          import Pubkey
+from   solders.instruction                     import Instruction, AccountMeta
+from   solders.address_lookup_table_account    import AddressLookupTableAccount
+from   spl.token.constants                     import ASSOCIATED_TOKEN_PROGRAM_ID
+from   sapysol_jupiter_launchpad.claim_packer  import SapysolClaimPacker, PACK_HEADER_SIZE, MAX_TX_SIZE, CLAIM_COMPUTE_UNITS, ATA_COMPUTE_UNITS
+import pytest
+
+PROGRAM_ID:  Pubkey = Pubkey.new_unique()
+DISTRIBUTOR: Pubkey = Pubkey.new_unique()
+SHARED:      list   = [ DISTRIBUTOR, Pubkey.new_unique(), Pubkey.new_unique() ] # distributor, vault, token program
+
+# =============================================================================
+# Claim with the claimant as signer, its ClaimStatus, the shared accounts and
+# a `depth`-node proof.
+#
+def ClaimEntry(ata: bool = False, units: int = None, depth: int = 1) -> tuple:
+    wallet = Keypair()
+    metas  = [ AccountMeta(wallet.pubkey(), is_signer=True, is_writable=True) ] + \
+             [ AccountMeta(Pubkey.new_unique(), is_signer=False, is_writable=True) for _ in range(1) ] + \
+             [ AccountMeta(a, is_signer=False, is_writable=False) for a in SHARED ]
+    instructions = [ Instruction(PROGRAM_ID, bytes(8 + 16 + 4 + 32 * depth), metas) ]
+    if ata:
+        instructions.insert(0, Instruction(ASSOCIATED_TOKEN_PROGRAM_ID, b"\x01", metas[:2]))
+    return (wallet, instructions) if units is None else (wallet, instructions, units)
+
+# =============================================================================
+#
+def test_packs_fit_and_keep_order():
+    packer  = SapysolClaimPacker(feePayer=Keypair())
+    entries = [ ClaimEntry(ata=i % 2 == 0) for i in range(12) ]
+    packs   = packer.Pack(entries=entries)
+    assert len(packs) > 1
+    assert [ w for pack in packs for w in pack.WALLETS ] == [ e[0].pubkey() for e in entries ]
+    for pack in packs:
+        assert packer.GetTxSize(pack.GetInstructions(computePrice=10**6)) <= MAX_TX_SIZE
+        assert pack.SIGNERS[0] == packer.FEE_PAYER
+        assert len(pack.SIGNERS) == len(pack.WALLETS) + 1
+
+def test_compute_limit_and_claims_per_tx():
+    entries = [ ClaimEntry() for _ in range(4) ]
+    assert [ len(p.WALLETS) for p in SapysolClaimPacker(feePayer=Keypair(), maxComputeUnits=2 * CLAIM_COMPUTE_UNITS).Pack(entries=entries) ] == [ 2, 2 ]
+    assert [ len(p.WALLETS) for p in SapysolClaimPacker(feePayer=Keypair(), maxClaimsPerTx=3).Pack(entries=entries) ]                      == [ 3, 1 ]
+
+def test_measured_units_replace_estimates():
+    packer   = SapysolClaimPacker(feePayer=Keypair())
+    measured = packer.Pack(entries=[ ClaimEntry(ata=True, units=41_000) ])[0]
+    estimate = packer.Pack(entries=[ ClaimEntry(ata=True) ])[0]
+    assert measured.COMPUTE_UNITS == 41_000
+    assert estimate.COMPUTE_UNITS == CLAIM_COMPUTE_UNITS + ATA_COMPUTE_UNITS
+
+def test_claim_too_large_alone_gets_own_pack():
+    packer = SapysolClaimPacker(feePayer=Keypair(), maxTxSize=200)
+    packs  = packer.Pack(entries=[ ClaimEntry() for _ in range(3) ])
+    assert [ len(p.WALLETS) for p in packs ] == [ 1, 1, 1 ]
+
+def test_fee_payer_signs_once():
+    feePayer = Keypair()
+    _, instructions = ClaimEntry()
+    pack, = SapysolClaimPacker(feePayer=feePayer).Pack(entries=[ (feePayer, instructions) ])
+    assert pack.SIGNERS == [ feePayer ]
+
+def test_lookup_table_shrinks_packs():
+    feePayer     = Keypair()
+    instructions = [ ix for _ in range(3) for ix in ClaimEntry()[1] ]
+    table        = AddressLookupTableAccount(key=Pubkey.new_unique(), addresses=SHARED)
+    legacy       = SapysolClaimPacker(feePayer=feePayer)
+    lookup       = SapysolClaimPacker(feePayer=feePayer, lookupTables=[ table ])
+    assert lookup.GetTxSize(instructions) < legacy.GetTxSize(instructions)
+
+def test_get_entry_maps_instructions_to_claimants():
+    entries = [ ClaimEntry(ata=True), ClaimEntry(), ClaimEntry(ata=True) ]
+    pack,   = SapysolClaimPacker(feePayer=Keypair()).Pack(entries=entries)
+    owners  = [ pack.GetEntry(index=i) for i in range(len(pack.GetInstructions())) ]
+    assert owners[:PACK_HEADER_SIZE] == [ None ] * PACK_HEADER_SIZE
+    assert [ e[0] for e in owners[PACK_HEADER_SIZE:] ] == [ entries[0][0] ] * 2 + [ entries[1][0] ] + [ entries[2][0] ] * 2
+    assert pack.GetEntry(index=None) is None
+    assert pack.GetEntry(index=len(pack.GetInstructions())) is None
+
+# =============================================================================
+#
@@ -0,0 +1,102 @@
+# =============================================================================
+# Generated codec against the `anchorpy_<version>` borsh construct path: every
+# instruction and account of both IDL versions, byte for byte.
+#
+from   solders.pubkey                  import Pubkey
+from   sapysol_jupiter_launchpad.codec import SapysolDistributorCodec
+import importlib
+import inspect
+import keyword
+import random
+import pytest
+import re
+
+VERSIONS   = [ "v1", "v2" ]
+INT_BOUNDS = { "u8": (0, 2**8 - 1), "u64": (0, 2**64 - 1), "i64": (-2**63, 2**63 - 1) }
+
+# =============================================================================
+#
+def SnakeCase(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+def RandomValue(fieldType, rnd: random.Random):
+    if isinstance(fieldType, str) and fieldType in INT_BOUNDS:
+        low, high = INT_BOUNDS[fieldType]
+        return rnd.choice([ low, high, rnd.randint(low, high) ])
+    if fieldType == "bool":
+        return rnd.random() < 0.5
+    if fieldType == "publicKey":
+        return Pubkey(rnd.randbytes(32))
+    if "array" in fieldType:
+        return list(rnd.randbytes(fieldType["array"][1]))
+    if "vec" in fieldType:
+        return [ RandomValue(fieldType["vec"], rnd) for _ in range(rnd.choice([ 0, 1, rnd.randint(2, 24) ])) ]
+    raise ValueError(f"unsupported IDL type {fieldType}")
+
+# Codec returns byte arrays as bytes and vecs of them as one compact blob
+def Expected(value):
+    if isinstance(value, list) and (not value or isinstance(value[0], list)):
+        return b"".join(bytes(v) for v in value)
+    if isinstance(value, list):
+        return bytes(value)
+    return value
+
+def Cases(version: str, section: str):
+    codec = SapysolDistributorCodec(version=version)
+    return [ pytest.param(codec, entry, id=f"{version}.{entry['name']}") for entry in codec.IDL[section] ]
+
+ALL_INSTRUCTIONS = [ case for version in VERSIONS for case in Cases(version, "instructions") ]
+ALL_ACCOUNTS     = [ case for version in VERSIONS for case in Cases(version, "accounts") ]
+
+# =============================================================================
+#
+@pytest.mark.parametrize("codec, ix", ALL_INSTRUCTIONS)
+def test_instruction_round_trip(codec, ix):
+    instructions = importlib.import_module(f"sapysol_jupiter_launchpad.anchorpy_{codec.VERSION}.instructions")
+    name    = SnakeCase(ix["name"])
+    builder = getattr(instructions, name)
+    rnd     = random.Random(f"{codec.VERSION}.{name}")
+    keys    = { SnakeCase(a["name"]) + ("_" if keyword.iskeyword(SnakeCase(a["name"])) else ""): Pubkey.new_unique() for a in ix["accounts"] }
+    for _ in range(50):
+        args      = { SnakeCase(a["name"]): RandomValue(a["type"], rnd) for a in ix["args"] }
+        reference = builder(args=args, accounts=keys) if "args" in inspect.signature(builder).parameters else builder(accounts=keys)
+
+        data = getattr(codec, f"encode_{name}")(**args)
+        assert data == reference.data
+
+        decodedName, decoded = codec.DecodeInstruction(reference.data)
+        assert decodedName == name
+        assert decoded     == { k: Expected(v) for k, v in args.items() }
+
+@pytest.mark.parametrize("codec, account", ALL_ACCOUNTS)
+def test_account_round_trip(codec, account):
+    accounts = importlib.import_module(f"sapysol_jupiter_launchpad.anchorpy_{codec.VERSION}.accounts")
+    name     = SnakeCase(account["name"])
+    cls      = getattr(accounts, account["name"][0].upper() + account["name"][1:])
+    rnd      = random.Random(f"{codec.VERSION}.{name}")
+    for _ in range(50):
+        fields    = { SnakeCase(f["name"]): RandomValue(f["type"], rnd) for f in account["type"]["fields"] }
+        reference = cls.discriminator + cls.layout.build(fields)
+
+        data = getattr(codec, f"encode_{name}")(**fields)
+        assert data == reference
+
+        decodedName, decoded = codec.DecodeAccount(reference)
+        assert decodedName == name
+        assert decoded     == { k: Expected(v) for k, v in fields.items() }
+        assert getattr(codec, f"encode_{name}")(**decoded) == reference
+        model = cls.decode(reference) # same representation as the account models
+        assert { k: getattr(model, k) for k in fields } == decoded
+        parsed = cls.layout.parse(data[8:])
+        assert { k: parsed[k] for k in fields } == fields
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_unknown_discriminator(version):
+    codec = SapysolDistributorCodec(version=version)
+    with pytest.raises(ValueError):
+        codec.DecodeInstruction(bytes(16))
+    with pytest.raises(ValueError):
+        codec.DecodeAccount(bytes(16))
+
+# =============================================================================
+#
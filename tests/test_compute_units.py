@@ -0,0 +1,62 @@
+# =============================================================================
+# `SapysolComputeUnitEstimator` memoization: one simulation per claim class,
+# static estimates while claims fail in simulation.
+#
+from   solders.keypair                         import Keypair
+from   solders.pubkey                          import Pubkey
+from   sapysol_jupiter_launchpad.compute_units import SapysolComputeUnitEstimator
+from   sapysol_jupiter_launchpad.claim_packer  import CLAIM_COMPUTE_UNITS, ATA_COMPUTE_UNITS
+import pytest
+
+KEY: tuple = (Pubkey.new_unique(), 14, True)
+
+# =============================================================================
+# `results` are consumed per simulation: units consumed or an exception.
+#
+@pytest.fixture
+def make():
+    def Make(results: list, retryAfter: float = 30.0) -> SapysolComputeUnitEstimator:
+        estimator = SapysolComputeUnitEstimator(connection=None, retryAfter=retryAfter)
+        estimator.SIMULATED = 0
+        def Simulate(payer, instructions):
+            estimator.SIMULATED += 1
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        estimator.Simulate = Simulate
+        return estimator
+    return Make
+
+def GetUnits(estimator: SapysolComputeUnitEstimator) -> int:
+    return estimator.GetUnits(key=KEY, payer=Keypair(), instructions=lambda: [])
+
+# =============================================================================
+#
+def test_class_is_simulated_once(make):
+    estimator = make(results=[ 50_000 ])
+    assert [ GetUnits(estimator) for _ in range(3) ] == [ 55_000 ] * 3
+    assert estimator.SIMULATED == 1
+    assert estimator.IsMeasured(key=KEY)
+
+def test_failed_simulation_uses_static_estimate(make):
+    estimator = make(results=[ ValueError("ClaimingIsNotStarted") ])
+    assert [ GetUnits(estimator) for _ in range(3) ] == [ CLAIM_COMPUTE_UNITS + ATA_COMPUTE_UNITS ] * 3
+    assert estimator.SIMULATED == 1
+    assert not estimator.IsMeasured(key=KEY)
+
+def test_failed_class_is_measured_again(make):
+    estimator = make(results=[ ValueError("ClaimingIsNotStarted"), 10_000 ], retryAfter=0)
+    assert GetUnits(estimator) == CLAIM_COMPUTE_UNITS + ATA_COMPUTE_UNITS
+    assert GetUnits(estimator) == 12_000
+    assert GetUnits(estimator) == 12_000
+    assert estimator.SIMULATED == 2
+
+def test_rpc_errors_are_raised(make):
+    estimator = make(results=[ ConnectionError("node is down"), 10_000 ])
+    with pytest.raises(ConnectionError):
+        GetUnits(estimator)
+    assert GetUnits(estimator) == 12_000
+
+# =============================================================================
+#
@@ -0,0 +1,226 @@
+# =============================================================================
+# `SapysolJupiterDistributorBatcher` claim flow without a cluster: the batcher
+# is built without `__init__`, proofs come from a local stand-in worker and
+# transactions from a scripted fake.
+#
+from   types                                         import SimpleNamespace
+from   solders.keypair                               import Keypair
+from   solders.pubkey                                import Pubkey
+from   solders.instruction                           import Instruction, AccountMeta
+from   solders.transaction_status                    import TransactionErrorInstructionError, InstructionErrorCustom
+from   solana.exceptions                             import SolanaRpcException
+from   sapysol                                       import SapysolTxStatus
+from   sapysol_jupiter_launchpad                     import distributor_batcher
+from   sapysol_jupiter_launchpad.proof_client        import SapysolLfgProofClient
+from   sapysol_jupiter_launchpad.proof_cache         import NO_DISTRIBUTION_CACHE
+from   sapysol_jupiter_launchpad.claim_packer        import SapysolClaimPacker, PACK_HEADER_SIZE
+from   sapysol_jupiter_launchpad.fee_oracle          import SapysolStaticFeeOracle
+from   sapysol_jupiter_launchpad.retry_policy        import SapysolClaimRetryPolicy, SapysolBackoff
+from   sapysol_jupiter_launchpad.proof_store         import SapysolLfgProofStore
+from   sapysol_jupiter_launchpad.distributor_batcher import SapysolJupiterDistributorBatcher
+import pytest
+import json
+
+TOKEN_MINT:  Pubkey = Pubkey.new_unique()
+PROGRAM_ID:  Pubkey = Pubkey.new_unique()
+DISTRIBUTOR: Pubkey = Pubkey.new_unique()
+
+INVALID_PROOF:           int = 6002
+CLAIMING_IS_NOT_STARTED: int = 6018
+
+def RpcTimeout() -> SolanaRpcException:
+    return SolanaRpcException(TimeoutError(), None, None, SimpleNamespace())
+
+# =============================================================================
+# Claim instruction signed by the claimant, so packs carry every wallet as a
+# signer. Wallets in `INVALID` fail verification, those in `CLAIMED` claimed.
+#
+class FakeDistributor:
+    def __init__(self):
+        self.PUBKEY        = DISTRIBUTOR
+        self.CLAIM_ENCODER = SimpleNamespace(program_id=PROGRAM_ID)
+        self.DISTRIBUTOR   = SimpleNamespace(mint=TOKEN_MINT)
+        self.INVALID:  set = set()
+        self.CLAIMED:  set = set()
+
+    def GetFeeAccounts(self) -> list:
+        return [ self.PUBKEY ]
+
+    def VerifyClaims(self, entries: list) -> list:
+        return [ e[0] not in self.INVALID for e in entries ]
+
+    def GetClaimStatusMultiple(self, walletAddresses: list, numThreads: int) -> list:
+        return [ object() if w in self.CLAIMED else None for w in walletAddresses ]
+
+    def GetAtaMultiple(self, walletAddresses: list, numThreads: int) -> list:
+        return [ SimpleNamespace(ix=None) for _ in walletAddresses ]
+
+    def GetClaimIx(self, walletAddress: Pubkey, **kwargs) -> list:
+        return [ Instruction(PROGRAM_ID, b"claim", [ AccountMeta(walletAddress, is_signer=True, is_writable=True) ]) ]
+
+# =============================================================================
+# Every send takes the next step of `script`: a status, `(index, code)` for a
+# failed instruction or an exception to raise.
+#
+@pytest.fixture(autouse=True)
+def noDistributionCache():
+    NO_DISTRIBUTION_CACHE.Clear()
+    yield
+    NO_DISTRIBUTION_CACHE.Clear()
+
+@pytest.fixture
+def make(serve, monkeypatch):
+    def Make(wallets: list, respond = None, script: list = None, maxAttempts: int = 3, retryLater: int = 3) -> SapysolJupiterDistributorBatcher:
+        worker  = serve(respond=respond if respond else (lambda method, path, _: (404, b"")))
+        batcher = SapysolJupiterDistributorBatcher.__new__(SapysolJupiterDistributorBatcher)
+        batcher.TOKEN_MINT          = TOKEN_MINT
+        batcher.TOKEN               = SimpleNamespace(TOKEN_INFO=SimpleNamespace(decimals=6))
+        batcher.KEYPAIRS_LIST       = wallets
+        batcher.NUM_THREADS         = 4
+        batcher.CONNECTION          = None
+        batcher.CONNECTION_OVERRIDE = None
+        batcher.TX_PARAMS           = None
+        batcher.PROOF_CLIENT        = SapysolLfgProofClient(numConnections=4, baseUrl=worker.URL)
+        batcher.PROOF_CACHE         = None
+        batcher.PROOF_SNAPSHOT      = None
+        batcher.PROOF_STORE         = None
+        batcher.CLAIM_PROOFS        = SapysolLfgProofStore()
+        batcher.DISTRIBUTOR_LIST    = { DISTRIBUTOR: FakeDistributor() }
+        batcher.PREFILTERED         = set()
+        batcher.ATA_LIST            = {}
+        batcher.PACKER              = SapysolClaimPacker(feePayer=Keypair())
+        batcher.LOOKUP_TABLE        = None
+        batcher.CU_ESTIMATOR        = None
+        batcher.FEE_ORACLE          = SapysolStaticFeeOracle()
+        batcher.RETRY_POLICY        = SapysolClaimRetryPolicy(transient  = SapysolBackoff(baseDelay=0, maxDelay=0, maxAttempts=maxAttempts),
+                                                              retryLater = SapysolBackoff(baseDelay=0, maxDelay=0, maxAttempts=retryLater))
+        batcher.SENT                = []
+        batcher.WORKER              = worker
+
+        steps = list(script or [])
+        class FakeTx:
+            def __init__(self, connection, payer, txParams):
+                self.CONFIRMED_TX = None
+            def FromInstructionsLegacy(self, instructions):
+                self.INSTRUCTIONS = instructions
+                return self
+            def Sign(self, signers):
+                return self
+            def WaitForTx(self, connectionOverride=None):
+                batcher.SENT.append(self.INSTRUCTIONS)
+                step = steps.pop(0)
+                if isinstance(step, Exception):
+                    raise step
+                if isinstance(step, tuple):
+                    self.CONFIRMED_TX = SimpleNamespace(meta=SimpleNamespace(err=TransactionErrorInstructionError(step[0], InstructionErrorCustom(step[1]))))
+                    return SapysolTxStatus.FAIL
+                return step
+
+        monkeypatch.setattr(distributor_batcher, "SapysolTx", FakeTx)
+        monkeypatch.setattr(distributor_batcher.time, "sleep", lambda s: None)
+        return batcher
+    return Make
+
+def Proof() -> dict:
+    return { "merkle_tree": str(DISTRIBUTOR), "amount": 1000, "proof": [ [1] * 32 ] }
+
+# Wallets as if `Prefilter()` verified them as unclaimed
+def Prefiltered(batcher: SapysolJupiterDistributorBatcher, wallets: list) -> None:
+    for wallet in wallets:
+        batcher.CLAIM_PROOFS.Put(walletAddress=wallet.pubkey(), response=Proof())
+        batcher.ATA_LIST[wallet.pubkey()] = SimpleNamespace(ix=None)
+        batcher.PREFILTERED.add(wallet.pubkey())
+
+# =============================================================================
+#
+def test_prefilter_survives_failed_lookups(make):
+    failing, missing = Keypair(), Keypair()
+    batcher = make(wallets=[ failing, missing ],
+                   respond=lambda method, path, _: (500, b"") if path.endswith(str(failing.pubkey())) else (404, b""))
+    assert batcher.Prefilter() == [ failing ]
+    assert not batcher.PREFILTERED
+    assert failing.pubkey() not in batcher.CLAIM_PROOFS # looked up again by `ClaimSingle()`
+
+def test_prefilter_keeps_proofs_of_claimable_wallets_only(make):
+    claimable, invalid, claimed = Keypair(), Keypair(), Keypair()
+    batcher     = make(wallets=[ claimable, invalid, claimed ], respond=lambda method, path, _: (200, json.dumps(Proof()).encode()))
+    distributor = batcher.DISTRIBUTOR_LIST[DISTRIBUTOR]
+    distributor.INVALID.add(invalid.pubkey())
+    distributor.CLAIMED.add(claimed.pubkey())
+    assert batcher.Prefilter() == [ claimable ]
+    assert len(batcher.CLAIM_PROOFS) == 1
+
+    requests = len(batcher.WORKER.REQUESTS)
+    params   = batcher.GetProofParams(wallet=claimable)
+    assert len(batcher.WORKER.REQUESTS) == requests # not fetched again
+    assert (params.DISTRIBUTOR_PUBKEY, params.AMOUNT, params.PROOF) == (DISTRIBUTOR, 1000, bytes([1] * 32))
+
+# =============================================================================
+#
+@pytest.mark.parametrize("script, sends", [
+    ([ SapysolTxStatus.SUCCESS ],                                              1),
+    ([ SapysolTxStatus.TIMEOUT, RpcTimeout(), SapysolTxStatus.SUCCESS ],       3),
+    ([ (0, INVALID_PROOF) ] * 10,                                              1), # fatal
+    ([ (0, CLAIMING_IS_NOT_STARTED) ] * 10,                                    3), # retry later, capped at 2
+    ([ SapysolTxStatus.TIMEOUT ] * 10,                                         4), # transient, capped at 3
+    ([ (0, CLAIMING_IS_NOT_STARTED), SapysolTxStatus.TIMEOUT ] * 5,            5), # separate caps
+    ([ (1, INVALID_PROOF) ] * 10,                                              4), # not the claim instruction
+])
+def test_claim_single_outcomes(make, script, sends):
+    wallet  = Keypair()
+    batcher = make(wallets=[ wallet ], script=script, retryLater=2)
+    Prefiltered(batcher=batcher, wallets=[ wallet ])
+    batcher.ClaimSingle(wallet=wallet)
+    assert len(batcher.SENT) == sends
+
+def test_claim_single_caps_errors_outside_the_send(make):
+    wallet  = Keypair()
+    batcher = make(wallets=[ wallet ])
+    Prefiltered(batcher=batcher, wallets=[ wallet ])
+    calls = []
+    def GetPrice(accounts, attempt):
+        calls.append(attempt)
+        raise RpcTimeout()
+    batcher.FEE_ORACLE.GetPrice = GetPrice
+    batcher.ClaimSingle(wallet=wallet) # returns instead of escaping to `SapysolBatcher`
+    assert calls == [ 0, 1, 2, 3 ]
+    assert not batcher.SENT
+
+def test_claim_single_retries_failed_lookups(make):
+    wallet  = Keypair()
+    replies = [ (500, b""), (200, json.dumps(Proof()).encode()) ]
+    batcher = make(wallets=[ wallet ], respond=lambda method, path, _: replies.pop(0), script=[ SapysolTxStatus.SUCCESS ])
+    batcher.PREFILTERED.add(wallet.pubkey()) # skip on-chain checks of the fake distributor
+    batcher.ATA_LIST[wallet.pubkey()] = SimpleNamespace(ix=None)
+    batcher.ClaimSingle(wallet=wallet)
+    assert len(batcher.SENT) == 1
+
+# =============================================================================
+#
+def test_pack_drops_fatal_wallet_and_repacks(make):
+    wallets = [ Keypair() for _ in range(3) ]
+    batcher = make(wallets=wallets, script=[ (PACK_HEADER_SIZE + 1, INVALID_PROOF), SapysolTxStatus.SUCCESS ])
+    Prefiltered(batcher=batcher, wallets=wallets)
+    pack, = batcher.BuildPacks(wallets=wallets)
+    batcher.ClaimPack(pack=pack)
+    assert len(batcher.SENT) == 2
+    assert [ ix.accounts[0].pubkey for ix in batcher.SENT[1][PACK_HEADER_SIZE:] ] == [ wallets[0].pubkey(), wallets[2].pubkey() ]
+
+def test_pack_falls_back_to_single_claims(make):
+    wallets = [ Keypair() for _ in range(2) ]
+    batcher = make(wallets=wallets, script=[ RpcTimeout(), RpcTimeout(), SapysolTxStatus.SUCCESS, SapysolTxStatus.SUCCESS ], maxAttempts=1)
+    Prefiltered(batcher=batcher, wallets=wallets)
+    pack, = batcher.BuildPacks(wallets=wallets)
+    batcher.ClaimPack(pack=pack)
+    assert [ len(ix) for ix in batcher.SENT ] == [ PACK_HEADER_SIZE + 2, PACK_HEADER_SIZE + 2, 1, 1 ]
+
+def test_failed_pack_instruction_falls_back_at_once(make):
+    wallets = [ Keypair() for _ in range(2) ]
+    batcher = make(wallets=wallets, script=[ (0, 1), SapysolTxStatus.SUCCESS, SapysolTxStatus.SUCCESS ])
+    Prefiltered(batcher=batcher, wallets=wallets)
+    pack, = batcher.BuildPacks(wallets=wallets)
+    batcher.ClaimPack(pack=pack) # executed and failed in the header: resending the pack fails again
+    assert [ len(ix) for ix in batcher.SENT ] == [ PACK_HEADER_SIZE + 2, 1, 1 ]
+
+# =============================================================================
+#
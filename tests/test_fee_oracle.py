@@ -0,0 +1,63 @@
+# =============================================================================
+# `getRecentPrioritizationFees` wrapper and `SapysolPriorityFeeOracle` against
+# a local stand-in RPC node.
+#
+from   solders.pubkey                       import Pubkey
+from   solana.rpc.api                       import Client
+from   sapysol_jupiter_launchpad.fee_oracle import GetRecentPrioritizationFees, SapysolPrioritizationFee, SapysolPriorityFeeOracle
+import pytest
+import json
+
+@pytest.fixture
+def rpc(request, serve):
+    return serve(respond=lambda method, path, body: (200, json.dumps(request.param).encode()))
+
+FEES = { "jsonrpc": "2.0", "id": 1, "result": [ { "slot": 10 + i, "prioritizationFee": fee } for i, fee in enumerate([ 500, 0, 100, 9000, 300 ]) ] }
+
+# =============================================================================
+#
+@pytest.mark.parametrize("rpc", [FEES], indirect=True)
+def test_wrapper_parses_result(rpc):
+    accounts = [ Pubkey.new_unique() for _ in range(3) ]
+    fees     = GetRecentPrioritizationFees(endpoint=rpc.URL, accounts=accounts, headers={ "X-Token": "abc" })
+    assert fees[0] == SapysolPrioritizationFee(slot=10, prioritizationFee=500)
+    assert [ f.prioritizationFee for f in fees ] == [ 500, 0, 100, 9000, 300 ]
+
+    _, _, body, headers = rpc.REQUESTS[0]
+    body = json.loads(body)
+    assert body["method"] == "getRecentPrioritizationFees"
+    assert body["params"] == [ [ str(a) for a in accounts ] ]
+    assert headers["X-Token"] == "abc"
+
+@pytest.mark.parametrize("rpc", [{ "jsonrpc": "2.0", "id": 1, "error": { "code": -32602, "message": "Invalid params" } }], indirect=True)
+def test_wrapper_raises_rpc_error(rpc):
+    with pytest.raises(ValueError):
+        GetRecentPrioritizationFees(endpoint=rpc.URL)
+
+def test_wrapper_rejects_too_many_accounts():
+    with pytest.raises(ValueError):
+        GetRecentPrioritizationFees(endpoint="http://127.0.0.1:1", accounts=[ Pubkey.new_unique() for _ in range(129) ])
+
+# =============================================================================
+#
+@pytest.mark.parametrize("rpc", [FEES], indirect=True)
+def test_oracle_escalates_and_caches(rpc):
+    oracle   = SapysolPriorityFeeOracle(endpoint=rpc.URL, percentiles=(50, 100), maxPrice=5000)
+    accounts = [ Pubkey.new_unique() ]
+    assert oracle.GetPrice(accounts=accounts, attempt=0) == 300
+    assert oracle.GetPrice(accounts=accounts, attempt=1) == 5000 # clamped
+    assert oracle.GetPrice(accounts=accounts, attempt=9) == 5000
+    assert len(rpc.REQUESTS) == 1
+
+@pytest.mark.parametrize("rpc", [FEES], indirect=True)
+def test_oracle_from_connection(rpc):
+    oracle = SapysolPriorityFeeOracle.FromConnection(connection=Client(rpc.URL, extra_headers={ "X-Token": "abc" }), percentiles=(50,))
+    assert oracle.GetPrice(accounts=[ Pubkey.new_unique() ]) == 300
+    assert rpc.REQUESTS[0][3]["X-Token"] == "abc"
+
+def test_oracle_survives_rpc_failure():
+    oracle = SapysolPriorityFeeOracle(endpoint="http://127.0.0.1:1", minPrice=7, timeout=0.5)
+    assert oracle.GetPrice(accounts=[ Pubkey.new_unique() ]) == 7
+
+# =============================================================================
+#
@@ -0,0 +1,119 @@
+# =============================================================================
+# `SapysolClaimLookupTable` send/resend logic against a fake chain: sends that
+# timed out but landed are not repeated, failures and retries are bounded.
+#
+from   types                                  import SimpleNamespace
+from   solders.keypair                        import Keypair
+from   solders.pubkey                         import Pubkey
+from   solders.transaction_status             import TransactionErrorInstructionError, InstructionErrorFieldless
+from   sapysol                                import SapysolTxStatus
+from   sapysol_jupiter_launchpad              import lookup_table
+from   sapysol_jupiter_launchpad.fee_oracle   import SapysolStaticFeeOracle
+from   sapysol_jupiter_launchpad.retry_policy import SapysolClaimRetryPolicy, SapysolBackoff
+import pytest
+
+ACTIVE: int = lookup_table.LOOKUP_TABLE_ACTIVE_SLOT
+
+# =============================================================================
+# One table whose state changes when a transaction "lands". `outcomes` is the
+# status of every send: SUCCESS and TIMEOUT land, PENDING and FAIL do not.
+#
+class FakeChain:
+    def __init__(self, outcomes: list, slot: int = 1000):
+        self.OUTCOMES: list = list(outcomes)
+        self.SLOT:     int  = slot
+        self.TABLE          = None
+        self.SENT:     list = []
+
+    def get_slot(self, commitment=None):
+        return SimpleNamespace(value=self.SLOT)
+
+    def Apply(self, instructions) -> None:
+        tag = int.from_bytes(bytes(instructions[-1].data[:4]), "little")
+        if tag == 0:
+            self.TABLE = SimpleNamespace(addresses=[], meta=SimpleNamespace(deactivation_slot=ACTIVE, last_extended_slot=0))
+        elif tag == 2:
+            data = bytes(instructions[-1].data)[12:]
+            self.TABLE.addresses += [ Pubkey.from_bytes(data[i:i+32]) for i in range(0, len(data), 32) ]
+            self.TABLE.meta.last_extended_slot = self.SLOT - 1
+        elif tag == 3:
+            self.TABLE.meta.deactivation_slot = self.SLOT
+        elif tag == 4:
+            self.TABLE = None
+
+@pytest.fixture
+def make(monkeypatch):
+    def Make(outcomes: list, maxAttempts: int = 3):
+        chain = FakeChain(outcomes=outcomes)
+
+        class FakeTx:
+            def __init__(self, connection, payer, txParams):
+                self.CONFIRMED_TX = None
+            def FromInstructionsLegacy(self, instructions):
+                self.INSTRUCTIONS = instructions
+            def Sign(self, signers):
+                return self
+            def WaitForTx(self, connectionOverride=None):
+                status = chain.OUTCOMES.pop(0)
+                chain.SENT.append(int.from_bytes(bytes(self.INSTRUCTIONS[-1].data[:4]), "little"))
+                if status == SapysolTxStatus.FAIL:
+                    self.CONFIRMED_TX = SimpleNamespace(meta=SimpleNamespace(err=TransactionErrorInstructionError(1, InstructionErrorFieldless.InvalidArgument)))
+                elif status != SapysolTxStatus.PENDING:
+                    chain.Apply(self.INSTRUCTIONS)
+                return status
+
+        monkeypatch.setattr(lookup_table, "SapysolTx", FakeTx)
+        monkeypatch.setattr(lookup_table.SapysolClaimLookupTable, "FetchTable", lambda self, address: chain.TABLE)
+        monkeypatch.setattr(lookup_table.time, "sleep", lambda s: None)
+        table = lookup_table.SapysolClaimLookupTable(connection  = chain,
+                                                     authority   = Keypair(),
+                                                     feeOracle   = SapysolStaticFeeOracle(),
+                                                     retryPolicy = SapysolClaimRetryPolicy(transient=SapysolBackoff(baseDelay=0, maxDelay=0, maxAttempts=maxAttempts)))
+        monkeypatch.setattr(table, "Load", lambda address: chain.TABLE)
+        return chain, table
+    return Make
+
+# =============================================================================
+#
+def test_timed_out_sends_are_not_repeated(make):
+    addresses    = [ Pubkey.new_unique() for _ in range(lookup_table.LOOKUP_TABLE_EXTEND_CHUNK + 5) ]
+    chain, table = make(outcomes=[ SapysolTxStatus.TIMEOUT ] * 3)
+    table.Create(addresses=addresses)
+    assert chain.SENT == [ 0, 2, 2 ]
+    assert chain.TABLE.addresses == addresses
+
+def test_unlanded_sends_are_retried_up_to_the_cap(make):
+    chain, table = make(outcomes=[ SapysolTxStatus.PENDING ] * 10, maxAttempts=3)
+    with pytest.raises(ValueError, match="did not land"):
+        table.Create(addresses=[])
+    assert len(chain.SENT) == 4
+
+def test_failed_send_is_not_resent(make):
+    chain, table = make(outcomes=[ SapysolTxStatus.FAIL ] * 10)
+    with pytest.raises(ValueError, match="failed"):
+        table.Create(addresses=[])
+    assert len(chain.SENT) == 1
+
+def test_expired_create_gives_up(make):
+    chain, table = make(outcomes=[ SapysolTxStatus.PENDING ] * 10, maxAttempts=None)
+    original     = chain.get_slot
+    chain.get_slot = lambda commitment=None: SimpleNamespace(value=original().value + (len(chain.SENT) and lookup_table.LOOKUP_TABLE_SLOT_HASHES))
+    with pytest.raises(ValueError, match="expired"):
+        table.Create(addresses=[])
+    assert len(chain.SENT) == 1
+
+def test_deactivate_and_close_are_idempotent(make):
+    chain, table = make(outcomes=[ SapysolTxStatus.SUCCESS, SapysolTxStatus.TIMEOUT, SapysolTxStatus.SUCCESS ])
+    table.Create(addresses=[])
+    address = Pubkey.new_unique()
+    table.Deactivate(address=address)
+    table.Deactivate(address=address) # already deactivated, nothing is sent
+    with pytest.raises(ValueError, match="slots left"):
+        table.Close(address=address)
+    chain.SLOT += lookup_table.LOOKUP_TABLE_COOLDOWN
+    table.Close(address=address)
+    assert chain.SENT == [ 0, 3, 4 ]
+    assert chain.TABLE is None
+
+# =============================================================================
+#
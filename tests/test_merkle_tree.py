@@ -0,0 +1,91 @@
+# =============================================================================
+# `SapysolMerkleTree` and `SapysolMerkleProofFile`.
+#
+from   solders.pubkey                        import Pubkey
+from   sapysol_jupiter_launchpad.merkle      import VerifyClaim
+from   sapysol_jupiter_launchpad.merkle_tree import SapysolMerkleTree, SapysolMerkleProofFile
+import pytest
+
+# =============================================================================
+#
+def MakeAllocations(count: int) -> list:
+    return [ (Pubkey.new_unique(), 100 + i, i % 3) for i in range(count) ]
+
+@pytest.fixture
+def proofFile(tmp_path):
+    allocations = MakeAllocations(5)
+    tree        = SapysolMerkleTree(allocations=allocations)
+    path        = str(tmp_path / "proofs.bin")
+    tree.WriteProofsFile(path=path)
+    return SapysolMerkleProofFile(path=path), tree, allocations
+
+# =============================================================================
+#
+@pytest.mark.parametrize("count", [ 1, 2, 3, 5, 8, 13 ])
+def test_every_proof_verifies_against_root(count):
+    allocations = MakeAllocations(count)
+    tree        = SapysolMerkleTree(allocations=allocations)
+    assert tree.NUM_LEAVES == count
+    assert tree.DEPTH      == (count - 1).bit_length()
+    for claimant, unlocked, locked in allocations:
+        index = tree.GetIndex(claimant=claimant)
+        proof = tree.GetProof(index=index)
+        assert tree.GetClaimant(index=index) == claimant
+        assert tree.GetAmounts(index=index)  == (unlocked, locked)
+        assert len(proof) == tree.DEPTH * 32
+        assert VerifyClaim(root=tree.ROOT, claimant=claimant, amountUnlocked=unlocked, amountLocked=locked, proof=proof)
+        assert not VerifyClaim(root=tree.ROOT, claimant=claimant, amountUnlocked=unlocked + 1, amountLocked=locked, proof=proof)
+
+def test_process_pool_builds_the_same_tree():
+    allocations = MakeAllocations(37)
+    single      = SapysolMerkleTree(allocations=allocations, numProcesses=1)
+    pooled      = SapysolMerkleTree(allocations=allocations, numProcesses=2, chunkSize=4)
+    assert pooled.LEVELS == single.LEVELS
+
+def test_tree_limits_and_args():
+    allocations = MakeAllocations(6)
+    tree        = SapysolMerkleTree(allocations=allocations)
+    args        = tree.GetNewDistributorArgs(version=0, startVestingTs=1, endVestingTs=2, clawbackStartTs=3)
+    assert args["root"]            == list(tree.ROOT)
+    assert args["max_total_claim"] == sum(u + l for _, u, l in allocations)
+    assert args["max_num_nodes"]   == len(allocations)
+    assert tree.GetIndex(claimant=Pubkey.new_unique()) is None
+
+def test_invalid_allocations():
+    with pytest.raises(ValueError):
+        SapysolMerkleTree(allocations=[])
+    claimant = Pubkey.new_unique()
+    with pytest.raises(ValueError, match="duplicate"):
+        SapysolMerkleTree(allocations=[ (claimant, 1, 0), (claimant, 2, 0) ])
+
+# =============================================================================
+#
+def test_proof_file_matches_tree(proofFile):
+    proofs, tree, allocations = proofFile
+    assert (len(proofs), proofs.DEPTH, proofs.ROOT) == (tree.NUM_LEAVES, tree.DEPTH, tree.ROOT)
+    for claimant, unlocked, locked in allocations:
+        index = proofs.GetIndex(claimant=claimant)
+        assert index == tree.GetIndex(claimant=claimant)
+        assert proofs.GetRecord(index=index) == (claimant, unlocked, locked, tree.GetProof(index=index))
+    assert proofs.GetIndex(claimant=Pubkey.new_unique()) is None
+    assert proofs.GetClaimantRecord(claimant=Pubkey.new_unique()) is None
+    with pytest.raises(IndexError):
+        proofs.GetRecord(index=len(proofs))
+    proofs.Close()
+
+def test_proof_file_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(bytes(128))
+    with pytest.raises(ValueError, match="not a proof file"):
+        SapysolMerkleProofFile(path=str(path))
+
+def test_records_outlive_close(proofFile):
+    proofs, tree, allocations = proofFile
+    records = [ proofs.GetClaimantRecord(claimant=c) for c, _, _ in allocations ]
+    proofs.Close() # used to raise `BufferError` while records were referenced
+    for (claimant, unlocked, locked), record in zip(allocations, records):
+        assert record == (claimant, unlocked, locked, tree.GetProof(tree.GetIndex(claimant)))
+        assert isinstance(record[3], bytes)
+
+# =============================================================================
+#
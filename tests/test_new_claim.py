@@ -0,0 +1,69 @@
+# =============================================================================
+# Precompiled `new_claim` encoder against the borsh construct path.
+#
+from   solders.pubkey import Pubkey
+import importlib
+import hashlib
+import random
+import pytest
+
+# `instructions.new_claim` is shadowed by the function of the same name
+MODULES = [ importlib.import_module(f"sapysol_jupiter_launchpad.anchorpy_{v}.instructions.new_claim") for v in ("v1", "v2") ]
+DEPTHS  = [ 0, 1, 24 ] # empty, single-node and deep proofs
+AMOUNTS = [ (0, 0), (1, 2), (2**64 - 1, 2**64 - 1) ]
+
+# =============================================================================
+#
+def RandomProof(depth: int, rnd: random.Random) -> bytes:
+    return rnd.randbytes(32 * depth)
+
+def ProofAsLists(proof: bytes) -> list:
+    return [ list(proof[i:i+32]) for i in range(0, len(proof), 32) ]
+
+def MakeAccounts() -> dict:
+    return { "distributor": Pubkey.new_unique(), "claim_status": Pubkey.new_unique(), "from_": Pubkey.new_unique(),
+             "to":          Pubkey.new_unique(), "claimant":     Pubkey.new_unique() }
+
+# =============================================================================
+#
+@pytest.mark.parametrize("module", MODULES, ids=["v1", "v2"])
+def test_identifier_is_anchor_discriminator(module):
+    assert module.NEW_CLAIM_IDENTIFIER == hashlib.sha256(b"global:new_claim").digest()[:8]
+
+@pytest.mark.parametrize("module",  MODULES, ids=["v1", "v2"])
+@pytest.mark.parametrize("depth",   DEPTHS)
+@pytest.mark.parametrize("amounts", AMOUNTS)
+def test_encode_matches_construct(module, depth, amounts):
+    proof    = RandomProof(depth, random.Random(depth))
+    expected = module.NEW_CLAIM_IDENTIFIER + module.layout.build({ "amount_unlocked": amounts[0],
+                                                                    "amount_locked":   amounts[1],
+                                                                    "proof":           ProofAsLists(proof) })
+    for compact in (proof, bytearray(proof), memoryview(proof)):
+        assert module.encode_new_claim_data(amount_unlocked=amounts[0], amount_locked=amounts[1], proof=compact) == expected
+
+@pytest.mark.parametrize("module", MODULES, ids=["v1", "v2"])
+@pytest.mark.parametrize("depth",  DEPTHS)
+def test_instruction_paths_match(module, depth):
+    proof      = RandomProof(depth, random.Random(depth))
+    accounts   = MakeAccounts()
+    args       = { "amount_unlocked": 123, "amount_locked": 456 }
+    viaLists   = module.new_claim(args={ **args, "proof": ProofAsLists(proof) }, accounts=accounts)
+    viaBytes   = module.new_claim(args={ **args, "proof": proof },               accounts=accounts)
+    encoder    = module.NewClaimEncoder(distributor=accounts["distributor"], from_=accounts["from_"])
+    viaEncoder = encoder.build(claim_status    = accounts["claim_status"],
+                               to              = accounts["to"],
+                               claimant        = accounts["claimant"],
+                               amount_unlocked = args["amount_unlocked"],
+                               amount_locked   = args["amount_locked"],
+                               proof           = proof)
+    assert viaBytes   == viaLists
+    assert viaEncoder == viaLists
+    assert viaLists.program_id == module.PROGRAM_ID
+
+@pytest.mark.parametrize("module", MODULES, ids=["v1", "v2"])
+def test_rejects_partial_node(module):
+    with pytest.raises(ValueError):
+        module.encode_new_claim_data(amount_unlocked=1, amount_locked=0, proof=bytes(33))
+
+# =============================================================================
+#
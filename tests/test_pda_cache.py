@@ -0,0 +1,68 @@
+# =============================================================================
+# `SapysolPdaCache`: LRU bound, bulk derivation and the on-disk round trip.
+#
+from   solders.pubkey                      import Pubkey
+from   sapysol_jupiter_launchpad.pda_cache import SapysolPdaCache
+import pytest
+
+PROGRAM:     Pubkey = Pubkey.new_unique()
+DISTRIBUTOR: Pubkey = Pubkey.new_unique()
+
+# =============================================================================
+#
+def Derive(wallet: Pubkey) -> Pubkey:
+    return Pubkey.find_program_address(seeds=[ b"ClaimStatus", bytes(wallet), bytes(DISTRIBUTOR) ], program_id=PROGRAM)[0]
+
+@pytest.fixture
+def wallets():
+    return [ Pubkey.new_unique() for _ in range(9) ]
+
+# =============================================================================
+#
+def test_least_recently_used_entries_are_evicted():
+    cache = SapysolPdaCache(maxSize=2)
+    keys  = [ (PROGRAM, Pubkey.new_unique(), DISTRIBUTOR) for _ in range(3) ]
+    cache.Put(key=keys[0], pda=Pubkey.new_unique())
+    cache.Put(key=keys[1], pda=Pubkey.new_unique())
+    cache.Get(key=keys[0]) # keys[1] is the oldest now
+    cache.Put(key=keys[2], pda=Pubkey.new_unique())
+    assert len(cache) == 2
+    assert cache.Get(key=keys[1]) is None
+    assert cache.Get(key=keys[0]) is not None
+
+@pytest.mark.parametrize("numProcesses, chunkSize", [ (1, 2000), (2, 2) ])
+def test_batch_derivation(wallets, numProcesses, chunkSize):
+    cache = SapysolPdaCache()
+    cache.Put(key=(PROGRAM, wallets[0], DISTRIBUTOR), pda=Derive(wallets[0]))
+    pdas  = cache.DeriveClaimStatusBatch(programId=PROGRAM, walletAddresses=wallets, distributorAddress=DISTRIBUTOR, numProcesses=numProcesses, chunkSize=chunkSize)
+    assert pdas == [ Derive(wallet) for wallet in wallets ]
+    assert len(cache) == len(wallets)
+
+def test_save_and_load_round_trip(wallets, tmp_path):
+    path  = str(tmp_path / "pda.bin")
+    cache = SapysolPdaCache()
+    pdas  = cache.DeriveClaimStatusBatch(programId=PROGRAM, walletAddresses=wallets, distributorAddress=DISTRIBUTOR)
+    cache.Save(path=path)
+    assert (tmp_path / "pda.bin").stat().st_size == 128 * len(wallets)
+
+    loaded = SapysolPdaCache()
+    loaded.Load(path=path)
+    assert len(loaded) == len(wallets)
+    assert [ loaded.Get(key=(PROGRAM, wallet, DISTRIBUTOR)) for wallet in wallets ] == pdas
+    assert loaded.GetOrDerive(key=(PROGRAM, wallets[0], DISTRIBUTOR), derive=lambda: pytest.fail("derived again")) == pdas[0]
+
+def test_load_ignores_missing_file_and_partial_record(wallets, tmp_path):
+    cache = SapysolPdaCache()
+    cache.Load(path=str(tmp_path / "missing.bin"))
+    assert len(cache) == 0
+
+    path = tmp_path / "pda.bin"
+    cache.DeriveClaimStatusBatch(programId=PROGRAM, walletAddresses=wallets[:2], distributorAddress=DISTRIBUTOR)
+    cache.Save(path=str(path))
+    path.write_bytes(path.read_bytes() + bytes(50)) # interrupted write
+    loaded = SapysolPdaCache()
+    loaded.Load(path=str(path))
+    assert len(loaded) == 2
+
+# =============================================================================
+#
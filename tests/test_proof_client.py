@@ -0,0 +1,55 @@
+# =============================================================================
+# `SapysolLfgProofClient` against a local stand-in for the proof worker:
+# same status handling as the async client.
+#
+from   solders.pubkey                                import Pubkey
+from   sapysol_jupiter_launchpad.proof_client        import SapysolLfgProofClient
+from   sapysol_jupiter_launchpad.proof_cache         import NO_DISTRIBUTION_CACHE
+from   sapysol_jupiter_launchpad.distributor_batcher import SapysolLfgProofParams
+import requests
+import pytest
+import json
+
+TOKEN_MINT: Pubkey = Pubkey.new_unique()
+PROOF:      dict   = { "merkle_tree": str(Pubkey.new_unique()), "amount": 1000, "proof": [ [1] * 32 ] }
+
+# =============================================================================
+#
+@pytest.mark.parametrize("status, body, expected", [
+    (200, json.dumps(PROOF).encode(), PROOF),
+    (200, b"",                        None ),
+    (404, b"",                        None ),
+    (404, b'{"error": "not found"}',  None ),
+])
+def test_fetch_proof(serve, status, body, expected):
+    worker = serve(respond=lambda method, path, _: (status, body))
+    client = SapysolLfgProofClient(numConnections=1, baseUrl=worker.URL)
+    assert client.FetchProof(tokenMint=TOKEN_MINT, walletAddress=Pubkey.new_unique()) == expected
+    client.Close()
+
+@pytest.mark.parametrize("status, body", [
+    (429, b'{"error": "rate limited"}'),
+    (500, b'{"error": "internal"}'    ),
+    (500, b""                         ),
+    (503, b""                         ),
+])
+def test_fetch_proof_raises_http_errors(serve, status, body):
+    worker = serve(respond=lambda method, path, _: (status, body))
+    client = SapysolLfgProofClient(numConnections=1, baseUrl=worker.URL)
+    with pytest.raises(requests.HTTPError):
+        client.FetchProof(tokenMint=TOKEN_MINT, walletAddress=Pubkey.new_unique())
+    client.Close()
+
+def test_no_distribution_is_cached_in_process(serve):
+    NO_DISTRIBUTION_CACHE.Clear()
+    worker = serve(respond=lambda method, path, _: (404, b""))
+    client = SapysolLfgProofClient(numConnections=1, baseUrl=worker.URL)
+    wallet = Pubkey.new_unique()
+    for _ in range(3):
+        assert not SapysolLfgProofParams(tokenMint=TOKEN_MINT, walletAddress=wallet, proofClient=client).IsValid()
+    assert len(worker.REQUESTS) == 1
+    NO_DISTRIBUTION_CACHE.Clear()
+    client.Close()
+
+# =============================================================================
+#
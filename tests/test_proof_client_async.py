@@ -0,0 +1,93 @@
+# =============================================================================
+# `SapysolLfgProofFetcherAsync` against a local stand-in for the proof worker.
+#
+from   solders.pubkey                               import Pubkey
+from   sapysol_jupiter_launchpad.proof_client_async import SapysolLfgProofClientAsync, SapysolLfgProofFetcherAsync
+from   sapysol_jupiter_launchpad.proof_cache        import SapysolLfgProofCache, NO_DISTRIBUTION_CACHE
+import asyncio
+import pytest
+import json
+
+TOKEN_MINT:  Pubkey = Pubkey.new_unique()
+DISTRIBUTOR: Pubkey = Pubkey.new_unique()
+
+# =============================================================================
+#
+def MakeProof(walletIndex: int) -> dict:
+    return { "merkle_tree": str(DISTRIBUTOR), "amount": 1000 + walletIndex, "proof": [ [walletIndex] * 32, [7] * 32 ] }
+
+@pytest.fixture(autouse=True)
+def noDistributionCache():
+    NO_DISTRIBUTION_CACHE.Clear()
+    yield NO_DISTRIBUTION_CACHE
+    NO_DISTRIBUTION_CACHE.Clear()
+
+@pytest.fixture
+def wallets():
+    return [ Pubkey.new_unique() for _ in range(12) ]
+
+@pytest.fixture
+def worker(wallets, serve):
+    # Even wallets have a distribution, odd ones get 404. The first wallet is
+    # the slowest one, so it must not be the first result.
+    proofs = { str(w): json.dumps(MakeProof(i)).encode() for i, w in enumerate(wallets) if i % 2 == 0 }
+    def Respond(method: str, path: str, body: bytes):
+        wallet = path.rstrip("/").split("/")[-1]
+        return (200, proofs[wallet]) if wallet in proofs else (404, b"")
+    return serve(respond=Respond, delay=lambda path: 0.5 if path.endswith(str(wallets[0])) else 0.01)
+
+def MakeFetcher(worker, maxInFlight: int, proofCache: SapysolLfgProofCache = None) -> SapysolLfgProofFetcherAsync:
+    client = SapysolLfgProofClientAsync(maxInFlight=maxInFlight, baseUrl=f"{worker.URL}/jup-claim-proof")
+    return SapysolLfgProofFetcherAsync(tokenMint=TOKEN_MINT, proofClient=client, maxInFlight=maxInFlight, proofCache=proofCache)
+
+# =============================================================================
+#
+def test_fetch_all_parses_proofs_and_404s(worker, wallets):
+    result = MakeFetcher(worker=worker, maxInFlight=4).FetchAll(walletsList=wallets)
+    assert set(result) == set(wallets)
+    for i, wallet in enumerate(wallets):
+        params = result[wallet]
+        if i % 2:
+            assert not params.IsValid()
+            continue
+        assert params.DISTRIBUTOR_PUBKEY == DISTRIBUTOR
+        assert params.AMOUNT             == 1000 + i
+        assert params.PROOF              == bytes([i] * 32 + [7] * 32)
+
+def test_in_flight_limit(worker, wallets):
+    MakeFetcher(worker=worker, maxInFlight=3).FetchAll(walletsList=wallets)
+    assert len(worker.REQUESTS) == len(wallets)
+    assert 1 < worker.PEAK <= 3
+
+def test_results_are_yielded_as_they_complete(worker, wallets):
+    async def Collect(fetcher: SapysolLfgProofFetcherAsync) -> list:
+        return [ walletAddress async for walletAddress, _ in fetcher.FetchIter(walletsList=wallets) ]
+
+    order = asyncio.run(Collect(MakeFetcher(worker=worker, maxInFlight=4)))
+    assert sorted(order) == sorted(wallets)
+    assert order[0]      != wallets[0]
+    assert order[-1]     == wallets[0]
+
+def test_cache_serves_second_run_without_http(worker, wallets, tmp_path):
+    cache = SapysolLfgProofCache(path=str(tmp_path / "proofs.sqlite3"))
+    first = MakeFetcher(worker=worker, maxInFlight=4, proofCache=cache).FetchAll(walletsList=wallets)
+    assert len(worker.REQUESTS) == len(wallets)
+
+    second = MakeFetcher(worker=worker, maxInFlight=4, proofCache=cache).FetchAll(walletsList=wallets)
+    assert len(worker.REQUESTS) == len(wallets)
+    for wallet in wallets:
+        assert bool(second[wallet].IsValid()) == bool(first[wallet].IsValid())
+        assert second[wallet].PROOF           == first[wallet].PROOF
+    cache.Close()
+
+def test_no_distribution_is_shared_without_cache(worker, wallets):
+    MakeFetcher(worker=worker, maxInFlight=4).FetchAll(walletsList=wallets)
+    assert len(worker.REQUESTS) == len(wallets)
+
+    # Another fetcher in the same process skips the 404 wallets
+    second = MakeFetcher(worker=worker, maxInFlight=4).FetchAll(walletsList=wallets)
+    assert len(worker.REQUESTS) == len(wallets) + len(wallets) // 2
+    assert not any(second[w].IsValid() for w in wallets[1::2])
+
+# =============================================================================
+#
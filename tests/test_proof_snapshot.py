@@ -0,0 +1,85 @@
+# =============================================================================
+# `SapysolLfgProofSnapshot` parses every supported format into the same index,
+# the streaming JSON parser is exercised with chunks smaller than one record.
+#
+from   solders.pubkey                           import Pubkey
+from   sapysol_jupiter_launchpad.proof_snapshot import SapysolLfgProofSnapshot
+import pytest
+import json
+import csv
+
+DISTRIBUTOR: Pubkey = Pubkey.new_unique()
+
+# =============================================================================
+#
+@pytest.fixture
+def records():
+    return [ { "wallet": str(Pubkey.new_unique()), "merkle_tree": str(DISTRIBUTOR), "amount": 1000 + i, "proof": [ [i] * 32, [255 - i] * 32 ] } for i in range(5) ]
+
+def WriteJson(path, records: list) -> None:
+    path.write_text(json.dumps(records, indent=2))
+
+def WriteJsonObject(path, records: list) -> None:
+    path.write_text(json.dumps({ r["wallet"]: { k: v for k, v in r.items() if k != "wallet" } for r in records }))
+
+def WriteJsonl(path, records: list) -> None:
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n\n")
+
+def WriteCsv(path, records: list) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[ "wallet", "merkle_tree", "amount", "proof" ])
+        writer.writeheader()
+        for i, r in enumerate(records):
+            proof = b"".join(bytes(node) for node in r["proof"])
+            # Both proof encodings in one file
+            writer.writerow({ **r, "proof": json.dumps(r["proof"]) if i % 2 else "0x" + proof.hex() })
+
+# =============================================================================
+#
+@pytest.mark.parametrize("name, write", [
+    ("snapshot.json",   WriteJson      ),
+    ("object.json",     WriteJsonObject),
+    ("snapshot.jsonl",  WriteJsonl     ),
+    ("snapshot.csv",    WriteCsv       ),
+])
+@pytest.mark.parametrize("chunkSize", [ 7, 1 << 20 ])
+def test_formats_parse_to_the_same_index(tmp_path, records, name, write, chunkSize):
+    path = tmp_path / name
+    write(path, records)
+    snapshot = SapysolLfgProofSnapshot(path=str(path), chunkSize=chunkSize)
+    assert len(snapshot) == len(records)
+    for r in records:
+        assert r["wallet"] in snapshot
+        assert snapshot.Get(walletAddress=r["wallet"]) == { "merkle_tree": r["merkle_tree"],
+                                                            "amount":      r["amount"],
+                                                            "proof":       b"".join(bytes(node) for node in r["proof"]) }
+    assert snapshot.Get(walletAddress=Pubkey.new_unique()) is None
+
+def test_explicit_format_overrides_extension(tmp_path, records):
+    path = tmp_path / "snapshot.txt"
+    WriteJsonl(path, records)
+    assert len(SapysolLfgProofSnapshot(path=str(path), fileFormat="jsonl")) == len(records)
+
+def test_empty_json_array(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text(" [ ] ")
+    assert len(SapysolLfgProofSnapshot(path=str(path))) == 0
+
+@pytest.mark.parametrize("content, error", [
+    ('"not a container"',                                       "array or an object"),
+    ('[{"wallet": "%s", "merkle_tree": "%s", "amount": 1, "proof": [[1, 2]]}]' % (Pubkey.new_unique(), DISTRIBUTOR), "multiple of 32"),
+])
+def test_invalid_snapshots(tmp_path, content, error):
+    path = tmp_path / "snapshot.json"
+    path.write_text(content)
+    with pytest.raises(ValueError, match=error):
+        SapysolLfgProofSnapshot(path=str(path))
+
+def test_truncated_json_is_rejected(tmp_path, records):
+    path = tmp_path / "snapshot.json"
+    path.write_text(json.dumps(records)[:-40])
+    with pytest.raises(json.JSONDecodeError):
+        SapysolLfgProofSnapshot(path=str(path), chunkSize=16)
+
+# =============================================================================
+#
@@ -0,0 +1,93 @@
+# =============================================================================
+# `SapysolClaimRetryPolicy` classification of confirmed and preflight errors,
+# `SapysolBackoff` delays and caps.
+#
+from   types                                               import SimpleNamespace
+from   solders.pubkey                                      import Pubkey
+from   solders.instruction                                 import Instruction
+from   solders.rpc.errors                                  import SendTransactionPreflightFailureMessage
+from   solders.rpc.responses                               import RpcSimulateTransactionResult
+from   solders.transaction_status                          import TransactionErrorInstructionError, InstructionErrorCustom, InstructionErrorFieldless
+from   solana.rpc.core                                     import RPCException
+from   sapysol                                             import SapysolTxStatus
+from   sapysol_jupiter_launchpad.retry_policy              import SapysolClaimRetryPolicy, SapysolClaimOutcome, SapysolBackoff
+from   sapysol_jupiter_launchpad.anchorpy_v2.errors.custom import InvalidProof, ClaimExpired, ClaimingIsNotStarted, Unauthorized
+import pytest
+
+PROGRAM_ID:   Pubkey = Pubkey.new_unique()
+INSTRUCTIONS: list   = [ Instruction(Pubkey.new_unique(), b"", []), Instruction(PROGRAM_ID, b"", []) ] # compute budget, claim
+
+def CustomError(code: int, index: int = 1) -> TransactionErrorInstructionError:
+    return TransactionErrorInstructionError(index, InstructionErrorCustom(code))
+
+def FailedTx(txError) -> SimpleNamespace:
+    return SimpleNamespace(CONFIRMED_TX=SimpleNamespace(meta=SimpleNamespace(err=txError)))
+
+def PreflightError(txError) -> RPCException:
+    return RPCException(SendTransactionPreflightFailureMessage("Transaction simulation failed", RpcSimulateTransactionResult(err=txError)))
+
+# =============================================================================
+#
+@pytest.mark.parametrize("txError, outcome, error", [
+    (CustomError(InvalidProof.code),                      SapysolClaimOutcome.FATAL,       InvalidProof        ),
+    (CustomError(ClaimExpired.code),                      SapysolClaimOutcome.FATAL,       ClaimExpired        ),
+    (CustomError(0),                                      SapysolClaimOutcome.FATAL,       str                 ), # already claimed
+    (CustomError(ClaimingIsNotStarted.code),              SapysolClaimOutcome.RETRY_LATER, ClaimingIsNotStarted),
+    (CustomError(Unauthorized.code),                      SapysolClaimOutcome.TRANSIENT,   Unauthorized        ), # unknown to the policy
+    (CustomError(InvalidProof.code, index=0),             SapysolClaimOutcome.TRANSIENT,   str                 ), # other program
+    (CustomError(InvalidProof.code, index=5),             SapysolClaimOutcome.TRANSIENT,   str                 ), # out of range
+    (CustomError(123_456),                                SapysolClaimOutcome.TRANSIENT,   str                 ), # not a program error
+    (TransactionErrorInstructionError(1, InstructionErrorFieldless.ComputationalBudgetExceeded), SapysolClaimOutcome.TRANSIENT, str),
+])
+def test_classify_tx_error(txError, outcome, error):
+    policy = SapysolClaimRetryPolicy()
+    result, reason = SapysolClaimRetryPolicy.ClassifyTxError(txError=txError, instructions=INSTRUCTIONS, programId=PROGRAM_ID)
+    assert (result, type(reason)) == (outcome, error)
+    # Same answer for a confirmed failure and a preflight failure
+    assert policy.ClassifyTx(tx=FailedTx(txError), status=SapysolTxStatus.FAIL, instructions=INSTRUCTIONS, programId=PROGRAM_ID)[0] == outcome
+    assert policy.ClassifyException(error=PreflightError(txError), instructions=INSTRUCTIONS, programId=PROGRAM_ID)[0]          == outcome
+
+@pytest.mark.parametrize("status, tx, outcome", [
+    (SapysolTxStatus.SUCCESS, FailedTx(None),                                           SapysolClaimOutcome.SUCCESS  ),
+    (SapysolTxStatus.TIMEOUT, SimpleNamespace(CONFIRMED_TX=None),                        SapysolClaimOutcome.TRANSIENT),
+    (SapysolTxStatus.FAIL,    SimpleNamespace(CONFIRMED_TX=None),                        SapysolClaimOutcome.TRANSIENT),
+    (SapysolTxStatus.PENDING, FailedTx(CustomError(InvalidProof.code)),                  SapysolClaimOutcome.TRANSIENT),
+])
+def test_classify_tx_status(status, tx, outcome):
+    assert SapysolClaimRetryPolicy().ClassifyTx(tx=tx, status=status, instructions=INSTRUCTIONS, programId=PROGRAM_ID)[0] == outcome
+
+def test_rpc_errors_without_simulation_are_transient():
+    outcome, reason = SapysolClaimRetryPolicy().ClassifyException(error=RPCException("Node is behind"), instructions=INSTRUCTIONS, programId=PROGRAM_ID)
+    assert outcome == SapysolClaimOutcome.TRANSIENT
+    assert "Node is behind" in reason
+
+def test_failed_instruction_and_tx_error():
+    txError = CustomError(InvalidProof.code, index=3)
+    assert SapysolClaimRetryPolicy.GetFailedInstruction(txError=txError) == 3
+    assert SapysolClaimRetryPolicy.GetFailedInstruction(txError=None) is None
+    assert SapysolClaimRetryPolicy.GetTxError(tx=FailedTx(txError))                                  == txError
+    assert SapysolClaimRetryPolicy.GetTxError(tx=None, error=PreflightError(txError))                == txError
+    assert SapysolClaimRetryPolicy.GetTxError(tx=SimpleNamespace(CONFIRMED_TX=None)) is None
+    assert SapysolClaimRetryPolicy.GetTxError(tx=None, error=RPCException("Node is behind")) is None
+
+# =============================================================================
+#
+def test_backoff_doubles_up_to_max_delay():
+    backoff = SapysolBackoff(baseDelay=0.5, maxDelay=4.0, maxAttempts=None, jitter=0)
+    assert [ backoff.GetDelay(attempt=a) for a in range(6) ] == [ 0.5, 1.0, 2.0, 4.0, 4.0, 4.0 ]
+    assert not backoff.IsExhausted(attempt=10**6)
+
+def test_backoff_jitter_and_cap():
+    backoff = SapysolBackoff(baseDelay=1.0, maxDelay=8.0, maxAttempts=3, jitter=0.2)
+    for attempt in range(10):
+        assert min(8.0, 2**attempt) <= backoff.GetDelay(attempt=attempt) <= min(8.0, 2**attempt) * 1.2
+    assert [ backoff.IsExhausted(attempt=a) for a in range(5) ] == [ False, False, False, True, True ]
+
+def test_policy_backoff_per_outcome():
+    transient, retryLater = SapysolBackoff(0, 0, 1), SapysolBackoff(0, 0, 2)
+    policy = SapysolClaimRetryPolicy(transient=transient, retryLater=retryLater)
+    assert policy.GetBackoff(outcome=SapysolClaimOutcome.TRANSIENT)   is transient
+    assert policy.GetBackoff(outcome=SapysolClaimOutcome.RETRY_LATER) is retryLater
+
+# =============================================================================
+#
@@ -0,0 +1,61 @@
+# =============================================================================
+# `SapysolMerkleShardPlanner` / `SapysolMerkleShardIndex`: balanced shards,
+# index round trip and proofs that verify against their shard roots.
+#
+from   solders.pubkey                                import Pubkey
+from   sapysol_jupiter_launchpad.sharding            import SapysolMerkleShardPlanner, SapysolMerkleShardIndex
+from   sapysol_jupiter_launchpad.merkle              import VerifyClaim
+from   sapysol_jupiter_launchpad.distributor_batcher import SapysolLfgProofParams
+import pytest
+
+TOKEN_MINT: Pubkey = Pubkey.new_unique()
+BASE:       Pubkey = Pubkey.new_unique()
+
+# =============================================================================
+#
+@pytest.fixture
+def allocations():
+    return [ (Pubkey.new_unique(), 1000 * (i + 1), 7 * i) for i in range(11) ]
+
+@pytest.fixture
+def shards(allocations, tmp_path):
+    planner = SapysolMerkleShardPlanner(allocations=allocations, numShards=3, tokenMint=TOKEN_MINT, baseAddress=BASE, numProcesses=1)
+    planner.WriteShards(directory=str(tmp_path))
+    return planner, SapysolMerkleShardIndex(directory=str(tmp_path))
+
+# =============================================================================
+#
+def test_shards_are_balanced(shards, allocations):
+    planner, _ = shards
+    sizes = sorted(tree.NUM_LEAVES for tree in planner.SHARDS)
+    assert sum(sizes) == len(allocations)
+    assert sizes[-1] - sizes[0] <= 1
+    totals = [ tree.MAX_TOTAL_CLAIM for tree in planner.SHARDS ]
+    assert max(totals) - min(totals) <= max(u + l for _, u, l in allocations)
+    assert len(set(planner.DISTRIBUTORS)) == 3
+
+def test_zero_amounts_spread_over_shards():
+    planner = SapysolMerkleShardPlanner(allocations=[ (Pubkey.new_unique(), 0, 0) for _ in range(4) ], numShards=3, tokenMint=TOKEN_MINT, baseAddress=BASE)
+    assert sorted(tree.NUM_LEAVES for tree in planner.SHARDS) == [ 1, 1, 2 ]
+
+def test_too_many_shards():
+    with pytest.raises(ValueError):
+        SapysolMerkleShardPlanner(allocations=[ (Pubkey.new_unique(), 1, 0) ], numShards=2, tokenMint=TOKEN_MINT, baseAddress=BASE)
+
+def test_index_returns_verifiable_records_with_locked_amounts(shards, allocations):
+    planner, index = shards
+    assert len(index) == len(allocations)
+    for claimant, unlocked, locked in allocations:
+        shard    = index.GetShard(walletAddress=claimant)
+        response = index.Get(walletAddress=claimant)
+        assert response["merkle_tree"]   == str(planner.DISTRIBUTORS[shard])
+        assert response["amount"]        == unlocked
+        assert response["amount_locked"] == locked
+        assert VerifyClaim(root=planner.SHARDS[shard].ROOT, claimant=claimant, amountUnlocked=unlocked, amountLocked=locked, proof=response["proof"])
+
+        params = SapysolLfgProofParams(tokenMint=TOKEN_MINT, walletAddress=claimant, proofSnapshot=index)
+        assert (params.AMOUNT, params.AMOUNT_LOCKED) == (unlocked, locked)
+    assert index.Get(walletAddress=Pubkey.new_unique()) is None
+
+# =============================================================================
+#